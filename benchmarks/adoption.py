@@ -0,0 +1,44 @@
+"""
+Compares building a :py:class:`musixmatch.track.TracksCollection` by copying
+the decoded dictionaries of a :py:class:`musixmatch.api.JsonResponseMessage`,
+with adopting those of a :py:class:`musixmatch.api.LazyJsonResponseMessage`.
+It reports the time taken, the dictionaries alive once the collection is
+built, as tracked by the garbage collector, while the message is still
+referenced, and the peak memory::
+
+   prompt $ python -m benchmarks.adoption 1000
+"""
+import sys
+import gc
+from musixmatch import api, track
+from benchmarks.formats import json_message, measure
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from StringIO import StringIO
+
+def build(MessageClass, raw):
+    message = MessageClass(StringIO(raw))
+    collection = track.TracksCollection.fromResponseMessage(message)
+    gc.collect()
+    dictionaries = sum(1 for o in gc.get_objects() if isinstance(o, dict))
+    return message, collection, dictionaries
+
+def main(tracks=1000):
+    raw = json_message(tracks)
+    baseline = sum(1 for o in gc.get_objects() if isinstance(o, dict))
+    print '%-10s %10s %14s %14s' % ('mode', 'time (s)', 'dictionaries',
+        'peak (KiB)')
+    idle, idle_peak = measure(lambda response: None, '/dev/null')
+    for mode, MessageClass in [
+            ('copy', api.JsonResponseMessage),
+            ('adopt', api.LazyJsonResponseMessage)]:
+        message, collection, dictionaries = build(MessageClass, raw)
+        del message, collection
+        seconds, peak = measure(lambda response: build(MessageClass, raw),
+            '/dev/null')
+        print '%-10s %10.3f %14i %14i' % (mode, seconds,
+            dictionaries - baseline, peak - idle_peak)
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,54 @@
+"""
+Compares fetching the chart pages of many countries one at a time, through
+:py:meth:`musixmatch.track.TracksCollection.fromChart`, with fetching them
+concurrently, through
+:py:meth:`musixmatch.track.TracksCollection.fromCharts`, against a local stub
+server answering after **latency** milliseconds::
+
+   prompt $ python -m benchmarks.charts 30 2 100
+"""
+import sys
+import time
+import json
+import re
+from musixmatch import ws, track
+from tests.server import Server
+from benchmarks.formats import track_dictionary
+
+def responder(latency):
+    def respond(path):
+        time.sleep(latency / 1000.0)
+        page = int(re.search(r'[?&]page=(\d+)', path).group(1))
+        return json.dumps({ 'message': {
+            'header': { 'status_code': 200 },
+            'body': { 'track_list': [ { 'track': track_dictionary(i) }
+                for i in xrange((page - 1) * 100, page * 100) ] } } })
+    return respond
+
+def sequential(countries, pages):
+    for country in countries:
+        for page in range(1, pages + 1):
+            track.TracksCollection.fromChart(apikey='apikey',
+                country=country, page=page, page_size=100)
+
+def concurrent(countries, pages):
+    track.TracksCollection.fromCharts(countries, pages=pages, concurrency=16,
+        apikey='apikey')
+
+def main(countries=30, pages=2, latency=100):
+    countries = [ 'c%i' % i for i in range(countries) ]
+    location = ws.location
+    print '%-12s %10s' % ('mode', 'time (s)')
+    try:
+        with Server(responder(latency)) as server:
+            ws.location = server.location
+            for mode, run in [('sequential', sequential),
+                    ('concurrent', concurrent)]:
+                start = time.time()
+                run(countries, pages)
+                print '%-12s %10.3f' % (mode, time.time() - start)
+    finally:
+        ws.location = location
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,85 @@
+"""
+Compares building a :py:class:`musixmatch.track.TracksCollection` from Json
+and XML response messages, either parsed whole or streamed, reporting the
+time taken and the peak memory of each run::
+
+   prompt $ python -m benchmarks.formats 5000
+"""
+import sys
+import os
+import time
+import json
+import tempfile
+from musixmatch import api, track
+
+def track_dictionary(i):
+    return { 'track_id': i, 'track_name': 'track_%i' % i,
+        'artist_id': i % 100, 'artist_name': 'artist_%i' % (i % 100),
+        'album_name': 'album_%i' % (i % 1000), 'track_rating': 50,
+        'lyrics_id': i, 'has_lyrics': 1, 'subtitle_id': 0 }
+
+def json_message(tracks):
+    return json.dumps({ 'message': {
+        'header': { 'status_code': 200, 'execute_time': 0.001 },
+        'body': { 'track_list': [ { 'track': track_dictionary(i) }
+            for i in xrange(tracks) ] } } })
+
+def xml_message(tracks):
+    return '<message><header><status_code>200</status_code></header>' \
+        '<body><track_list>%s</track_list></body></message>' % ''.join([
+            '<track>%s</track>' % ''.join([ '<%s>%s</%s>' % (k, v, k)
+                for k, v in track_dictionary(i).items() ])
+            for i in xrange(tracks) ])
+
+def whole(MessageClass):
+    def run(response):
+        return len(track.TracksCollection.fromResponseMessage(
+            MessageClass(response)))
+    return run
+
+def streamed(StreamClass):
+    def run(response):
+        allowed = track.TracksCollection.allowedin()
+        stream = StreamClass(response)
+        count = 0
+        for item in stream.iterate('body', 'track_list'):
+            allowed.fromDictionary(item['track'])
+            count += 1
+        return count
+    return run
+
+def measure(run, path):
+    """Runs **run** in a child process, returns (seconds, peak KiB)."""
+    pid = os.fork()
+    if not pid:
+        with open(path, 'rb') as response:
+            run(response)
+        os._exit(0)
+    start = time.time()
+    pid, status, usage = os.wait4(pid, 0)
+    return time.time() - start, usage.ru_maxrss
+
+def main(tracks=5000):
+    paths = {}
+    for format, message in [('json', json_message), ('xml', xml_message)]:
+        descriptor, paths[format] = tempfile.mkstemp()
+        with os.fdopen(descriptor, 'wb') as output:
+            output.write(message(tracks))
+    try:
+        idle, baseline = measure(lambda response: None, paths['json'])
+        print '%-12s %10s %10s %14s' % ('format', 'mode', 'time (s)',
+            'peak (KiB)')
+        for format, mode, run in [
+                ('json', 'whole', whole(api.JsonResponseMessage)),
+                ('json', 'streamed', streamed(api.JsonStream)),
+                ('xml', 'whole', whole(api.XMLResponseMessage)),
+                ('xml', 'streamed', streamed(api.XMLStream))]:
+            seconds, peak = measure(run, paths[format])
+            print '%-12s %10s %10.3f %14i' % (format, mode, seconds,
+                peak - baseline)
+    finally:
+        for path in paths.values():
+            os.remove(path)
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""
+Measures the time taken to index, save and load a
+:py:class:`musixmatch.fulltext.FullTextIndex` of **documents** synthetic
+lyrics, and to run term and phrase queries on the loaded index::
+
+   prompt $ python -m benchmarks.fulltext 20000
+"""
+import sys
+import os
+import time
+import random
+import tempfile
+from musixmatch import fulltext, track
+
+def lyrics(words, size=100):
+    # Zipf like: a few words are very common, most are rare
+    return ' '.join([ words[min(len(words) - 1,
+        int(random.paretovariate(1.0)) - 1)] for i in xrange(size) ])
+
+def main(documents=20000):
+    random.seed(0)
+    words = [ 'word%i' % i for i in xrange(50000) ]
+    path = tempfile.mktemp()
+    try:
+        index = fulltext.FullTextIndex(path)
+        start = time.time()
+        for i in xrange(documents):
+            index.add(track.Track({ 'track_id': i, 'track_name': 'track_%i' % i }),
+                { 'lyrics_body': lyrics(words) })
+        print 'index %i documents: %.3f s' % (documents, time.time() - start)
+        start = time.time()
+        index.save()
+        index.close()
+        print 'save (%i KiB): %.3f s' % (os.path.getsize(path) / 1024,
+            time.time() - start)
+        start = time.time()
+        index = fulltext.FullTextIndex(path)
+        print 'load: %.3f s' % (time.time() - start)
+        for query in ['word0', 'word2', 'word50', 'word3 word50',
+                '"word0 word0"', 'word999']:
+            start = time.time()
+            for i in xrange(10):
+                found = index.search(query)
+            print 'search %-16s %6i documents %10.3f ms' % (query,
+                index.frequency(query.strip('"').split()[-1]),
+                (time.time() - start) / 10 * 1000)
+        index.close()
+    finally:
+        os.remove(path)
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
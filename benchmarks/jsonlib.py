@@ -0,0 +1,41 @@
+"""
+Compares the decoding cost of the available :py:mod:`musixmatch.jsonlib`
+backends, over chart and search response messages::
+
+   prompt $ python -m benchmarks.jsonlib 1000
+"""
+import sys
+import time
+from musixmatch import jsonlib
+from benchmarks.formats import track_dictionary
+
+def message(label, items):
+    return jsonlib.load('json').dumps({ 'message': {
+        'header': { 'status_code': 200, 'execute_time': 0.01234,
+            'available': 10000 },
+        'body': { '%s_list' % label: items } } })
+
+def chart(page_size=100):
+    return message('track', [ { 'track': track_dictionary(i) }
+        for i in xrange(page_size) ])
+
+def search(page_size=100):
+    return message('track', [ { 'track': dict(track_dictionary(i),
+        track_name=u'caf\xe8 n\xb0%i' % i, track_share_url=
+            'http://www.musixmatch.com/lyrics/artist/track_%i' % i) }
+        for i in xrange(page_size) ])
+
+def main(repeat=1000):
+    payloads = [('chart', chart()), ('search', search())]
+    print '%-12s %10s %12s' % ('backend', 'payload', 'decode (us)')
+    for name in jsonlib.available():
+        loads = jsonlib.load(name).loads
+        for payload, body in payloads:
+            start = time.time()
+            for i in xrange(repeat):
+                loads(body)
+            print '%-12s %10s %12.1f' % (name, payload,
+                (time.time() - start) / repeat * 1000000)
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,42 @@
+"""
+Measures the time taken to load a :py:class:`musixmatch.matching.MatchIndex`
+file of **entries** tracks, and to look tracks up, found or not::
+
+   prompt $ python -m benchmarks.matching 100000
+"""
+import sys
+import os
+import time
+import tempfile
+from musixmatch import matching
+from benchmarks.formats import track_dictionary
+
+def main(entries=100000):
+    path = tempfile.mktemp()
+    try:
+        index = matching.MatchIndex(path)
+        for i in xrange(entries):
+            track = track_dictionary(i)
+            index.add(track['artist_name'], track['track_name'],
+                i % 10 and track or None)
+        index.close()
+        start = time.time()
+        index = matching.MatchIndex(path)
+        print 'load %i entries (%i KiB): %.3f s' % (len(index),
+            os.path.getsize(path) / 1024, time.time() - start)
+        for state, i in [('found', 1), ('not found', 10), ('unknown', -1)]:
+            track = track_dictionary(i)
+            start = time.time()
+            for j in xrange(10000):
+                try:
+                    index.get(track['artist_name'], track['track_name'])
+                except matching.api.Error:
+                    pass
+            print 'lookup %-10s %8.1f us' % (state,
+                (time.time() - start) / 10000 * 1000000)
+        index.close()
+    finally:
+        os.remove(path)
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,33 @@
+"""
+Compares the memory taken by :py:class:`musixmatch.track.Track` items with
+the one of their compact :py:class:`musixmatch.track.TrackRecord`, reporting
+the peak memory of building each, and the time taken::
+
+   prompt $ python -m benchmarks.records 100000
+"""
+import sys
+import json
+from musixmatch import track
+from benchmarks.formats import track_dictionary, measure
+
+def dictionaries(tracks):
+    # Decoded one by one, like response messages would be: repeated values
+    # are not shared between them
+    for i in xrange(tracks):
+        yield json.loads(json.dumps(track_dictionary(i)))
+
+def build(Class, tracks):
+    def run(response):
+        return [ Class(dictionary) for dictionary in dictionaries(tracks) ]
+    return run
+
+def main(tracks=100000):
+    idle, baseline = measure(lambda response: None, '/dev/null')
+    print '%-10s %10s %14s' % ('mode', 'time (s)', 'peak (KiB)')
+    for mode, Class in [('items', track.Track.fromDictionary),
+            ('records', track.TrackRecord)]:
+        seconds, peak = measure(build(Class, tracks), '/dev/null')
+        print '%-10s %10.3f %14i' % (mode, seconds, peak - baseline)
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
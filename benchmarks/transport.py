@@ -0,0 +1,39 @@
+"""
+Compares :py:func:`urllib.urlopen` with the keep-alive
+:py:class:`musixmatch.transport.ConnectionPool` against a local stub server::
+
+   prompt $ python -m benchmarks.transport 2000
+"""
+import sys
+import time
+import urllib
+from musixmatch import transport
+from tests.server import Server
+
+def percentile(timings, p):
+    timings = sorted(timings)
+    return timings[min(len(timings) - 1, int(len(timings) * p / 100.0))]
+
+def run(urlopen, url, requests):
+    timings = []
+    for i in xrange(requests):
+        start = time.time()
+        response = urlopen(url)
+        response.read()
+        response.close()
+        timings.append(time.time() - start)
+    return timings
+
+def main(requests=1000):
+    print '%-10s %12s %10s %10s' % ('transport', 'connections', 'p50 (ms)', 'p99 (ms)')
+    for name, urlopen in [
+            ('urllib', urllib.urlopen),
+            ('pool', transport.ConnectionPool(proxies={}).urlopen)]:
+        with Server() as server:
+            url = server.location + '/track.get?track_id=292'
+            timings = run(urlopen, url, requests)
+        print '%-10s %12i %10.3f %10.3f' % (name, server.connections,
+            percentile(timings, 50) * 1000, percentile(timings, 99) * 1000)
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
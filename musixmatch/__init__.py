@@ -36,7 +36,8 @@ __classifiers__ = [
     'Topic :: Software Development :: Libraries',
 ]
 __all__ = [
-    'ws', 'api', 'base',
+    'ws', 'aws', 'api', 'base', 'transport', 'cache', 'throttle', 'retry',
+    'breaker', 'jsonlib', 'matching', 'fulltext',
     'artist', 'track', 'lyrics', 'subtitle', 'album'
 ]
 
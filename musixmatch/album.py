@@ -15,7 +15,7 @@ import musixmatch
 __license__ = musixmatch.__license__
 __author__ = musixmatch.__author__
 
-from musixmatch.base import Item, ItemsCollection
+from musixmatch.base import Item, ItemsCollection, Record, Schema
 from musixmatch.ws import album, artist
 
 class Album(Item):
@@ -40,12 +40,22 @@ class Album(Item):
     """
     __api_method__ = album.get
 
+class AlbumRecord(Record):
+    """
+    This class builds a compact, read only, representation of an
+    :py:class:`Album`. Artist names and release types are interned.
+    """
+    __slots__ = ()
+    __item__ = Album
+    __schema__ = Schema(('artist_name', 'album_release_type'))
+
 class AlbumsCollection(ItemsCollection):
     """
     This class build a :py:class:`list` like object representing an albums
     collection. It accepts :py:class:`dict` or :py:class:`Album` objects.
     """
     __allowedin__ = Album
+    __record__ = AlbumRecord
 
     @classmethod
     def fromArtist(cls, **keywords):
@@ -60,3 +70,17 @@ class AlbumsCollection(ItemsCollection):
         """
         return cls.fromResponseMessage(artist.albums.get(**keywords))
 
+    @classmethod
+    def iterArtist(cls, **keywords):
+        """
+        This classmethod returns a generator of the :py:class:`Album` objects
+        of all the pages of a **artist.albums.get**
+        :py:class:`musixmatch.api.Method` call, accepting the same keywords
+        as :py:meth:`fromArtist`. See
+        :py:meth:`musixmatch.base.ItemsCollection.paginate`.
+
+        :param page_size: desired number of items per result page
+        :param prefetch: number of pages fetched ahead
+        :param limit: maximum number of items
+        """
+        return cls.paginate(artist.albums.get, **keywords)
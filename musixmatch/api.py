@@ -1,9 +1,18 @@
 """ This module define the base API classes.
 """
 import musixmatch
-from urllib import urlencode, urlopen
+from musixmatch import transport, jsonlib
+from urllib import urlencode
 from contextlib import contextmanager
+from concurrent import futures
+import threading
+import time
 import os
+import re
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from StringIO import StringIO
 try:
     import json
 except ImportError:
@@ -44,6 +53,74 @@ class Error(Exception):
 class ResponseMessageError(Error):
     """Represents errors occurred while parsing the response messages."""
 
+class DeadlineExceeded(Error):
+    """Raised when a :py:class:`Deadline` expired before the response came."""
+
+class CircuitOpen(Error):
+    """
+    Raised, without going to the network, by calls through an open circuit of
+    a :py:class:`musixmatch.breaker.CircuitBreaker`.
+    """
+
+class Deadline(object):
+    """
+    An overall time budget of **seconds**, to be shared by all the API calls
+    of an operation, like building a collection and hydrating its tracks.
+    Any call keyword argument named **deadline** can be a :py:class:`Deadline`
+    or a number of seconds:
+
+    >>> from musixmatch.api import Deadline
+    >>> deadline = Deadline(30)
+    >>> deadline.expired
+    False
+    >>> deadline.timeout(10)
+    10
+    >>> Deadline(0).check()
+    Traceback (most recent call last):
+    ...
+    DeadlineExceeded: Deadline expired
+    """
+
+    def __init__(self, seconds, clock=time.time):
+        self.clock = clock
+        self.expires = clock() + seconds
+
+    def __repr__(self):
+        return 'Deadline(%r)' % self.remaining()
+
+    @classmethod
+    def of(cls, deadline):
+        """
+        Returns **deadline** as a :py:class:`Deadline`, or :py:data:`None`.
+        """
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(deadline)
+
+    def remaining(self):
+        """Returns the seconds left, or 0."""
+        return max(0, self.expires - self.clock())
+
+    @property
+    def expired(self):
+        """True if there is no time left."""
+        return self.remaining() <= 0
+
+    def check(self):
+        """
+        :raises: :py:exc:`DeadlineExceeded` if the deadline expired.
+        """
+        if self.expired:
+            raise DeadlineExceeded('Deadline expired')
+
+    def timeout(self, timeout=None):
+        """
+        Returns the lesser of **timeout** and the seconds left.
+        """
+        if timeout is None:
+            return self.remaining()
+        return min(timeout, self.remaining())
+
 class ResponseStatusCode(int):
     """
     Represents response message status code. Casting a
@@ -150,13 +227,14 @@ class JsonResponseMessage(ResponseMessage, dict):
     """
     def __init__(self, response):
         try:
-            parsed = json.load(response)
+            parsed = jsonlib.backend.loads(response.read())
         except Exception, e:
             raise ResponseMessageError(u'Invalid Json response message', e)
         self.update(parsed['message'])
 
     def __str__(self):
-        s = json.dumps({ 'message': self }, sort_keys=True, indent=4)
+        s = jsonlib.backend.dumps({ 'message': self }, sort_keys=True,
+            indent=4)
         return '\n'.join([l.rstrip() for l in  s.splitlines()])
 
     @property
@@ -164,6 +242,270 @@ class JsonResponseMessage(ResponseMessage, dict):
         """Overload :py:meth:`ResponseMessage.status_code`"""
         return ResponseStatusCode(self['header']['status_code'])
 
+class LazyJsonResponseMessage(JsonResponseMessage):
+    """
+    A :py:class:`JsonResponseMessage` which keeps the **raw** response body,
+    and decodes it only when needed: the first access to
+    :py:attr:`status_code` decodes just the header, the first access to
+    anything else decodes the whole message.
+
+    >>> from musixmatch.api import LazyJsonResponseMessage
+    >>> from StringIO import StringIO
+    >>> message = LazyJsonResponseMessage(StringIO('{"message": {"header": '
+    ...     '{"status_code": 200}, "body": {"track": {"track_id": 292}}}}'))
+    >>> message.status_code
+    ResponseStatusCode(200)
+    >>> message['body']['track']['track_id']
+    292
+
+    The **raw** body can be stored as it is, by
+    :py:class:`musixmatch.cache.DiskCache` for example. Invalid messages raise
+    :py:exc:`ResponseMessageError` on first access, rather than when built.
+
+    Items and collections are built on :py:meth:`detach`, so that they adopt
+    the decoded objects instead of copying them.
+    """
+    __message__ = re.compile(r'\s*\{\s*"message"\s*:\s*\{')
+    __whitespace__ = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, response):
+        self.raw = response.read()
+        self.__header = None
+        self.__decoded = False
+
+    def _decode(self):
+        """Decodes the whole message, once."""
+        if not self.__decoded:
+            JsonResponseMessage.__init__(self, StringIO(self.raw))
+            self.__decoded = True
+
+    def _header(self):
+        """
+        Returns the decoded header, scanning the message keys up to it.
+        Falls back to decoding the whole message.
+        """
+        raw = self.raw
+        skip = lambda position: self.__whitespace__.match(raw, position).end()
+        match = self.__message__.match(raw)
+        if match:
+            decode = JsonStream.__decoder__.raw_decode
+            position = match.end()
+            try:
+                while True:
+                    key, position = decode(raw, skip(position))
+                    position = skip(position)
+                    if raw[position] != ':':
+                        break
+                    value, position = decode(raw, skip(position + 1))
+                    if key == 'header':
+                        return value
+                    position = skip(position)
+                    if raw[position] != ',':
+                        break
+                    position += 1
+            except (ValueError, IndexError):
+                pass
+        self._decode()
+        return dict.__getitem__(self, 'header')
+
+    @property
+    def status_code(self):
+        """Overload :py:meth:`ResponseMessage.status_code`"""
+        if self.__decoded:
+            return JsonResponseMessage.status_code.fget(self)
+        try:
+            if self.__header is None:
+                self.__header = self._header()
+            return ResponseStatusCode(self.__header['status_code'])
+        except (KeyError, TypeError, ValueError), e:
+            raise ResponseMessageError(u'Invalid Json response message', e)
+
+    def detach(self):
+        """
+        Returns a new decoding of the message, which it does not keep, made
+        of :py:class:`musixmatch.jsonlib.JsonObject`.
+        """
+        try:
+            return jsonlib.objects(self.raw)['message']
+        except Exception, e:
+            raise ResponseMessageError(u'Invalid Json response message', e)
+
+    def __getitem__(self, key):
+        self._decode()
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        self._decode()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._decode()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._decode()
+        return dict.__len__(self)
+
+    def __str__(self):
+        self._decode()
+        return JsonResponseMessage.__str__(self)
+
+    def get(self, key, default=None):
+        self._decode()
+        return dict.get(self, key, default)
+
+    def keys(self):
+        self._decode()
+        return dict.keys(self)
+
+    def items(self):
+        self._decode()
+        return dict.items(self)
+
+    def values(self):
+        self._decode()
+        return dict.values(self)
+
+class JsonStream(object):
+    """
+    Incrementally parses a Json response message read from **response**,
+    **chunk_size** bytes at a time, yielding the elements of one of its
+    arrays as soon as they are decoded, rather than once the whole message was
+    read:
+
+    >>> from musixmatch.api import JsonStream
+    >>> from StringIO import StringIO
+    >>> stream = JsonStream(StringIO('{"message": {"header": '
+    ...     '{"status_code": 200}, "body": {"track_list": [1, 2]}}}'), 8)
+    >>> [ item for item in stream.iterate('body', 'track_list') ]
+    [1, 2]
+    >>> stream.status_code
+    ResponseStatusCode(200)
+
+    Only the element being decoded is kept in memory. Anything else found on
+    the way, like the header, is decoded as usual and kept in **message**.
+    """
+    __decoder__ = jsonlib.__objects__
+    __whitespace__ = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, response, chunk_size=16384):
+        self.response = response
+        self.chunk_size = chunk_size
+        self.__root = {}
+        self.__buffer = ''
+        self.__position = 0
+
+    def __repr__(self):
+        return 'JsonStream(%r)' % self.response
+
+    @property
+    def message(self):
+        """The message read so far, without the streamed elements."""
+        return self.__root.get('message', {})
+
+    @property
+    def status_code(self):
+        """
+        The :py:class:`ResponseStatusCode` of the message.
+
+        :raises: :py:exc:`ResponseMessageError` if not read yet.
+        """
+        try:
+            return ResponseStatusCode(self.message['header']['status_code'])
+        except (KeyError, TypeError), e:
+            raise ResponseMessageError(u'Invalid Json response message', e)
+
+    def _fill(self):
+        """
+        Appends a chunk to the buffer, dropping what was already parsed.
+        Returns False at the end of the response.
+        """
+        chunk = self.response.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.__buffer = self.__buffer[self.__position:] + chunk
+        self.__position = 0
+        return True
+
+    def _peek(self):
+        """Skips whitespaces, returning the next character or ''."""
+        while True:
+            self.__position = self.__whitespace__.match(
+                self.__buffer, self.__position).end()
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if not self._fill():
+                return ''
+
+    def _expect(self, characters):
+        """Consumes and returns the next character, one of **characters**."""
+        character = self._peek()
+        if not character or not character in characters:
+            raise ResponseMessageError(u'Invalid Json response message',
+                'Expecting %r' % characters)
+        self.__position += 1
+        return character
+
+    def _value(self):
+        """Decodes and consumes the next value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self.__decoder__.raw_decode(
+                    self.__buffer, self.__position)
+            except ValueError, e:
+                if self._fill():
+                    continue
+                raise ResponseMessageError(u'Invalid Json response message', e)
+            # A number at the end of the buffer may go on in the next chunk
+            if end == len(self.__buffer) and self._fill():
+                continue
+            self.__position = end
+            return value
+
+    def _walk(self, container, path):
+        """
+        Walks an object, down along **path**, yielding the array elements
+        at its end and keeping other values in **container**.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self.__position += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key == path[0] and len(path) > 1 and self._peek() == '{':
+                container[key] = {}
+                for item in self._walk(container[key], path[1:]):
+                    yield item
+            elif key == path[0] and len(path) == 1 and self._peek() == '[':
+                container[key] = []
+                self.__position += 1
+                if self._peek() == ']':
+                    self.__position += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(',]') == ']':
+                            break
+            else:
+                container[key] = self._value()
+            if self._expect(',}') == '}':
+                return
+
+    def iterate(self, *path):
+        """
+        Yields the elements of the array found at **path** in the message,
+        for example *body*, *track_list*.
+        """
+        for item in self._walk(self.__root, ('message',) + path):
+            yield item
+        # Read up to the end, so that the connection can be reused
+        self.__position = len(self.__buffer)
+        while self._fill():
+            self.__position = len(self.__buffer)
+
 class XMLResponseMessage(ResponseMessage, etree.ElementTree):
     """
     A :py:class:`ResponseMessage` subclass which exposes
@@ -174,6 +516,18 @@ class XMLResponseMessage(ResponseMessage, etree.ElementTree):
 
     Casting a :py:class:`XMLResponseMessage` returns (actually re-builds) a
     pretty printed string representing the XML API response message.
+
+    Getting an item converts the matching child element of the message the
+    way :py:meth:`convert` does, so that the XML message can be used like the
+    Json one:
+
+    >>> from musixmatch.api import XMLResponseMessage
+    >>> from StringIO import StringIO
+    >>> message = XMLResponseMessage(StringIO('<message><body><track_list>'
+    ...     '<track><track_id>292</track_id></track></track_list></body>'
+    ...     '</message>'))
+    >>> message['body']
+    {'track_list': [{'track': {'track_id': '292'}}]}
     """
 
     def __init__(self, response):
@@ -181,14 +535,104 @@ class XMLResponseMessage(ResponseMessage, etree.ElementTree):
 
     def __str__(self):
         s = StringIO()
-        self.wite(s)
+        self.write(s)
         return s.getvalue()
 
+    def __getitem__(self, key):
+        element = self.find(key)
+        if element is None:
+            raise KeyError, key
+        return self.convert(element)
+
+    @classmethod
+    def convert(cls, element):
+        """
+        Converts **element** to the structure of the matching Json message:
+        elements whose tag ends with *_list* become :py:class:`list` of
+        single item :py:class:`dict`, other elements with children become
+        :py:class:`dict`, and leaves become their text.
+        """
+        if element.tag.endswith('_list'):
+            return [ { child.tag: cls.convert(child) } for child in element ]
+        if len(element):
+            return dict((child.tag, cls.convert(child)) for child in element)
+        return element.text or ''
+
     @property
     def status_code(self):
         """Overload :py:meth:`ResponseMessage.status_code`"""
         return ResponseStatusCode(self.findtext('header/status_code'))
 
+class XMLStream(object):
+    """
+    Incrementally parses a XML response message read from **response**, the
+    XML counterpart of :py:class:`JsonStream`. The elements of the streamed
+    list are converted by :py:meth:`XMLResponseMessage.convert` and removed
+    from the tree as soon as they are parsed:
+
+    >>> from musixmatch.api import XMLStream
+    >>> from StringIO import StringIO
+    >>> stream = XMLStream(StringIO('<message><header><status_code>200'
+    ...     '</status_code></header><body><track_list><track><track_id>292'
+    ...     '</track_id></track></track_list></body></message>'))
+    >>> [ item for item in stream.iterate('body', 'track_list') ]
+    [{'track': {'track_id': '292'}}]
+    >>> stream.status_code
+    ResponseStatusCode(200)
+    """
+
+    def __init__(self, response):
+        self.response = response
+        self.__root = None
+
+    def __repr__(self):
+        return 'XMLStream(%r)' % self.response
+
+    @property
+    def message(self):
+        """The message read so far, without the streamed elements."""
+        if self.__root is None:
+            return {}
+        return XMLResponseMessage.convert(self.__root)
+
+    @property
+    def status_code(self):
+        """
+        The :py:class:`ResponseStatusCode` of the message.
+
+        :raises: :py:exc:`ResponseMessageError` if not read yet.
+        """
+        try:
+            return ResponseStatusCode(
+                self.__root.findtext('header/status_code'))
+        except (AttributeError, TypeError, ValueError), e:
+            raise ResponseMessageError(u'Invalid XML response message', e)
+
+    def iterate(self, *path):
+        """
+        Yields the elements of the list found at **path** in the message,
+        for example *body*, *track_list*.
+        """
+        path = list(('message',) + path)
+        tags = []
+        parents = []
+        try:
+            for event, element in etree.iterparse(self.response,
+                    ('start', 'end')):
+                if event == 'start':
+                    if self.__root is None:
+                        self.__root = element
+                    tags.append(element.tag)
+                    parents.append(element)
+                    continue
+                tags.pop()
+                parents.pop()
+                if tags == path:
+                    yield { element.tag: XMLResponseMessage.convert(element) }
+                    parents[-1].remove(element)
+        except SyntaxError, e:
+            raise ResponseMessageError(u'Invalid XML response message', e)
+
 class QueryString(dict):
     """
     A class representing  the keyword arguments to be used in HTTP requests as
@@ -252,6 +696,74 @@ class QueryString(dict):
     def __cmp__(self, other):
         return cmp(hash(self), hash(other))
 
+class SingleFlight(object):
+    """
+    Coalesces concurrent identical calls: while a call for a given key is in
+    flight, further calls for the same key wait for it and share its result
+    (or its exception), instead of running again. It counts the **calls**
+    actually run and the **coalesced** ones.
+
+    >>> from musixmatch.api import SingleFlight
+    >>> flight = SingleFlight()
+    >>> flight.do('key', lambda: 42)
+    42
+    >>> flight.calls, flight.coalesced
+    (1, 0)
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self.__lock = threading.Lock()
+        self.__flying = {}
+
+    def __repr__(self):
+        return 'SingleFlight(calls=%i, coalesced=%i)' % (
+            self.calls, self.coalesced)
+
+    def do(self, key, function, args=(), deadline=None):
+        """
+        Returns the result of **function** called with **args**, or of the
+        call for **key** already in flight, waiting for it until the
+        :py:class:`Deadline` **deadline**, if given. The call in flight is
+        bound by the deadline of its own caller: if it raises
+        :py:exc:`DeadlineExceeded`, or is interrupted, like by a
+        :py:exc:`KeyboardInterrupt`, waiting callers run **function** again,
+        within their own deadline.
+
+        :raises: :py:exc:`DeadlineExceeded` if **deadline** expired.
+        """
+        while True:
+            with self.__lock:
+                flying = self.__flying.get(key)
+                if flying is None:
+                    self.__flying[key] = result = futures.Future()
+                    self.calls += 1
+                else:
+                    self.coalesced += 1
+            if flying is None:
+                break
+            try:
+                return flying.result(deadline and deadline.remaining())
+            except futures.TimeoutError:
+                raise DeadlineExceeded('Deadline expired')
+            except futures.CancelledError:
+                pass
+            except DeadlineExceeded:
+                if deadline is not None:
+                    deadline.check()
+        try:
+            result.set_result(function(*args))
+        except Exception, e:
+            result.set_exception(e)
+            raise
+        finally:
+            with self.__lock:
+                del self.__flying[key]
+            # Interrupted without a result
+            result.cancel()
+        return result.result()
+
 class Method(str):
     """
     Utility class to build API methods name and call them as functions.
@@ -273,19 +785,35 @@ class Method(str):
     ...     chart = artist.chart.get(country='it', page=1, page_size=3)
     ... except musixmatch.api.Error, e:
     ...     pass
+
+    A **deadline**, either a :py:class:`Deadline` or a number of seconds, bounds
+    the time the call may take.
+
+    Calling :py:meth:`submit` instead, runs the :py:class:`Request` on the
+    shared :py:attr:`Request.__executor__` and returns a
+    :py:class:`concurrent.futures.Future` of the result.
     """
     __separator__ = '.'
+    __attributes__ = ('submit',)
 
     def __getattribute__(self, name):
-        if name.startswith('_'):
+        if name.startswith('_') or name in self.__attributes__:
             return super(Method, self).__getattribute__(name)
         else:
-            return Method(self.__separator__.join([self, name]))
+            return type(self)(self.__separator__.join([self, name]))
 
-    def __call__ (self, apikey=None, format=None, **query):
+    def __call__ (self, apikey=None, format=None, deadline=None, **query):
         query['apikey'] = apikey or musixmatch.apikey
         query['format'] = format or musixmatch.format
-        return Request(self, query).response
+        return Request(self, query, deadline=deadline).response
+
+    def submit(self, apikey=None, format=None, deadline=None, **query):
+        """
+        Same as calling the :py:class:`Method`, but returns a
+        :py:class:`concurrent.futures.Future` of the result.
+        """
+        return Request.__executor__.submit(
+            self, apikey, format, deadline, **query)
 
     def __repr__(self):
         return "Method('%s')" % self
@@ -322,14 +850,69 @@ class Request(object):
     
     >>> str(Request('artist.chart.get', { 'country': 'it', 'page': 1 }))
     'http://api.musixmatch.com/ws/1.1/artist.chart.get?country=it&page=1'
+
+    Requests are sent through the **__transport__** object, which defaults to
+    the keep-alive :py:data:`musixmatch.transport.pool`. Any object with an
+    **urlopen** method accepting an URL and a **timeout** keyword argument
+    will do, :py:mod:`urllib2` included. Requests with a **deadline**, a
+    :py:class:`Deadline` or a number of seconds, pass the time left to
+    **urlopen** as the **timeout**, and raise :py:exc:`DeadlineExceeded` once
+    it expired. Requests without one pass no **timeout**, so that
+    :py:mod:`urllib`, which takes none, works for them too.
+
+    Concurrent requests, like those run by :py:func:`batch` or
+    :py:meth:`Method.submit`, share the **__executor__** thread pool, which
+    runs at most **__concurrency__** requests at a time, that is
+    **musixmatch_concurrency** (8 by default).
+
+    If **__cache__** is set, for example to a :py:class:`musixmatch.cache.Cache`,
+    responses are looked up there first, by :py:attr:`key`. If
+    **__disk_cache__** is set, for example to a
+    :py:class:`musixmatch.cache.DiskCache`, response bodies are looked up
+    there before going to the network, and successful ones are stored.
+
+    Concurrent identical requests, regardless of their **apikey**, share a
+    single round trip and response message through the **__single_flight__**
+    :py:class:`SingleFlight`. Set it to :py:data:`None` to disable coalescing.
+
+    If **__throttle__** is set, for example to a
+    :py:class:`musixmatch.throttle.RateLimiter`, each network round trip waits
+    for its permission, and reports back the response status code.
+
+    If **__retry__** is set, for example to a
+    :py:class:`musixmatch.retry.RetryPolicy`, failed round trips are retried,
+    and slow ones may be hedged, according to it.
+
+    If **__breaker__** is set, for example to a
+    :py:class:`musixmatch.breaker.CircuitBreaker`, round trips are let through
+    by it, and report back their outcome.
+
+    Response messages are built by the **__formats__** classes, by format.
+    Mapping *json* to :py:class:`LazyJsonResponseMessage` defers decoding
+    until the messages are accessed.
     """
-    def __init__ (self, api_method, query=(), **keywords):
+    __transport__ = transport.pool
+    __concurrency__ = int(os.environ.get('musixmatch_concurrency', 8))
+    __executor__ = futures.ThreadPoolExecutor(max_workers=__concurrency__)
+    __cache__ = None
+    __disk_cache__ = None
+    __single_flight__ = SingleFlight()
+    __throttle__ = None
+    __retry__ = None
+    __breaker__ = None
+    __formats__ = {
+        'json': JsonResponseMessage,
+        'xml': XMLResponseMessage,
+    }
+
+    def __init__ (self, api_method, query=(), deadline=None, **keywords):
         self.__api_method = isinstance(api_method, Method) and \
             api_method or Method(api_method)
         self.__query_string = isinstance(query, QueryString) and \
             query or QueryString(query)
         self.__query_string.update(keywords)
         self.__response = None
+        self.deadline = Deadline.of(deadline)
 
     @property
     def api_method(self):
@@ -341,34 +924,166 @@ class Request(object):
         """The :py:class:`QueryString` instance."""
         return self.__query_string
 
+    @property
+    def key(self):
+        """
+        The method name and the query string, excluding the **apikey**. It
+        identifies the request regardless of the API key in use:
+
+        >>> from musixmatch.api import Request
+        >>> Request('track.get', track_id=292, apikey='whatever').key
+        'track.get?track_id=292'
+        """
+        return '%s?%s' % (self.api_method, urlencode([ (k, v)
+            for k, v in self.query_string.items() if k != 'apikey' ]))
+
     @contextmanager
     def _received(self):
         """A context manager to handle url opening"""
+        if self.deadline is None:
+            response = self.__transport__.urlopen(str(self))
+        else:
+            response = self.__transport__.urlopen(str(self),
+                timeout=self.deadline.timeout())
         try:
-            response = urlopen(str(self))
             yield response
         finally:
             response.close()
 
+    @contextmanager
+    def _admitted(self):
+        """
+        A context manager letting a network round trip through the deadline,
+        the **__breaker__** and the **__throttle__**, and reporting them its
+        outcome: the round trip appends its response message, or stream, to
+        the yielded :py:class:`list`.
+        """
+        if self.deadline is not None:
+            self.deadline.check()
+
+        breaker = self.__breaker__
+        if breaker is not None:
+            circuit = breaker.allow(self)
+
+        received = []
+        try:
+            if self.__throttle__ is not None:
+                self.__throttle__.acquire(self.deadline)
+            yield received
+        except GeneratorExit, error:
+            # Closed before the end, which says nothing about the service
+            if breaker is not None:
+                breaker.record(circuit, error=error)
+            raise
+        except Exception, error:
+            expired = self.deadline is not None and self.deadline.expired
+            if breaker is not None:
+                # Running out of our own time says nothing about the service
+                breaker.record(circuit, error=expired and
+                    DeadlineExceeded('Deadline expired') or error)
+            if expired:
+                raise DeadlineExceeded('Deadline expired')
+            raise
+
+        message, = received
+        if breaker is not None:
+            breaker.record(circuit, message)
+        if self.__throttle__ is not None:
+            self.__throttle__.feedback(message.status_code)
+
+    def _roundtrip(self, ResponseMessageClass, raw=False):
+        """
+        Runs a single network round trip and returns the parsed response
+        message. If **raw**, the response body is kept as its **raw** attribute.
+        """
+        with self._admitted() as received:
+            with self._received() as response:
+                if raw:
+                    body = response.read()
+                else:
+                    message = ResponseMessageClass(response)
+            if raw:
+                message = ResponseMessageClass(StringIO(body))
+                message.raw = body
+            received.append(message)
+        return message
+
+    def stream(self, *path):
+        """
+        Yields the elements of the array found at **path** in the response
+        message, while it is being received, through a :py:class:`JsonStream`
+        or a :py:class:`XMLStream`. Streamed responses are neither cached,
+        coalesced nor retried.
+
+        :raises: :py:exc:`Error` if the status code is not successful.
+        """
+        format = self.query_string.get('format')
+        StreamClass = {
+            'json': JsonStream,
+            'xml': XMLStream,
+        }.get(format, None)
+
+        if not StreamClass:
+            raise ResponseMessageError("Unsupported format `%s'" % format)
+
+        with self._admitted() as received:
+            with self._received() as response:
+                stream = StreamClass(response)
+                for item in stream.iterate(*path):
+                    yield item
+            status_code = stream.status_code
+            received.append(stream)
+        if not status_code:
+            raise Error(str(status_code))
+
+    def _fetch(self, ResponseMessageClass):
+        """
+        Returns the parsed response message, looking up the disk cache before
+        going to the network.
+        """
+        disk_cache = self.__disk_cache__
+        if disk_cache is not None:
+            body = disk_cache.get(self)
+            if body is not None:
+                return ResponseMessageClass(StringIO(body))
+
+        raw = disk_cache is not None
+        if self.__retry__ is None:
+            message = self._roundtrip(ResponseMessageClass, raw)
+        else:
+            message = self.__retry__.run(self.api_method, self._roundtrip,
+                (ResponseMessageClass, raw), self.deadline)
+
+        if raw and message.status_code:
+            disk_cache.set(self, message.raw)
+        return message
+
     @property
     def response(self):
         """
         The :py:class:`ResponseMessage` based on the **format** key in the
         :py:class:`QueryString`.
         """
+        if self.__response is None and self.__cache__ is not None:
+            self.__response = self.__cache__.get(self)
+
         if self.__response is None:
 
             format = self.query_string.get('format')
-            ResponseMessageClass = {
-                'json': JsonResponseMessage,
-                'xml': XMLResponseMessage,
-            }.get(format, None)
+            ResponseMessageClass = self.__formats__.get(format, None)
 
             if not ResponseMessageClass:
                 raise ResponseMessageError("Unsupported format `%s'" % format)
 
-            with self._received() as response:
-                self.__response = ResponseMessageClass(response)
+            if self.__single_flight__ is None:
+                self.__response = self._fetch(ResponseMessageClass)
+            else:
+                self.__response = self.__single_flight__.do(
+                    self.key, self._fetch, (ResponseMessageClass,),
+                    self.deadline)
+
+            if self.__cache__ is not None:
+                self.__cache__.set(self, self.__response)
 
         return self.__response
 
@@ -387,3 +1102,33 @@ class Request(object):
 
     def __cmp__(self, other):
         return cmp(hash(self), hash(other))
+
+def batch(requests, executor=None):
+    """
+    Runs many requests concurrently on **executor**, defaulting to the shared
+    :py:attr:`Request.__executor__`. Each request can either be a
+    :py:class:`Request` or a callable without arguments, like::
+
+       functools.partial(musixmatch.track.Track, track_id=292)
+
+    Returns a tuple of (results, errors). The results :py:class:`list` is in
+    the same order of **requests**, with :py:data:`None` in place of the
+    failed ones. The errors :py:class:`dict` maps the index of each failed
+    request to the exception it raised, so that one failure does not abort
+    the whole batch.
+
+    >>> from musixmatch.api import batch
+    >>> batch([])
+    ([], {})
+    """
+    executor = executor or Request.__executor__
+    submitted = [ executor.submit(getattr, r, 'response')
+        if isinstance(r, Request) else executor.submit(r) for r in requests ]
+    results, errors = [], {}
+    for i, future in enumerate(submitted):
+        try:
+            results.append(future.result())
+        except Exception, e:
+            results.append(None)
+            errors[i] = e
+    return results, errors
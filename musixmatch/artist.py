@@ -15,7 +15,7 @@ import musixmatch
 __license__ = musixmatch.__license__
 __author__ = musixmatch.__author__
 
-from musixmatch.base import Item, ItemsCollection
+from musixmatch.base import Item, ItemsCollection, Record, Schema
 from musixmatch.ws import artist
 
 class Artist(Item):
@@ -37,12 +37,22 @@ class Artist(Item):
     """
     __api_method__ = artist.get
 
+class ArtistRecord(Record):
+    """
+    This class builds a compact, read only, representation of an
+    :py:class:`Artist`. Country codes are interned.
+    """
+    __slots__ = ()
+    __item__ = Artist
+    __schema__ = Schema(('artist_country',))
+
 class ArtistsCollection(ItemsCollection):
     """
     This class build a :py:class:`list` like object representing an artists
     collection. It accepts :py:class:`dict` or :py:class:`Artist` objects.
     """
     __allowedin__ = Artist
+    __record__ = ArtistRecord
 
     @classmethod
     def fromSearch(cls, **keywords):
@@ -78,3 +88,47 @@ class ArtistsCollection(ItemsCollection):
         """
         return cls.fromResponseMessage(artist.chart.get(**keywords))
 
+    @classmethod
+    def iterSearch(cls, **keywords):
+        """
+        This classmethod returns a generator of the :py:class:`Artist`
+        objects of all the pages of a **artist.search**
+        :py:class:`musixmatch.api.Method` call, accepting the same keywords
+        as :py:meth:`fromSearch`. See
+        :py:meth:`musixmatch.base.ItemsCollection.paginate`.
+
+        :param page_size: desired number of items per result page
+        :param prefetch: number of pages fetched ahead
+        :param limit: maximum number of items
+        """
+        return cls.paginate(artist.search, **keywords)
+
+    @classmethod
+    def iterChart(cls, **keywords):
+        """
+        This classmethod returns a generator of the :py:class:`Artist`
+        objects of all the pages of a **artist.chart.get**
+        :py:class:`musixmatch.api.Method` call. See
+        :py:meth:`musixmatch.base.ItemsCollection.paginate`.
+
+        :param country: the country code of the desired country chart
+        :param page_size: desired number of items per result page
+        :param prefetch: number of pages fetched ahead
+        :param limit: maximum number of items
+        """
+        return cls.paginate(artist.chart.get, **keywords)
+
+    @classmethod
+    def fromCharts(cls, countries, **keywords):
+        """
+        This classmethod fetches the **artist.chart.get**
+        :py:class:`musixmatch.api.Method` pages of many countries
+        concurrently, returning a (snapshot, failures) tuple: see
+        :py:meth:`musixmatch.base.ItemsCollection.snapshot`.
+
+        :param countries: the country codes of the desired country charts
+        :param pages: number of pages fetched for each country
+        :param page_size: desired number of items per result page
+        :param concurrency: maximum number of requests at a time
+        """
+        return cls.snapshot(artist.chart.get, countries, **keywords)
@@ -0,0 +1,115 @@
+"""
+This is the asynchronous counterpart of :py:mod:`musixmatch.ws`. Calling an
+:py:class:`AsyncMethod` does not block: it returns a
+:py:class:`concurrent.futures.Future` of the
+:py:class:`musixmatch.api.ResponseMessage`, so that many API calls can be in
+flight at the same time:
+
+>>> import musixmatch.aws
+>>>
+>>> future = musixmatch.aws.track.chart.get(country='it', f_has_lyrics=1)
+>>> try:
+...     chart = future.result()
+... except musixmatch.api.Error, e:
+...     pass
+
+Requests run on the shared :py:attr:`musixmatch.api.Request.__executor__`, a
+pool of **musixmatch_concurrency** worker threads (8 by default), which bounds
+the number of concurrent calls.
+"""
+import musixmatch
+__license__ = musixmatch.__license__
+__author__ = musixmatch.__author__
+
+from functools import partial
+from musixmatch import api
+import musixmatch.track
+import musixmatch.artist
+import musixmatch.album
+
+class AsyncRequest(api.Request):
+    """
+    A :py:class:`musixmatch.api.Request` which runs on its **__executor__**.
+    Its **future** property submits the request, once, and returns the
+    :py:class:`concurrent.futures.Future` of its
+    :py:attr:`musixmatch.api.Request.response`.
+    """
+    __future = None
+
+    @property
+    def future(self):
+        """The :py:class:`concurrent.futures.Future` of the response."""
+        if self.__future is None:
+            self.__future = self.__executor__.submit(
+                getattr, self, 'response')
+        return self.__future
+
+class AsyncMethod(api.Method):
+    """
+    A :py:class:`musixmatch.api.Method` whose calls return a
+    :py:class:`concurrent.futures.Future` instead of blocking until the
+    :py:class:`musixmatch.api.ResponseMessage` is received:
+
+    >>> from musixmatch.aws import AsyncMethod
+    >>> AsyncMethod('track').chart.get
+    AsyncMethod('track.chart.get')
+    """
+
+    def __call__ (self, apikey=None, format=None, deadline=None, **query):
+        query['apikey'] = apikey or musixmatch.apikey
+        query['format'] = format or musixmatch.format
+        return AsyncRequest(self, query, deadline=deadline).future
+
+    def submit(self, apikey=None, format=None, deadline=None, **query):
+        """
+        Same as calling the :py:class:`AsyncMethod`, which already returns a
+        :py:class:`concurrent.futures.Future` of the result.
+        """
+        return self(apikey, format, deadline, **query)
+
+    def __repr__(self):
+        return "AsyncMethod('%s')" % self
+
+class AsyncBuilder(object):
+    """
+    Wraps a :py:class:`musixmatch.base.Base` subclass, so that its
+    *from...* classmethods, and the class itself, build objects on the shared
+    :py:attr:`musixmatch.api.Request.__executor__` and return a
+    :py:class:`concurrent.futures.Future`:
+
+    >>> import musixmatch.aws
+    >>>
+    >>> future = musixmatch.aws.TracksCollection.fromChart(country='it')
+    >>> try:
+    ...     chart = future.result()
+    ... except musixmatch.api.Error, e:
+    ...     pass
+    """
+
+    def __init__(self, cls):
+        self.__cls = cls
+
+    def __getattr__(self, name):
+        if not name.startswith('from'):
+            raise AttributeError(name)
+        return partial(api.Request.__executor__.submit,
+            getattr(self.__cls, name))
+
+    def __call__(self, **keywords):
+        return api.Request.__executor__.submit(self.__cls, **keywords)
+
+    def __repr__(self):
+        return 'AsyncBuilder(%s)' % self.__cls.__name__
+
+artist = AsyncMethod('artist')
+album = AsyncMethod('album')
+track = AsyncMethod('track')
+tracking = AsyncMethod('tracking')
+matcher = AsyncMethod('matcher')
+
+Track = AsyncBuilder(musixmatch.track.Track)
+TracksCollection = AsyncBuilder(musixmatch.track.TracksCollection)
+Artist = AsyncBuilder(musixmatch.artist.Artist)
+ArtistsCollection = AsyncBuilder(musixmatch.artist.ArtistsCollection)
+Album = AsyncBuilder(musixmatch.album.Album)
+AlbumsCollection = AsyncBuilder(musixmatch.album.AlbumsCollection)
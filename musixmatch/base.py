@@ -11,9 +11,24 @@ import musixmatch
 __license__ = musixmatch.__license__
 __author__ = musixmatch.__author__
 
-from musixmatch import api
+from musixmatch import api, jsonlib
+from collections import deque
+from concurrent import futures
+from functools import partial
+import threading
+import weakref
 import pprint
 
+def _body(message):
+    """
+    Returns the body of **message**, detached from it if the message supports
+    it, like :py:class:`musixmatch.api.LazyJsonResponseMessage` does.
+    """
+    detach = getattr(message, 'detach', None)
+    if detach is None:
+        return message['body']
+    return detach()['body']
+
 class Base(object):
     """
     The very base (abstract) class of the musixmatch package. I want all
@@ -27,6 +42,7 @@ class Base(object):
 
     :py:class:`Base` instances are hashable.
     """
+    __slots__ = ()
 
     @classmethod
     def label(cls):
@@ -54,6 +70,67 @@ class Base(object):
     def __repr__(self):
         raise NotImplementedError
 
+class IdentityMap(object):
+    """
+    A thread safe map of the living :py:class:`Item` objects, keyed by their
+    label and *<label>_id* value. It only holds weak references, so items are
+    forgotten as soon as nobody else uses them.
+
+    Setting :py:attr:`Item.__identities__` to an :py:class:`IdentityMap` makes
+    items with the same identity share a single object, which gets updated
+    with newer data:
+
+    >>> from musixmatch.base import Item, IdentityMap
+    >>> Item.__identities__ = IdentityMap()
+    >>> first = Item.fromDictionary({ 'item_id': 1, 'item_name': 'first' })
+    >>> second = Item.fromDictionary({ 'item_id': 1, 'item_name': 'second' })
+    >>> first is second, first['item_name']
+    (True, 'second')
+    >>> Item.__identities__ = None
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__items = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self.__items)
+
+    def key(self, cls, dictionary):
+        """
+        Returns the identity of **dictionary** as an item of class **cls**,
+        or :py:data:`None` if it has no *<label>_id*.
+        """
+        label = cls.label()
+        identity = dict.get(dictionary, '%s_id' % label)
+        return identity is not None and (label, str(identity)) or None
+
+    def get(self, cls, dictionary):
+        """
+        Returns the living item of class **cls** with the same identity of
+        **dictionary**, or :py:data:`None`.
+        """
+        key = self.key(cls, dictionary)
+        with self.__lock:
+            item = key and self.__items.get(key)
+        return isinstance(item, cls) and item or None
+
+    def register(self, item):
+        """
+        Returns the item sharing the identity of **item**, after updating it
+        with **item** data. If there is none, **item** becomes the shared one.
+        """
+        key = self.key(type(item), item)
+        if key is None:
+            return item
+        with self.__lock:
+            shared = self.__items.get(key)
+            if shared is None or not isinstance(shared, type(item)):
+                self.__items[key] = shared = item
+        if shared is not item:
+            dict.update(shared, item)
+        return shared
+
 class Item(Base, dict):
     """
     This is the base class for any entity in musixmatch package. Even if
@@ -63,15 +140,29 @@ class Item(Base, dict):
     and building the query based on a given keyword argument. Positional
     argument is meant to be used by collection classes. Use only keyword
     arguments.
+
+    If **__identities__** is set to an :py:class:`IdentityMap`, items are
+    shared: building an item whose identity is already known returns the
+    known object, updated with the new data, and does not query the API again.
     """
     __api_method__ = None
+    __identities__ = None
+
+    def __new__(cls, dictionary=None, **keywords):
+        if cls.__identities__ is not None:
+            item = cls.__identities__.get(cls, dictionary or keywords)
+            if item is not None:
+                return item
+        return dict.__new__(cls)
 
     def __init__(self, dictionary=None, **keywords):
         if dictionary:
             dict.update(self, dictionary)
-        elif keywords:
+        elif keywords and not self:
             message = self.apiMethod()(**keywords)
             dict.update(self, self.fromResponseMessage(message))
+        if self.__identities__ is not None:
+            self.__identities__.register(self)
 
     def __str__(self):
         return pprint.pformat(dict(self),4,1)
@@ -90,7 +181,7 @@ class Item(Base, dict):
         """
         if not message.status_code:
             raise api.Error(str(message.status_code))
-        return cls.fromDictionary(message['body'][cls.label()])
+        return cls.adopt(_body(message)[cls.label()])
 
     @classmethod
     def fromDictionary(cls, dictionary, **keywords):
@@ -99,18 +190,335 @@ class Item(Base, dict):
         """
         item = cls()
         dict.update(item, dictionary, **keywords)
+        if cls.__identities__ is not None:
+            item = cls.__identities__.register(item)
         return item
 
+    @classmethod
+    def adopt(cls, dictionary):
+        """
+        Returns an object instance, built on **dictionary**. A
+        :py:class:`musixmatch.jsonlib.JsonObject` becomes the instance itself,
+        instead of being copied like :py:meth:`fromDictionary` does:
+
+        >>> from musixmatch.track import Track
+        >>> from musixmatch.jsonlib import objects
+        >>> dictionary = objects('{"track_id": 292}')
+        >>> Track.adopt(dictionary) is dictionary
+        True
+        """
+        if type(dictionary) is not jsonlib.JsonObject:
+            return cls.fromDictionary(dictionary)
+        dictionary.__class__ = cls
+        if cls.__identities__ is not None:
+            return cls.__identities__.register(dictionary)
+        return dictionary
+
+_missing = object()
+
+class Schema(object):
+    """
+    The keys of the :py:class:`Record` of a class, shared by all of them:
+    each record only stores its values, by key position. New keys are added
+    as they are found.
+
+    String values of the **interned** keys, like artist names, are interned:
+    records holding equal values share the same string object. Only keys
+    with few distinct values are worth interning. The intern table keeps
+    about **maxsize** values at most: once full, further values are stored
+    as they are.
+
+    >>> from musixmatch.base import Schema
+    >>> schema = Schema(('country',), maxsize=1)
+    >>> first = schema.encode({ 'country': u''.join(u'it') })
+    >>> second = schema.encode({ 'country': u''.join(u'it') })
+    >>> first[0] is second[0]
+    True
+    >>> values = schema.encode({ 'country': u'us' })
+    >>> schema.strings()
+    1
+    """
+
+    def __init__(self, interned=(), maxsize=10000):
+        self.keys = []
+        self.positions = {}
+        self.interned = frozenset(interned)
+        self.maxsize = maxsize
+        self.__strings = {}
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        return 'Schema(%r)' % self.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    def position(self, key):
+        """Returns the position of **key**, adding it if unknown."""
+        position = self.positions.get(key)
+        if position is None:
+            with self.__lock:
+                position = self.positions.get(key)
+                if position is None:
+                    position = len(self.keys)
+                    self.keys.append(key)
+                    self.positions[key] = position
+        return position
+
+    def strings(self):
+        """Returns the number of interned values."""
+        return len(self.__strings)
+
+    def encode(self, dictionary):
+        """Returns the values of **dictionary**, as a :py:class:`tuple`."""
+        positions = self.positions
+        interned = self.interned
+        strings = self.__strings
+        values = [_missing] * len(positions)
+        for key, value in dictionary.iteritems():
+            position = positions.get(key)
+            if position is None:
+                position = self.position(key)
+            if position >= len(values):
+                values.extend([_missing] * (position + 1 - len(values)))
+            if key in interned and isinstance(value, basestring):
+                shared = strings.get(value)
+                if shared is not None:
+                    value = shared
+                elif len(strings) < self.maxsize:
+                    value = strings.setdefault(value, value)
+            values[position] = value
+        return tuple(values)
+
+class Record(Base):
+    """
+    A compact, read only, representation of an :py:class:`Item`. Records
+    have no :py:class:`dict`: they hold a :py:class:`tuple` of values, whose
+    keys are kept once for all the records of the same class, in their
+    **__schema__**. Subclasses set **__item__** to the :py:class:`Item`
+    class they represent:
+
+    >>> from musixmatch.track import Track, TrackRecord
+    >>> record = TrackRecord(Track({ 'track_id': 292, 'track_name': 'name' }))
+    >>> record['track_name'], hash(record)
+    ('name', 292)
+    >>> record.expand()
+    Track({'track_name': 'name', 'track_id': 292})
+
+    Records support the read only :py:class:`dict` interface.
+    """
+    __slots__ = ('__values',)
+    __item__ = Item
+    __schema__ = Schema()
+
+    def __init__(self, dictionary=None, **keywords):
+        if keywords:
+            dictionary = dict(dictionary or (), **keywords)
+        self.__values = self.__schema__.encode(dictionary or {})
+
+    @classmethod
+    def label(cls):
+        return cls.__item__.label()
+
+    def __getitem__(self, key):
+        position = self.__schema__.positions.get(key)
+        if position is None or position >= len(self.__values):
+            raise KeyError, key
+        value = self.__values[position]
+        if value is _missing:
+            raise KeyError, key
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return self.get(key, _missing) is not _missing
+
+    has_key = __contains__
+
+    def iteritems(self):
+        for key, value in zip(self.__schema__.keys, self.__values):
+            if value is not _missing:
+                yield key, value
+
+    def iterkeys(self):
+        for key, value in self.iteritems():
+            yield key
+
+    def itervalues(self):
+        for key, value in self.iteritems():
+            yield value
+
+    __iter__ = iterkeys
+
+    def items(self):
+        return list(self.iteritems())
+
+    def keys(self):
+        return list(self.iterkeys())
+
+    def values(self):
+        return list(self.itervalues())
+
+    def __len__(self):
+        return len(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, Record)):
+            return dict(self.iteritems()) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __hash__(self):
+        return int(self['%s_id' % self.label()])
+
+    def __str__(self):
+        return pprint.pformat(dict(self.iteritems()),4,1)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, dict(self.iteritems()))
+
+    def expand(self):
+        """Returns the :py:class:`Item` represented by the record."""
+        return self.__item__.fromDictionary(dict(self.iteritems()))
+
+class CollectionView(Base):
+    """
+    A read only view of the items of an :py:class:`ItemsCollection`, from
+    **start**, by **step**, **length** items long. Views reference the items
+    of the collection instead of copying them: they are returned by slicing a
+    collection, and by :py:meth:`ItemsCollection.page`. A view reflects the
+    later changes of its collection, and should not outlive them. Use
+    :py:meth:`materialize` to get a copy:
+
+    >>> from musixmatch.track import TracksCollection
+    >>> collection = TracksCollection(*[ { 'track_id': i } for i in range(5) ])
+    >>> view = collection[1:5:2]
+    >>> [ track['track_id'] for track in view ]
+    [1, 3]
+    >>> view.materialize()
+    TracksCollection(Track({'track_id': 1}), Track({'track_id': 3}))
+    """
+    __slots__ = ('__collection', '__start', '__step', '__length')
+    __hash__ = None
+
+    def __init__(self, collection, start=0, step=1, length=None):
+        if length is None:
+            length = len(xrange(start, len(collection), step))
+        self.__collection = collection
+        self.__start = start
+        self.__step = step
+        self.__length = length
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__,
+            ', '.join([ repr(i) for i in self ]))
+
+    def __str__(self):
+        return str(list(self))
+
+    def __len__(self):
+        return self.__length
+
+    def __iter__(self):
+        item = list.__getitem__
+        for i in xrange(self.__start,
+                self.__start + self.__length * self.__step, self.__step):
+            yield item(self.__collection, i)
+
+    def __getitem__(self, i):
+        if type(i) is int:
+            if i < 0:
+                i += self.__length
+            if not 0 <= i < self.__length:
+                raise IndexError('view index out of range')
+            return list.__getitem__(self.__collection,
+                self.__start + i * self.__step)
+        elif type(i) is slice:
+            start, stop, step = i.indices(self.__length)
+            return type(self)(self.__collection,
+                self.__start + start * self.__step, self.__step * step,
+                len(xrange(start, stop, step)))
+        else:
+            raise TypeError, i
+
+    def __getslice__(self, i=0, j=-1):
+        return self.__getitem__(slice(i,j))
+
+    def __eq__(self, other):
+        if isinstance(other, (list, CollectionView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __contains__(self, item):
+        try:
+            self.index(item)
+        except ValueError:
+            return False
+        return True
+
+    def count(self, item):
+        return int(item in self)
+
+    def index(self, item):
+        collection = self.__collection
+        if collection._key(item) is None:
+            for i, contained in enumerate(self):
+                if contained == item:
+                    return i
+            raise ValueError('%r is not in view' % item)
+        i, offset = divmod(collection.index(item) - self.__start, self.__step)
+        if offset or not 0 <= i < self.__length:
+            raise ValueError('%r is not in view' % item)
+        return i
+
+    def allowedin(self):
+        return self.__collection.allowedin()
+
+    def materialize(self):
+        """
+        Returns a new collection, of the type of the viewed one, holding the
+        items of the view.
+        """
+        collection = type(self.__collection)()
+        collection._extend(self)
+        return collection
+
 class ItemsCollection(Base, list):
     """
     This is the base class for collections of items, like search results, or
     charts. It behaves like :py:class:`list`, but enforce new items to be
     instance of appropriate class checking against :py:meth:`allowedin`.
+
+    Items are unique within a collection: an item whose *<label>_id* is
+    already in the collection is not inserted again. Collections index their
+    items by *<label>_id*, so that membership, :py:meth:`count` and
+    :py:meth:`index` take constant time. Items without *<label>_id* are
+    compared by value.
     """
 
     __allowedin__ = Item
+    __record__ = Record
 
     def __init__(self, *items):
+        self.__id = '%s_id' % self.allowedin().label()
+        self.__index = {}
+        self.__stale = False
         self.extend(items)
 
     def __repr__(self):
@@ -147,12 +555,73 @@ class ItemsCollection(Base, list):
         if type(i) is int:
             return list.__getitem__(self, i)
         elif type(i) is slice:
-            collection = type(self)()
-            list.extend(collection, list.__getitem__(self, i))
-            return collection
+            start, stop, step = i.indices(len(self))
+            return CollectionView(self, start, step,
+                len(xrange(start, stop, step)))
         else:
             raise TypeError, i
 
+    def __delitem__(self, i):
+        if type(i) is slice:
+            removed = list.__getitem__(self, i)
+        else:
+            removed = [ list.__getitem__(self, i) ]
+        list.__delitem__(self, i)
+        self._forget(removed)
+
+    def __delslice__(self, i=0, j=-1):
+        self.__delitem__(slice(max(0, i), max(0, j)))
+
+    def __contains__(self, item):
+        key = self._key(item)
+        if key is None:
+            return list.__contains__(self, item)
+        return key in self.__index
+
+    def _key(self, item):
+        """
+        Returns the index key of **item**, or :py:data:`None` if it has no
+        *<label>_id*.
+        """
+        if not isinstance(item, dict):
+            return None
+        identity = dict.get(item, self.__id)
+        if identity is None:
+            return None
+        return str(identity)
+
+    def _extend(self, items):
+        """
+        Appends **items**, already known to be allowed and unique in the
+        collection.
+        """
+        for item in items:
+            key = self._key(item)
+            if key is not None:
+                self.__index[key] = len(self)
+            list.append(self, item)
+
+    def _forget(self, removed, stale=True):
+        """
+        Drops the **removed** items from the index. Unless they were at the
+        end of the collection, the positions of the others are **stale**.
+        """
+        for item in removed:
+            key = self._key(item)
+            if key is not None:
+                del self.__index[key]
+        self.__stale = self.__stale or stale
+
+    def _position(self, key):
+        """Returns the position of the item whose index key is **key**."""
+        if self.__stale:
+            for position, item in enumerate(self):
+                indexed = self._key(item)
+                if indexed is not None:
+                    self.__index[indexed] = position
+            self.__stale = False
+        return self.__index[key]
+
     def append(self, item):
         self.insert(len(self), item)
 
@@ -166,41 +635,81 @@ class ItemsCollection(Base, list):
     def copy(self):
         """Returns a shallow copy of the collection."""
         collection = type(self)()
-        list.extend(collection, self)
+        collection._extend(self)
         return collection
 
     def index(self, item, *indices):
-        return list.index(self, item, *indices[:2])
+        key = self._key(item)
+        if key is None:
+            return list.index(self, item, *indices[:2])
+        if not key in self.__index:
+            raise ValueError('%r is not in collection' % item)
+        position = self._position(key)
+        start, stop = (tuple(indices[:2]) + (None, None))[:2]
+        start, stop, step = slice(start, stop).indices(len(self))
+        if not start <= position < stop:
+            raise ValueError('%r is not in collection' % item)
+        return position
 
     def insert(self, key, item):
         allowed = self.allowedin()
         if not isinstance(item, allowed):
-            item = allowed.fromDictionary(item)
-        if not item in self:
-            list.insert(self, key, item)
+            item = allowed.adopt(item)
+        elif allowed.__identities__ is not None:
+            item = allowed.__identities__.register(item)
+        indexed = self._key(item)
+        if indexed is None:
+            if not list.__contains__(self, item):
+                list.insert(self, key, item)
+                self.__stale = True
+            return
+        if indexed in self.__index:
+            return
+        if key >= len(self):
+            self.__index[indexed] = len(self)
+        else:
+            self.__index[indexed] = None
+            self.__stale = True
+        list.insert(self, key, item)
+
+    def pop(self, i=-1):
+        last = i in (-1, len(self) - 1)
+        item = list.pop(self, i)
+        self._forget([item], not last)
+        return item
+
+    def remove(self, item):
+        del self[self.index(item)]
+
+    def reverse(self):
+        list.reverse(self)
+        self.__stale = True
+
+    def sort(self, *arguments, **keywords):
+        list.sort(self, *arguments, **keywords)
+        self.__stale = True
 
     def paged(self, page_size=3):
         """
         Returns self, paged by **page_size**. That is, a list of
-        sub-collections which contain "at most" **page_size** items.
+        :py:class:`CollectionView` which contain "at most" **page_size**
+        items.
         """
         return [ self.page(i,page_size)
             for i in range(self.pages(page_size)) ]
 
     def page(self, page_index, page_size=3):
         """
-        Returns a specific page, considering pages that contain "at most"
-        **page_size** items.
+        Returns a specific page, as a :py:class:`CollectionView`, considering
+        pages that contain "at most" **page_size** items.
         """
-        page = type(self)()
         i = page_index * page_size
-        list.extend(page, self[i:i+page_size])
-        return page
+        return self[i:i+page_size]
 
     def pager(self, page_size=3):
         """
-        A generator of pages, considering pages that contain "at most"
-        **page_size** items.
+        A generator of pages, as :py:class:`CollectionView`, considering pages
+        that contain "at most" **page_size** items.
         """
         for i in xrange(self.pages(page_size)):
             yield self.page(i, page_size)
@@ -223,8 +732,163 @@ class ItemsCollection(Base, list):
             raise api.Error(str(message.status_code))
         list_label = cls.label()
         item_label = cls.allowedin().label()
-        items = [ i[item_label] for i in message['body'][list_label] ]
-        return cls(*items)
+        collection = cls()
+        collection.extend(i[item_label] for i in _body(message)[list_label])
+        return collection
+
+    def compact(self):
+        """
+        Returns a :py:class:`list` of the items of the collection, as
+        **__record__** :py:class:`Record` instances.
+        """
+        return [ self.__record__(item) for item in self ]
+
+    @classmethod
+    def paginate(cls, api_method, page_size=100, prefetch=1, limit=None,
+                 page=1, deadline=None, **keywords):
+        """
+        A generator of the items of all the pages of a **api_method**
+        :py:class:`musixmatch.api.Method` call, **page_size** items each,
+        starting from **page**. While a page is consumed, the next
+        **prefetch** pages are fetched in the background, on a pool of their
+        own rather than on the shared
+        :py:attr:`musixmatch.api.Request.__executor__`, which may be running
+        this very walk:
+
+        >>> from musixmatch.track import TracksCollection
+        >>> tracks = TracksCollection.paginate('track.search', q='love',
+        ...     page_size=100, prefetch=2, limit=1000)
+
+        It stops after an empty or short page, or once **limit** items were
+        yielded. A **deadline** bounds the whole walk. Items already yielded
+        are not yielded again, should they move to a later page meanwhile.
+
+        Prefetched pages past the last one are requested all the same, and
+        count against the API key quota: pages not yet started when the walk
+        stops are cancelled, but those already in flight are not. A **limit**
+        avoids requesting pages past it.
+        """
+        api_method = api.Method(str(api_method))
+        deadline = api.Deadline.of(deadline)
+        last = None
+        if limit is not None:
+            if limit <= 0:
+                return
+            last = page + (limit - 1) // page_size
+        pending = deque()
+        following = [page]
+        seen = set()
+        count = 0
+        executor = futures.ThreadPoolExecutor(max_workers=max(1, prefetch))
+        def submit():
+            if last is not None and following[0] > last:
+                return False
+            pending.append(executor.submit(api_method, deadline=deadline,
+                page=following[0], page_size=page_size, **keywords))
+            following[0] += 1
+            return True
+        try:
+            submit()
+            while pending and (limit is None or count < limit):
+                collection = cls.fromResponseMessage(pending.popleft().result())
+                full = len(collection) >= page_size
+                if not full:
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                while full and len(pending) < prefetch and submit():
+                    pass
+                for item in collection:
+                    if limit is not None and count >= limit:
+                        break
+                    key = collection._key(item)
+                    if key is not None:
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                    yield item
+                    count += 1
+                if full and not pending:
+                    submit()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @classmethod
+    def snapshot(cls, api_method, countries, pages=1, page_size=100,
+                 concurrency=None, deadline=None, **keywords):
+        """
+        Fetches the first **pages** pages of a **api_method**
+        :py:class:`musixmatch.api.Method` call for each of the **countries**
+        codes, running at most **concurrency** requests at a time, by default
+        :py:attr:`musixmatch.api.Request.__concurrency__`. Requests run on a
+        pool of their own: :py:mod:`musixmatch.aws` runs this very call on
+        the shared :py:attr:`musixmatch.api.Request.__executor__`. A
+        **deadline** bounds the whole operation.
+
+        Returns a tuple of (snapshot, failures). The snapshot
+        :py:class:`dict` maps each country to a collection of its items, in
+        page order. Items with the same *<label>_id* in many countries are a
+        single object. The failures :py:class:`list` holds a (country, page,
+        error) tuple for each page which could not be fetched, its country
+        collection stopping before it.
+        """
+        deadline = api.Deadline.of(deadline)
+        calls = [ (country, page) for country in countries
+            for page in range(1, pages + 1) ]
+        executor = futures.ThreadPoolExecutor(
+            max_workers=concurrency or api.Request.__concurrency__)
+        try:
+            results, errors = api.batch([ partial(api_method, deadline=deadline,
+                country=country, page=page, page_size=page_size, **keywords)
+                for country, page in calls ], executor)
+        finally:
+            executor.shutdown()
+        snapshot, failures, shared, failed = {}, [], {}, set()
+        for i, (country, page) in enumerate(calls):
+            collection = snapshot.setdefault(country, cls())
+            if country in failed:
+                continue
+            error = errors.get(i)
+            if error is None:
+                try:
+                    fetched = cls.fromResponseMessage(results[i])
+                except api.Error, e:
+                    error = e
+            if error is not None:
+                failures.append((country, page, error))
+                failed.add(country)
+                continue
+            for item in fetched:
+                key = fetched._key(item)
+                if key is not None:
+                    item = shared.setdefault(key, item)
+                collection.append(item)
+        return snapshot, failures
+
+    @classmethod
+    def stream(cls, api_method, apikey=None, format=None, deadline=None,
+               **keywords):
+        """
+        A generator of the items of a **api_method**
+        :py:class:`musixmatch.api.Method` call, built as soon as they are
+        received, instead of once the whole response message was read:
+
+        >>> from musixmatch.track import TracksCollection
+        >>> tracks = TracksCollection.stream('track.search', q='love',
+        ...     page_size=100)
+
+        Memory usage is bounded by a single item, rather than by the whole
+        response message. See :py:meth:`musixmatch.api.Request.stream`.
+        """
+        keywords['apikey'] = apikey or musixmatch.apikey
+        keywords['format'] = format or musixmatch.format
+        request = api.Request(api_method, keywords, deadline=deadline)
+        allowed = cls.allowedin()
+        item_label = allowed.label()
+        for item in request.stream('body', cls.label()):
+            yield allowed.adopt(item[item_label])
 
     @classmethod
     def allowedin(cls):
@@ -0,0 +1,196 @@
+"""
+This module provides a circuit breaker for :py:class:`musixmatch.api.Request`.
+When the web service goes down, or rejects the API key, calls fail
+immediately with :py:exc:`musixmatch.api.CircuitOpen` instead of waiting each
+for its own failure, and a few trial calls probe the service until it is back:
+
+>>> import musixmatch.api, musixmatch.breaker
+>>> musixmatch.api.Request.__breaker__ = musixmatch.breaker.CircuitBreaker(
+...     threshold=0.5, volume=20, cooldown=30)
+>>> musixmatch.api.Request.__breaker__ = None
+"""
+import musixmatch
+__license__ = musixmatch.__license__
+__author__ = musixmatch.__author__
+
+from musixmatch import api
+from collections import deque
+import threading
+import httplib
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+class Circuit(object):
+    """
+    The state of a single circuit: its **state** name, the recent
+    (time, failed) **outcomes**, when it was **opened** and how many
+    **trials** are in flight.
+    """
+
+    def __init__(self):
+        self.state = CLOSED
+        self.outcomes = deque()
+        self.opened = None
+        self.trials = 0
+
+    def __repr__(self):
+        return 'Circuit(%r)' % self.state
+
+class CircuitBreaker(object):
+    """
+    A thread safe circuit breaker, keeping a circuit for each web service
+    location or, if **per_method** is True, for each method of each location.
+
+    A closed circuit opens once at least **volume** calls ended in the last
+    **window** seconds, and at least **threshold** of them failed. Network
+    errors, unparsable responses, *5xx* status codes and the *401* and *403*
+    status codes of a rejected API key are failures.
+
+    Calls through an open circuit raise :py:exc:`musixmatch.api.CircuitOpen`.
+    After **cooldown** seconds, the circuit gets half open, and lets at most
+    **trials** calls through: it gets closed again if they succeed, opened
+    again otherwise.
+
+    >>> from musixmatch.breaker import CircuitBreaker
+    >>> breaker = CircuitBreaker(volume=2)
+    >>> breaker.states()
+    {}
+
+    The breaker counts the calls it **rejected**.
+    """
+    __failures__ = (401, 403)
+    __transient__ = (IOError, httplib.HTTPException, api.ResponseMessageError)
+
+    def __init__(self, threshold=0.5, volume=10, window=30, cooldown=30,
+                 trials=1, per_method=False, clock=time.time):
+        self.threshold = threshold
+        self.volume = volume
+        self.window = window
+        self.cooldown = cooldown
+        self.trials = trials
+        self.per_method = per_method
+        self.clock = clock
+        self.rejected = 0
+        self.__lock = threading.Lock()
+        self.__circuits = {}
+
+    def __repr__(self):
+        return 'CircuitBreaker(threshold=%r, volume=%r, cooldown=%r)' % (
+            self.threshold, self.volume, self.cooldown)
+
+    def key(self, request):
+        """Returns the circuit key of **request**."""
+        if self.per_method:
+            return '%s/%s' % (musixmatch.ws.location, request.api_method)
+        return musixmatch.ws.location
+
+    def failed(self, message=None, error=None):
+        """
+        Returns True if a call which returned **message** or raised **error**
+        failed, False if it succeeded, or :py:data:`None` if it says nothing
+        about the web service, like an expired
+        :py:class:`musixmatch.api.Deadline`.
+        """
+        if error is not None:
+            if isinstance(error, self.__transient__):
+                return True
+            return None
+        try:
+            status_code = int(message.status_code)
+        except api.ResponseMessageError:
+            return True
+        return status_code >= 500 or status_code in self.__failures__
+
+    def state(self, key=None):
+        """
+        Returns the state, *closed*, *open* or *half-open*, of the circuit
+        **key**, by default the one of the current web service location.
+        """
+        if key is None:
+            key = musixmatch.ws.location
+        with self.__lock:
+            circuit = self.__circuits.get(key)
+            if circuit is None:
+                return CLOSED
+            self._cooled(circuit, self.clock())
+            return circuit.state
+
+    def states(self):
+        """Returns a :py:class:`dict` of the circuit states by key."""
+        with self.__lock:
+            now = self.clock()
+            for circuit in self.__circuits.values():
+                self._cooled(circuit, now)
+            return dict((key, circuit.state)
+                for key, circuit in self.__circuits.items())
+
+    def _cooled(self, circuit, now):
+        """Turns **circuit** half open, if open for long enough."""
+        if circuit.state == OPEN and now - circuit.opened >= self.cooldown:
+            circuit.state = HALF_OPEN
+            circuit.trials = 0
+
+    def allow(self, request):
+        """
+        Lets **request** through, returning the ticket to :py:meth:`record`
+        its outcome with: its circuit key, and when the circuit was opened if
+        it is a trial call, :py:data:`None` otherwise.
+
+        :raises: :py:exc:`musixmatch.api.CircuitOpen` if the circuit is open,
+                 or half open with all the trials in flight.
+        """
+        key = self.key(request)
+        with self.__lock:
+            circuit = self.__circuits.setdefault(key, Circuit())
+            self._cooled(circuit, self.clock())
+            if circuit.state == CLOSED:
+                return key, None
+            if circuit.state == HALF_OPEN and circuit.trials < self.trials:
+                circuit.trials += 1
+                return key, circuit.opened
+            self.rejected += 1
+        raise api.CircuitOpen('Circuit open', key)
+
+    def record(self, ticket, message=None, error=None):
+        """
+        Records the outcome of a call allowed through with **ticket**, which
+        returned **message** or raised **error**. Only trial calls close or
+        open again a half open circuit: outcomes of calls let through before
+        it opened, or of the trials of a previous opening, are ignored.
+        """
+        key, trial = ticket
+        failed = self.failed(message, error)
+        with self.__lock:
+            circuit = self.__circuits.setdefault(key, Circuit())
+            now = self.clock()
+            if trial is not None:
+                if circuit.state != HALF_OPEN or circuit.opened != trial:
+                    return
+                circuit.trials -= 1
+                if failed:
+                    circuit.state = OPEN
+                    circuit.opened = now
+                elif failed is not None:
+                    circuit.state = CLOSED
+                    circuit.outcomes.clear()
+                return
+            if failed is None or circuit.state != CLOSED:
+                return
+            outcomes = circuit.outcomes
+            outcomes.append((now, failed))
+            while outcomes and now - outcomes[0][0] > self.window:
+                outcomes.popleft()
+            failures = sum(1 for stamp, failed in outcomes if failed)
+            if len(outcomes) >= self.volume and \
+                    failures >= self.threshold * len(outcomes):
+                circuit.state = OPEN
+                circuit.opened = now
+                outcomes.clear()
+
+    def reset(self):
+        """Closes all the circuits."""
+        with self.__lock:
+            self.__circuits.clear()
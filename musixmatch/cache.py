@@ -0,0 +1,244 @@
+"""
+This module provides optional response caches for
+:py:class:`musixmatch.api.Request`. Caches are keyed by
+:py:attr:`musixmatch.api.Request.key`, which leaves the **apikey** out, so
+that requests made with different keys share the same entries. Enable an
+in-memory cache of parsed messages, and a disk cache of response bodies which
+survives process restarts, like this:
+
+>>> import musixmatch.api, musixmatch.cache
+>>> musixmatch.api.Request.__cache__ = musixmatch.cache.Cache(maxsize=1000)
+>>> musixmatch.api.Request.__disk_cache__ = musixmatch.cache.DiskCache(
+...     '/tmp/musixmatch.sqlite')
+>>> musixmatch.api.Request.__cache__ = None
+>>> musixmatch.api.Request.__disk_cache__ = None
+"""
+import musixmatch
+__license__ = musixmatch.__license__
+__author__ = musixmatch.__author__
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import threading
+import sqlite3
+import time
+
+class BaseCache(object):
+    """
+    The base (abstract) class of response caches. Each entry expires after a
+    time to live depending on the API method, looked up in **ttls** first,
+    then in **__ttls__**, falling back to **ttl** seconds:
+
+    >>> from musixmatch.cache import Cache
+    >>> cache = Cache(ttls={ 'track.chart.get': 60 })
+    >>> cache.ttlof('track.chart.get'), cache.ttlof('track.lyrics.get')
+    (60, 86400)
+
+    Caches count their **hits**, **misses** and **evictions**. Expired
+    entries are not counted as evictions.
+    """
+    __ttls__ = {
+        'track.lyrics.get': 86400,
+        'track.subtitle.get': 86400,
+        'track.chart.get': 600,
+        'artist.chart.get': 600,
+    }
+
+    def __init__(self, maxsize, ttl=3600, ttls=None, clock=time.time):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = dict(self.__ttls__, **(ttls or {}))
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return '%s(maxsize=%r, ttl=%r)' % (
+            type(self).__name__, self.maxsize, self.ttl)
+
+    def ttlof(self, api_method):
+        """Returns the time to live of **api_method** responses."""
+        return self.ttls.get(api_method, self.ttl)
+
+    def get(self, request):
+        raise NotImplementedError
+
+    def set(self, request, value):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+class Cache(BaseCache):
+    """
+    A thread safe, in-memory cache of :py:class:`musixmatch.api.ResponseMessage`
+    objects, to be used as :py:attr:`musixmatch.api.Request.__cache__`. At most
+    **maxsize** messages are kept: once full, the least recently used message
+    gets evicted. Only successful responses are cached.
+    """
+
+    def __init__(self, maxsize=1024, **keywords):
+        BaseCache.__init__(self, maxsize, **keywords)
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, request):
+        """
+        Returns the cached response of **request**, or :py:data:`None`.
+        """
+        key = request.key
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if entry is None or entry[0] <= self.clock():
+                self.misses += 1
+                return None
+            self.__entries[key] = entry
+            self.hits += 1
+            return entry[1]
+
+    def set(self, request, message):
+        """
+        Caches **message** as the response of **request**, if successful.
+        """
+        if not message.status_code:
+            return
+        expires = self.clock() + self.ttlof(request.api_method)
+        with self.__lock:
+            self.__entries.pop(request.key, None)
+            self.__entries[request.key] = (expires, message)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Empties the cache."""
+        with self.__lock:
+            self.__entries.clear()
+
+class DiskCache(BaseCache):
+    """
+    A cache of raw response bodies stored in the SQLite database at **path**,
+    to be used as :py:attr:`musixmatch.api.Request.__disk_cache__`. It can be
+    shared by the threads and the processes running on the same host, and
+    its entries survive process restarts. Once the stored bodies exceed
+    **maxsize** bytes, expired entries are dropped, then the least recently
+    used ones get evicted. Expired entries are also dropped by
+    :py:meth:`compact`.
+
+    Lookups only read the database, never waiting for writers: the access
+    times they update are kept in memory, and written on the next
+    :py:meth:`set` or :py:meth:`compact`.
+    """
+
+    def __init__(self, path, maxsize=64 * 1024 * 1024, timeout=30,
+                 **keywords):
+        BaseCache.__init__(self, maxsize, **keywords)
+        self.path = path
+        self.timeout = timeout
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__accessed = {}
+        with self._transaction() as db:
+            db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, body BLOB, size INTEGER, '
+                'expires REAL, accessed REAL)')
+            db.execute('CREATE INDEX IF NOT EXISTS responses_accessed '
+                'ON responses (accessed)')
+
+    def __len__(self):
+        return self._connection().execute(
+            'SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def _connection(self):
+        """Returns the database connection of the current thread."""
+        db = getattr(self.__local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=self.timeout,
+                isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            self.__local.db = db
+        return db
+
+    @contextmanager
+    def _transaction(self):
+        """A context manager running a write transaction."""
+        db = self._connection()
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            yield db
+        except:
+            db.execute('ROLLBACK')
+            raise
+        db.execute('COMMIT')
+
+    def _touch(self, db):
+        """Writes the access times of the last lookups through **db**."""
+        with self.__lock:
+            accessed, self.__accessed = self.__accessed, {}
+        db.executemany('UPDATE responses SET accessed = ? WHERE key = ?',
+            [ (stamp, key) for key, stamp in accessed.iteritems() ])
+
+    def get(self, request):
+        """
+        Returns the cached response body of **request**, or :py:data:`None`.
+        """
+        now = self.clock()
+        rows = self._connection().execute('SELECT body FROM responses '
+            'WHERE key = ? AND expires > ?', (request.key, now)).fetchall()
+        with self.__lock:
+            if not rows:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.__accessed[request.key] = now
+        return str(rows[0][0])
+
+    def set(self, request, body):
+        """
+        Caches **body** as the response of **request**, evicting the least
+        recently used entries if **maxsize** was exceeded.
+        """
+        now = self.clock()
+        expires = now + self.ttlof(request.api_method)
+        with self._transaction() as db:
+            self._touch(db)
+            db.execute('INSERT OR REPLACE INTO responses '
+                'VALUES (?, ?, ?, ?, ?)',
+                (request.key, buffer(body), len(body), expires, now))
+            total = db.execute(
+                'SELECT SUM(size) FROM responses').fetchone()[0]
+            if total > self.maxsize:
+                db.execute('DELETE FROM responses WHERE expires <= ?', (now,))
+                total = db.execute(
+                    'SELECT SUM(size) FROM responses').fetchone()[0] or 0
+                evicted = []
+                for key, size in db.execute('SELECT key, size '
+                        'FROM responses ORDER BY accessed'):
+                    if total <= self.maxsize:
+                        break
+                    evicted.append((key,))
+                    total -= size
+                db.executemany('DELETE FROM responses WHERE key = ?', evicted)
+                with self.__lock:
+                    self.evictions += len(evicted)
+
+    def compact(self):
+        """
+        Drops the expired entries and reclaims the space they were using.
+        """
+        with self._transaction() as db:
+            self._touch(db)
+            db.execute('DELETE FROM responses WHERE expires <= ?',
+                (self.clock(),))
+        self._connection().execute('VACUUM')
+
+    def clear(self):
+        """Empties the cache."""
+        with self._transaction() as db:
+            db.execute('DELETE FROM responses')
+        with self.__lock:
+            self.__accessed.clear()
@@ -0,0 +1,408 @@
+"""
+This module provides a local full text index of the lyrics of tracks, to
+search them without querying **track.search** with **q_lyrics**:
+
+>>> from musixmatch.fulltext import FullTextIndex
+>>> from musixmatch.track import Track
+>>> index = FullTextIndex()
+>>> index.add(Track({ 'track_id': 292, 'track_name': 'name' }),
+...     { 'lyrics_body': 'Tonight I am gonna have myself a real good time' })
+True
+>>> [ track['track_id'] for track in index.search('"good time"') ]
+[292]
+
+Tracks are added one at a time, with their lyrics, and the index can be
+saved to a file. Loading a saved index maps the file in memory, instead of
+reading it: postings are only decoded when a query needs them, and the
+data of a track only when it is a result. Tracks added later are kept in
+memory, until saved again.
+
+Postings lists keep, for each term, the delta encoded numbers of the
+documents containing it, the number of occurrences of the term, and its
+delta encoded positions, as variable length integers. Positions are only
+decoded by phrase queries.
+"""
+import musixmatch
+__license__ = musixmatch.__license__
+__author__ = musixmatch.__author__
+
+from musixmatch import jsonlib
+from musixmatch.track import Track, TracksCollection
+import unicodedata
+import threading
+import struct
+import heapq
+import math
+import mmap
+import json
+import os
+import re
+
+_words = re.compile(r'\w+', re.UNICODE)
+_phrases = re.compile(r'"([^"]*)"')
+
+def tokenize(text):
+    """
+    Returns the list of the terms of **text**: its words, lower cased and
+    without diacritics.
+
+    >>> from musixmatch.fulltext import tokenize
+    >>> tokenize(u"Na\\xefve, isn't it?")
+    [u'naive', u'isn', u't', u'it']
+    """
+    if isinstance(text, str):
+        text = text.decode('utf-8')
+    text = unicodedata.normalize('NFKD', text.lower())
+    return _words.findall(u''.join([ c for c in text
+        if not unicodedata.combining(c) ]))
+
+def _encode(numbers, output):
+    """Appends **numbers** to **output**, as variable length integers."""
+    for number in numbers:
+        while number > 0x7f:
+            output.append((number & 0x7f) | 0x80)
+            number >>= 7
+        output.append(number)
+
+def _decode(data, offset=0, end=None):
+    """A generator of the variable length integers of **data**."""
+    if end is None:
+        end = len(data)
+    number = shift = 0
+    for i in xrange(offset, end):
+        byte = data[i]
+        number |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield number
+            number = shift = 0
+
+def _varint(data, offset):
+    """
+    Returns the variable length integer of **data** at **offset**, and the
+    offset following it.
+    """
+    number = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        number |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return number, offset
+        shift += 7
+
+def _postings(data, positions=False):
+    """
+    A generator of the (document, occurrences, positions) of the postings
+    list **data**. Positions are only decoded if **positions** is True, or
+    a container of the document, otherwise they are :py:data:`None`.
+    """
+    data = bytearray(data)
+    offset, end, document = 0, len(data), 0
+    while offset < end:
+        delta, offset = _varint(data, offset)
+        count, offset = _varint(data, offset)
+        size, offset = _varint(data, offset)
+        document += delta
+        found = None
+        if positions is True or positions and document in positions:
+            found, position = [], 0
+            for delta in _decode(data, offset, offset + size):
+                position += delta
+                found.append(position)
+        offset += size
+        yield document, count, found
+
+class FullTextIndex(object):
+    """
+    A thread safe full text index of the lyrics of tracks, loaded from the
+    file at **path**, if given and existing. Results are ranked by BM25,
+    tuned by **k1** and **b**.
+
+    The index counts its **documents**.
+    """
+    __magic__ = 'MXMFTI1\n'
+    # Offset, size, length and track id of each document
+    __document__ = struct.Struct('<QIIq')
+    # Documents table offset, documents, directory offset and size, total
+    # length, magic
+    __footer__ = struct.Struct('<QQQQQ8s')
+
+    def __init__(self, path=None, k1=1.2, b=0.75):
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self.__lock = threading.Lock()
+        self.__mapped = None
+        self.__mapped_documents = 0
+        self.__table = 0
+        self.__directory = {}
+        self.__length = 0
+        self.__ids = None
+        self.__postings = {}
+        self.__documents = []
+        if path is not None and os.path.exists(path):
+            self._map(path)
+
+    def __repr__(self):
+        return 'FullTextIndex(%r)' % self.path
+
+    def __len__(self):
+        return self.documents
+
+    @property
+    def documents(self):
+        return self.__mapped_documents + len(self.__documents)
+
+    def _map(self, path):
+        """Maps the index file **path** in memory."""
+        with open(path, 'rb') as saved:
+            mapped = mmap.mmap(saved.fileno(), 0, access=mmap.ACCESS_READ)
+        footer = self.__footer__
+        table, documents, directory, size, length, magic = footer.unpack(
+            mapped[len(mapped) - footer.size:])
+        if magic != self.__magic__ or mapped[:8] != self.__magic__:
+            mapped.close()
+            raise ValueError("Not a full text index `%s'" % path)
+        self.__directory = jsonlib.backend.loads(
+            mapped[directory:directory + size])
+        self.__mapped = mapped
+        self.__mapped_documents = documents
+        self.__table = table
+        self.__length = length
+
+    def _ids(self):
+        """Returns the :py:class:`set` of the indexed track ids."""
+        if self.__ids is None:
+            self.__ids = set(self._entry(i)[3]
+                for i in xrange(self.__mapped_documents))
+        return self.__ids
+
+    def add(self, track, lyrics=None):
+        """
+        Indexes the **lyrics** of **track**, by default its own *lyrics*, if
+        fetched. Returns False if the track has no lyrics, or is already
+        indexed.
+        """
+        if lyrics is None:
+            lyrics = dict.get(track, 'lyrics')
+        if not lyrics or not lyrics.get('lyrics_body'):
+            return False
+        terms = tokenize(lyrics['lyrics_body'])
+        data = dict((k, v) for k, v in dict.items(track)
+            if not k in Track.__special__)
+        encoded = json.dumps(data, separators=(',', ':'))
+        positions = {}
+        for position, term in enumerate(terms):
+            positions.setdefault(term, []).append(position)
+        with self.__lock:
+            ids = self._ids()
+            track_id = int(track['track_id'])
+            if track_id in ids:
+                return False
+            ids.add(track_id)
+            document = self.documents
+            self.__documents.append((encoded, len(terms), track_id))
+            self.__length += len(terms)
+            for term, found in positions.iteritems():
+                postings = self.__postings.get(term)
+                if postings is None:
+                    # Encoded postings, last document, document frequency
+                    postings = self.__postings[term] = [bytearray(), 0, 0]
+                deltas = bytearray()
+                _encode([ p - q for p, q in zip(found, [0] + found) ], deltas)
+                _encode([document - postings[1], len(found), len(deltas)],
+                    postings[0])
+                postings[0].extend(deltas)
+                postings[1] = document
+                postings[2] += 1
+        return True
+
+    def extend(self, tracks):
+        """
+        Indexes the lyrics of **tracks**, like those of an hydrated
+        :py:class:`musixmatch.track.TracksCollection`. Returns the number of
+        tracks indexed.
+        """
+        return sum(1 for track in tracks if self.add(track))
+
+    def frequency(self, term):
+        """Returns the number of documents containing **term**."""
+        frequency = self.__directory.get(term, (0, 0, 0, 0))[2]
+        postings = self.__postings.get(term)
+        if postings is not None:
+            frequency += postings[2]
+        return frequency
+
+    def postings(self, term, positions=False):
+        """
+        A generator of the (document, occurrences, positions) of **term**, by
+        document. Positions are only decoded if **positions** is True, or a
+        container of the document, otherwise they are :py:data:`None`.
+        """
+        if term in self.__directory:
+            offset, size, frequency, last = self.__directory[term]
+            for posting in _postings(self.__mapped[offset:offset + size],
+                    positions):
+                yield posting
+        postings = self.__postings.get(term)
+        if postings is not None:
+            for posting in _postings(postings[0], positions):
+                yield posting
+
+    def _entry(self, document):
+        """Returns the table entry of mapped **document**."""
+        return self.__document__.unpack_from(self.__mapped,
+            self.__table + document * self.__document__.size)
+
+    def _document(self, document):
+        """Returns the encoded data of **document**."""
+        if document >= self.__mapped_documents:
+            return self.__documents[document - self.__mapped_documents][0]
+        offset, size, length, track_id = self._entry(document)
+        return self.__mapped[offset:offset + size]
+
+    def _length(self, document):
+        """Returns the number of terms of **document**."""
+        if document >= self.__mapped_documents:
+            return self.__documents[document - self.__mapped_documents][1]
+        return self._entry(document)[2]
+
+    def search(self, query, limit=10):
+        """
+        Returns a :py:class:`musixmatch.track.TracksCollection` of the at
+        most **limit** tracks whose lyrics contain all the terms of
+        **query**, best ranked first. Double quoted parts of **query** are
+        phrases, whose terms must be consecutive.
+        """
+        phrases = [ tokenize(p) for p in _phrases.findall(query) ]
+        phrases = [ p for p in phrases if p ]
+        terms = set(tokenize(_phrases.sub(' ', query)))
+        for phrase in phrases:
+            terms.update(phrase)
+        collection = TracksCollection()
+        if not terms:
+            return collection
+        with self.__lock:
+            frequencies = dict((t, self.frequency(t)) for t in terms)
+            if not all(frequencies.values()):
+                return collection
+            positional = set()
+            for phrase in phrases:
+                positional.update(phrase)
+            # Rarest terms first, to restrict candidates early
+            matches = None
+            for term in sorted(terms, key=frequencies.get):
+                found = {}
+                # Positions of phrase terms, in candidates only if any
+                wanted = term in positional and (matches or True)
+                for document, count, positions in self.postings(term, wanted):
+                    if matches is None:
+                        found[document] = { term: (count, positions) }
+                    elif document in matches:
+                        found[document] = matches[document]
+                        found[document][term] = (count, positions)
+                matches = found
+                if not matches:
+                    return collection
+            documents = self.documents
+            average = float(self.__length) / documents
+            idfs = dict((t, math.log(1 + (documents - f + 0.5) / (f + 0.5)))
+                for t, f in frequencies.iteritems())
+            scores = []
+            for document, occurrences in matches.iteritems():
+                if not all(self._phrase(occurrences, p) for p in phrases):
+                    continue
+                norm = self.k1 * (1 - self.b +
+                    self.b * self._length(document) / average)
+                score = 0
+                for term, (count, positions) in occurrences.iteritems():
+                    score += idfs[term] * count * (self.k1 + 1) / (count + norm)
+                scores.append((score, -document))
+            best = [ self._document(-d)
+                for s, d in heapq.nlargest(limit, scores) ]
+        for encoded in best:
+            collection.append(Track.fromDictionary(
+                jsonlib.backend.loads(encoded)))
+        return collection
+
+    @staticmethod
+    def _phrase(occurrences, phrase):
+        """
+        Returns True if the **phrase** terms are consecutive, given their
+        (count, positions) **occurrences** in a document.
+        """
+        starts = set(occurrences[phrase[0]][1])
+        for i, term in enumerate(phrase[1:]):
+            starts &= set(p - i - 1 for p in occurrences[term][1])
+            if not starts:
+                return False
+        return True
+
+    def save(self, path=None):
+        """
+        Saves the index to the file at **path**, by default the one it was
+        loaded from, and maps it in memory.
+        """
+        path = path or self.path
+        temporary = '%s.%i.tmp' % (path, os.getpid())
+        with self.__lock:
+            directory = {}
+            with open(temporary, 'wb') as output:
+                output.write(self.__magic__)
+                offset = len(self.__magic__)
+                for term in set(self.__directory) | set(self.__postings):
+                    data, frequency, last = '', 0, 0
+                    if term in self.__directory:
+                        start, size, frequency, last = self.__directory[term]
+                        data = self.__mapped[start:start + size]
+                    postings = self.__postings.get(term)
+                    if postings is not None:
+                        # The first document delta was relative to 0
+                        numbers = _decode(postings[0])
+                        first = numbers.next()
+                        rebased = bytearray()
+                        _encode([first - last], rebased)
+                        skipped = bytearray()
+                        _encode([first], skipped)
+                        data += str(rebased) + str(postings[0][len(skipped):])
+                        frequency += postings[2]
+                        last = postings[1]
+                    output.write(data)
+                    directory[term] = (offset, len(data), frequency, last)
+                    offset += len(data)
+                entries = []
+                for document in xrange(self.documents):
+                    if document < self.__mapped_documents:
+                        entry = self._entry(document)
+                        encoded = self.__mapped[entry[0]:entry[0] + entry[1]]
+                        length, track_id = entry[2:]
+                    else:
+                        encoded, length, track_id = self.__documents[
+                            document - self.__mapped_documents]
+                    output.write(encoded)
+                    entries.append(self.__document__.pack(offset,
+                        len(encoded), length, track_id))
+                    offset += len(encoded)
+                table = offset
+                output.write(''.join(entries))
+                offset += len(entries) * self.__document__.size
+                encoded = json.dumps(directory, separators=(',', ':'))
+                output.write(encoded)
+                output.write(self.__footer__.pack(table, len(entries), offset,
+                    len(encoded), self.__length, self.__magic__))
+            os.rename(temporary, path)
+            if self.__mapped is not None:
+                self.__mapped.close()
+            self.path = path
+            self.__postings = {}
+            self.__documents = []
+            self._map(path)
+
+    def close(self):
+        """Unmaps the index file."""
+        with self.__lock:
+            if self.__mapped is not None:
+                self.__mapped.close()
+                self.__mapped = None
@@ -0,0 +1,155 @@
+"""
+This module provides the Json backends used to decode and encode response
+messages. At import time, the fastest available backend is selected, unless
+environment variable **musixmatch_json** names another one:
+
+>>> import musixmatch.jsonlib
+>>> musixmatch.jsonlib.backend.name in musixmatch.jsonlib.available()
+True
+>>> musixmatch.jsonlib.backend.loads('{"message": {"header": {}}}')
+{u'message': {u'header': {}}}
+
+Backends can be switched at run time with :py:func:`use`, and new ones can be
+added with :py:func:`register`. Every backend returns the same structures:
+:py:class:`dict`, :py:class:`list`, :py:class:`unicode` strings, and
+:py:class:`int` and :py:class:`float` numbers.
+
+:py:func:`objects` decodes Json objects as :py:class:`JsonObject` instead,
+which items can adopt as their own storage, without copying them.
+"""
+import musixmatch
+__license__ = musixmatch.__license__
+__author__ = musixmatch.__author__
+
+import json
+import os
+
+class JsonObject(dict):
+    """
+    A Json object decoded by :py:func:`objects`. Unlike a :py:class:`dict`,
+    its class can be changed to a :py:class:`musixmatch.base.Item` subclass:
+    see :py:meth:`musixmatch.base.Item.adopt`.
+    """
+
+
+class Backend(object):
+    """
+    A Json backend named **name**, decoding strings with **loads** and
+    encoding objects with **dumps**, which accepts the **indent** and
+    **sort_keys** keyword arguments.
+    """
+
+    def __init__(self, name, loads, dumps):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return 'Backend(%r)' % self.name
+
+def _ujson():
+    import ujson
+    def loads(s):
+        return ujson.loads(s, precise_float=True)
+    def dumps(obj, indent=None, sort_keys=False):
+        return ujson.dumps(obj, indent=indent or 0, sort_keys=sort_keys,
+            ensure_ascii=True)
+    return loads, dumps
+
+def _simplejson():
+    import simplejson
+    # Without its C speedups, simplejson is slower than json
+    from simplejson import _speedups
+    decoder = simplejson.JSONDecoder()
+    def loads(s):
+        if isinstance(s, str):
+            # ASCII strings would be decoded as str, not as unicode
+            s = s.decode('utf-8')
+        return decoder.decode(s)
+    return loads, simplejson.dumps
+
+def _json():
+    import json
+    return json.loads, json.dumps
+
+# Backend factories by name, returning (loads, dumps) or raising ImportError
+__factories__ = {
+    'ujson': _ujson,
+    'simplejson': _simplejson,
+    'json': _json,
+}
+
+# Backend names, fastest first: see benchmarks/jsonlib.py
+__preference__ = ['ujson', 'json', 'simplejson']
+
+# The Backend in use
+backend = None
+
+__objects__ = json.JSONDecoder(object_pairs_hook=JsonObject)
+
+def objects(s):
+    """
+    Decodes **s**, building a :py:class:`JsonObject` for each Json object.
+
+    >>> from musixmatch.jsonlib import objects
+    >>> type(objects('{"track": {"track_id": 292}}')['track'])
+    <class 'musixmatch.jsonlib.JsonObject'>
+    """
+    return __objects__.decode(s)
+
+def register(name, factory, preference=None):
+    """
+    Registers the **factory** of backend **name**: a callable returning a
+    (loads, dumps) tuple, or raising :py:exc:`ImportError` if the backend
+    is unavailable. The backend is tried at **preference** position when
+    selecting the fastest one, last if undefined.
+    """
+    __factories__[name] = factory
+    if name in __preference__:
+        __preference__.remove(name)
+    if preference is None:
+        __preference__.append(name)
+    else:
+        __preference__.insert(preference, name)
+
+def load(name):
+    """
+    Returns the :py:class:`Backend` **name**.
+
+    :raises: :py:exc:`ImportError` if it is unavailable.
+    """
+    try:
+        factory = __factories__[name]
+    except KeyError:
+        raise ImportError("Unknown Json backend `%s'" % name)
+    loads, dumps = factory()
+    return Backend(name, loads, dumps)
+
+def available():
+    """Returns the names of the available backends, fastest first."""
+    names = []
+    for name in __preference__:
+        try:
+            load(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+def use(name=None):
+    """
+    Selects the backend **name** or, if undefined, the one named by the
+    **musixmatch_json** environment variable or the fastest available, and
+    returns it.
+
+    :raises: :py:exc:`ImportError` if it is unavailable.
+    """
+    global backend
+    name = name or os.environ.get('musixmatch_json')
+    if name:
+        backend = load(name)
+    else:
+        backend = load(available()[0])
+    return backend
+
+use()
@@ -0,0 +1,345 @@
+"""
+This module matches catalogues of (artist, title) rows against the
+**matcher.track.get** :py:class:`musixmatch.api.Method`, running many
+requests at a time:
+
+>>> from musixmatch.matching import BulkMatcher
+>>> matcher = BulkMatcher(concurrency=8)
+
+Rows are read from CSV or JSONL files, and results are appended to a JSONL
+file, one Json object per line, as soon as they are available. The output
+file is also the checkpoint of the job: when run again on the same output,
+rows whose result was already written are not matched again. Rows whose
+artist and title :py:func:`normalize` to an already seen :py:func:`key` are
+skipped.
+
+The same is available from the command line::
+
+   prompt $ python -m musixmatch.matching catalogue.csv matches.jsonl
+
+A :py:class:`MatchIndex` keeps the results of
+:py:meth:`musixmatch.track.Track.fromMatcher` by :py:func:`key`, so that
+matching the same (artist, title) again needs no request:
+
+>>> import musixmatch.track, musixmatch.matching
+>>> musixmatch.track.Track.__match_index__ = musixmatch.matching.MatchIndex()
+>>> musixmatch.track.Track.__match_index__ = None
+"""
+import musixmatch
+__license__ = musixmatch.__license__
+__author__ = musixmatch.__author__
+
+from musixmatch import api, jsonlib
+from musixmatch.track import Track
+from musixmatch.ws import matcher
+from concurrent import futures
+from collections import deque
+import unicodedata
+import threading
+import argparse
+import hashlib
+import struct
+import json
+import csv
+import sys
+import os
+import re
+
+# Featured artists, in brackets or in a trailing clause: a bare "ft" may
+# well be part of the title, like in "Six ft Deep"
+_featuring = re.compile(
+    r'\s*[\(\[]\s*(?:feat|ft|featuring)\b\.?[^\)\]]*[\)\]]?'
+    r'|\s+(?:feat\.|ft\.|featuring\b)\s.*$', re.UNICODE)
+_punctuation = re.compile(r'[^\w\s]+', re.UNICODE)
+_spaces = re.compile(r'\s+', re.UNICODE)
+
+def normalize(text):
+    """
+    Returns **text** lower cased, without diacritics, featured artists (in
+    brackets, or after a trailing *feat.*, *ft.* or *featuring*),
+    punctuation, and with single spaces between words:
+
+    >>> from musixmatch.matching import normalize
+    >>> normalize(u" Don't  Stop Me-Now! ")
+    u'don t stop me now'
+    >>> normalize(u'Cr\xe8me Br\xfbl\xe9e (feat. Somebody)')
+    u'creme brulee'
+    >>> normalize(u'Six ft Deep ft. Somebody')
+    u'six ft deep'
+    """
+    if isinstance(text, str):
+        text = text.decode('utf-8')
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = u''.join([ c for c in text if not unicodedata.combining(c) ])
+    text = _punctuation.sub(u' ', _featuring.sub(u'', text))
+    return _spaces.sub(u' ', text).strip()
+
+def key(artist, title):
+    """
+    Returns the key of the (**artist**, **title**) row: rows with the same
+    key are duplicates.
+
+    >>> from musixmatch.matching import key
+    >>> key('Queen', "Don't stop me now") == key('queen', "don't stop me now!")
+    True
+    """
+    return u'%s\t%s' % (normalize(artist), normalize(title))
+
+def read(path, format=None):
+    """
+    A generator of the rows of file **path**, as :py:class:`dict`. The
+    **format**, *csv* or *jsonl*, defaults to the file extension. CSV files
+    need a header row, and are expected to be UTF-8 encoded. Fields past the
+    header ones are dropped.
+    """
+    format = format or os.path.splitext(path)[1].lstrip('.').lower()
+    with open(path, 'rb') as rows:
+        if format == 'csv':
+            for row in csv.DictReader(rows):
+                # Extra fields are listed under None
+                yield dict((k, v and v.decode('utf-8'))
+                    for k, v in row.items() if k is not None)
+        elif format in ('jsonl', 'json'):
+            for line in rows:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            raise ValueError("Unknown format `%s'" % format)
+
+def done(path):
+    """
+    Returns the :py:class:`set` of the keys of the rows already matched in
+    output file **path**: those found, and those not found. Rows which
+    failed for other reasons are not done. A last line left incomplete by an
+    interrupted job is removed.
+    """
+    keys = set()
+    if not os.path.exists(path):
+        return keys
+    with open(path, 'r+b') as results:
+        end = 0
+        for line in results:
+            if not line.endswith('\n'):
+                break
+            end += len(line)
+            result = json.loads(line)
+            if 'track' in result or result.get('status') == 404:
+                keys.add(result['key'])
+        results.truncate(end)
+    return keys
+
+class MatchIndex(object):
+    """
+    An index of the results of **matcher.track.get**, found or not found,
+    by the 64 bits hash of their :py:func:`key`, to be used as
+    :py:attr:`musixmatch.track.Track.__match_index__`. Found tracks are kept
+    as encoded Json, and decoded on lookup.
+
+    If **path** is given, the index is loaded from that file, and new
+    entries are appended to it. Each entry takes a 12 bytes header and the
+    encoded track, if found. Loading does not decode tracks, and drops a
+    last entry left incomplete by an interrupted process.
+
+    The index counts its **hits** and **misses**.
+    """
+    __header__ = struct.Struct('<qi')
+
+    def __init__(self, path=None):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.__entries = {}
+        self.__lock = threading.Lock()
+        self.__file = None
+        if path is not None:
+            self.__file = open(path, 'a+b')
+            self._load()
+
+    def __repr__(self):
+        return 'MatchIndex(%r)' % self.path
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def _load(self):
+        """Loads the entries of the index file."""
+        self.__file.seek(0)
+        data = self.__file.read()
+        header = self.__header__
+        offset = 0
+        while offset + header.size <= len(data):
+            hashed, size = header.unpack_from(data, offset)
+            end = offset + header.size + max(0, size)
+            if end > len(data):
+                break
+            self.__entries[hashed] = size >= 0 and \
+                data[offset + header.size:end] or None
+            offset = end
+        if offset < len(data):
+            self.__file.truncate(offset)
+
+    @staticmethod
+    def hash(artist, title):
+        """Returns the 64 bits hash of the :py:func:`key` of a row."""
+        digest = hashlib.sha1(key(artist, title).encode('utf-8')).digest()
+        return struct.unpack('<q', digest[:8])[0]
+
+    def get(self, artist, title):
+        """
+        Returns the track :py:class:`dict` matching (**artist**, **title**),
+        or :py:data:`None` if unknown.
+
+        :raises: :py:exc:`musixmatch.api.Error` if known not to be found.
+        """
+        hashed = self.hash(artist, title)
+        try:
+            encoded = self.__entries[hashed]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if encoded is None:
+            raise api.Error(str(api.ResponseStatusCode(404)))
+        return jsonlib.backend.loads(encoded)
+
+    def add(self, artist, title, track=None):
+        """
+        Indexes **track** as matching (**artist**, **title**), or, if
+        undefined, (**artist**, **title**) as not found.
+        """
+        hashed = self.hash(artist, title)
+        encoded = track is not None and \
+            json.dumps(track, separators=(',', ':')) or None
+        with self.__lock:
+            self.__entries[hashed] = encoded
+            if self.__file is not None:
+                size = encoded is None and -1 or len(encoded)
+                self.__file.write(self.__header__.pack(hashed, size) +
+                    (encoded or ''))
+                self.__file.flush()
+
+    def close(self):
+        """Closes the index file."""
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+class BulkMatcher(object):
+    """
+    Matches rows, running at most **concurrency** requests at a time. The
+    artist and the title of each row are found in the **artist** and
+    **title** columns. Each request must complete within **deadline**
+    seconds, if given.
+
+    The matcher counts the rows **matched**, not found (**missed**),
+    **failed**, and **skipped** as duplicates or already matched.
+    """
+
+    def __init__(self, concurrency=8, artist='artist', title='title',
+                 deadline=None):
+        self.concurrency = concurrency
+        self.artist = artist
+        self.title = title
+        self.deadline = deadline
+        self.matched = 0
+        self.missed = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def __repr__(self):
+        return 'BulkMatcher(concurrency=%r)' % self.concurrency
+
+    def _match(self, row, row_key):
+        """Returns the result of matching **row**, whose key is **row_key**."""
+        result = { 'key': row_key, 'row': row }
+        try:
+            message = matcher.track.get(q_artist=row.get(self.artist) or '',
+                q_track=row.get(self.title) or '', deadline=self.deadline)
+            result['status'] = int(message.status_code)
+            if message.status_code:
+                result['track'] = dict(Track.fromResponseMessage(message))
+        except Exception, e:
+            result['error'] = '%s: %s' % (type(e).__name__, e)
+        return result
+
+    def _count(self, result):
+        if 'track' in result:
+            self.matched += 1
+        elif result.get('status') == 404:
+            self.missed += 1
+        else:
+            self.failed += 1
+        return result
+
+    def match(self, rows, skip=()):
+        """
+        A generator of the results of matching **rows**, in the same order,
+        skipping those whose key is in **skip** or already seen. Each result
+        is a :py:class:`dict` with the row **key**, the **row** itself, and
+        either the response message **status**, and the **track** if found,
+        or the **error** raised.
+        """
+        seen = set(skip)
+        pending = deque()
+        executor = futures.ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            for row in rows:
+                row_key = key(row.get(self.artist) or '',
+                    row.get(self.title) or '')
+                if row_key in seen:
+                    self.skipped += 1
+                    continue
+                seen.add(row_key)
+                pending.append(executor.submit(self._match, row, row_key))
+                # Bounds memory to a few results per worker
+                while len(pending) > 2 * self.concurrency:
+                    yield self._count(pending.popleft().result())
+            while pending:
+                yield self._count(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown()
+
+    def run(self, source, output, format=None):
+        """
+        Matches the rows of file **source**, appending the results to file
+        **output**. Rows already matched in **output** are skipped. Returns
+        the number of results written.
+        """
+        written = 0
+        skip = done(output)
+        with open(output, 'ab') as results:
+            for result in self.match(read(source, format), skip):
+                results.write(json.dumps(result, sort_keys=True) + '\n')
+                results.flush()
+                written += 1
+        return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m musixmatch.matching',
+        description='Matches (artist, title) rows against musiXmatch.')
+    parser.add_argument('source', help='CSV or JSONL file of rows')
+    parser.add_argument('output', help='JSONL file of results, and '
+        'checkpoint of the job')
+    parser.add_argument('--format', choices=('csv', 'jsonl'),
+        help='format of source, by default its extension')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--artist', default='artist',
+        help='artist column name')
+    parser.add_argument('--title', default='title', help='title column name')
+    parser.add_argument('--deadline', type=float,
+        help='seconds allowed to each request')
+    parser.add_argument('--apikey', help='by default musixmatch_apikey')
+    arguments = parser.parse_args(argv)
+    if arguments.apikey:
+        musixmatch.apikey = arguments.apikey
+    bulk = BulkMatcher(arguments.concurrency, arguments.artist,
+        arguments.title, arguments.deadline)
+    bulk.run(arguments.source, arguments.output, arguments.format)
+    sys.stderr.write('matched %i, missed %i, failed %i, skipped %i\n' % (
+        bulk.matched, bulk.missed, bulk.failed, bulk.skipped))
+    return bulk.failed and 1 or 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+This module provides retry policies for :py:class:`musixmatch.api.Request`.
+Round trips failing because of network errors, *5xx* or *402* status codes
+are retried after an exponential, jittered, backoff, and slow calls to
+idempotent methods can be hedged: a second copy is sent once the first one
+takes longer than usual, and whichever answers first wins.
+
+>>> import musixmatch.api, musixmatch.retry
+>>> musixmatch.api.Request.__retry__ = musixmatch.retry.RetryPolicy(
+...     network=3, server=2, quota=1, hedge=True)
+>>> musixmatch.api.Request.__retry__ = None
+"""
+import musixmatch
+__license__ = musixmatch.__license__
+__author__ = musixmatch.__author__
+
+from musixmatch import api
+from concurrent import futures
+from collections import deque
+import threading
+import httplib
+import random
+import time
+import sys
+
+class RetryPolicy(object):
+    """
+    Retries a round trip up to **network** times on network errors, up to
+    **server** times on *5xx* status codes or unparsable responses, and up to
+    **quota** times on *402* status codes. Before the n-th retry, it sleeps a
+    random time between 0 and **backoff** * 2 ** n seconds, but no more than
+    **cap** seconds. Once the retries are exhausted, the last error is raised,
+    or the last response message is returned.
+
+    >>> from musixmatch.retry import RetryPolicy
+    >>> policy = RetryPolicy(backoff=1, random=lambda: 1)
+    >>> [ policy.delay(n) for n in range(3) ]
+    [1, 2, 4]
+
+    If **hedge** is True, calls to methods other than *...post* are hedged
+    after **hedge_delay** seconds or, if undefined, after the **percentile**
+    of the last **window** latencies of the same method. Hedged round trips
+    run on a pool of **workers** threads.
+
+    The policy counts the **retried** and the **hedged** round trips.
+    """
+    __transient__ = (IOError, httplib.HTTPException)
+
+    def __init__(self, network=2, server=2, quota=0, backoff=0.5, cap=30,
+                 hedge=False, hedge_delay=None, percentile=95, window=100,
+                 workers=8, sleep=time.sleep, random=random.random):
+        self.retries = { 'network': network, 'server': server, 'quota': quota }
+        self.backoff = backoff
+        self.cap = cap
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.percentile = percentile
+        self.window = window
+        self.workers = workers
+        self.sleep = sleep
+        self.random = random
+        self.retried = 0
+        self.hedged = 0
+        self.__lock = threading.Lock()
+        self.__latencies = {}
+        self.__executor = None
+
+    def __repr__(self):
+        return 'RetryPolicy(network=%(network)r, server=%(server)r, ' \
+            'quota=%(quota)r)' % self.retries
+
+    def classify(self, message=None, error=None):
+        """
+        Returns the kind of failure, *network*, *server* or *quota*, of a
+        round trip which returned **message** or raised **error**, or
+        :py:data:`None` if it should not be retried.
+        """
+        if error is not None:
+            if isinstance(error, api.ResponseMessageError):
+                return 'server'
+            if isinstance(error, self.__transient__):
+                return 'network'
+            return None
+        try:
+            status_code = message.status_code
+        except api.ResponseMessageError:
+            return 'server'
+        if status_code >= 500:
+            return 'server'
+        if status_code == 402:
+            return 'quota'
+        return None
+
+    def delay(self, retry):
+        """Returns the seconds to sleep before the **retry**-th retry."""
+        return self.random() * min(self.cap, self.backoff * 2 ** retry)
+
+    def latency(self, api_method):
+        """
+        Returns the hedging delay of **api_method**, or :py:data:`None` if it
+        should not be hedged (yet).
+        """
+        if not self.hedge or api_method.endswith('.post'):
+            return None
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        with self.__lock:
+            latencies = sorted(self.__latencies.get(api_method, ()))
+        if len(latencies) < min(10, self.window):
+            return None
+        position = len(latencies) * self.percentile // 100 - 1
+        return latencies[max(0, min(len(latencies) - 1, position))]
+
+    def _timed(self, api_method, attempt, args):
+        """Runs **attempt**, recording its latency if successful."""
+        start = time.time()
+        message = attempt(*args)
+        with self.__lock:
+            if not api_method in self.__latencies:
+                self.__latencies[api_method] = deque(maxlen=self.window)
+            self.__latencies[api_method].append(time.time() - start)
+        return message
+
+    def _hedged(self, api_method, attempt, args, deadline):
+        """Runs **attempt**, hedging it if it takes too long."""
+        delay = self.latency(api_method)
+        if delay is None:
+            return self._timed(api_method, attempt, args)
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = futures.ThreadPoolExecutor(
+                    max_workers=self.workers)
+        submit = self.__executor.submit
+        first = submit(self._timed, api_method, attempt, args)
+        done, pending = futures.wait([first], timeout=delay)
+        if not done:
+            self.hedged += 1
+            second = submit(self._timed, api_method, attempt, args)
+            done, pending = futures.wait([first, second],
+                timeout=deadline and deadline.remaining(),
+                return_when=futures.FIRST_COMPLETED)
+            if not done:
+                raise api.DeadlineExceeded('Deadline expired')
+        winner = done.pop()
+        if winner.exception() is not None and pending:
+            try:
+                return pending.pop().result(deadline and deadline.remaining())
+            except futures.TimeoutError:
+                raise api.DeadlineExceeded('Deadline expired')
+        return winner.result()
+
+    def run(self, api_method, attempt, args=(), deadline=None):
+        """
+        Calls **attempt** with **args**, a round trip of **api_method**
+        returning a :py:class:`musixmatch.api.ResponseMessage`, according to
+        the policy. No retry is made if it would not end before the
+        :py:class:`musixmatch.api.Deadline` **deadline**.
+        """
+        retried = dict.fromkeys(self.retries, 0)
+        while True:
+            message = error = None
+            try:
+                message = self._hedged(api_method, attempt, args, deadline)
+            except Exception, error:
+                exc_info = sys.exc_info()
+            kind = self.classify(message, error)
+            delay = self.delay(sum(retried.values()))
+            if kind is None or retried[kind] >= self.retries[kind] or \
+                    deadline is not None and deadline.remaining() <= delay:
+                if error is not None:
+                    raise exc_info[0], exc_info[1], exc_info[2]
+                return message
+            self.sleep(delay)
+            retried[kind] += 1
+            self.retried += 1
@@ -0,0 +1,138 @@
+"""
+This module provides a client side rate limiter, to keep API calls within the
+per hour quota instead of finding out through *402* status codes:
+
+>>> import musixmatch.api, musixmatch.throttle
+>>> musixmatch.api.Request.__throttle__ = musixmatch.throttle.RateLimiter(
+...     per_second=5, per_hour=2000)
+>>> musixmatch.api.Request.__throttle__ = None
+"""
+import musixmatch
+__license__ = musixmatch.__license__
+__author__ = musixmatch.__author__
+
+from musixmatch import api
+from contextlib import contextmanager
+import threading
+import fcntl
+import json
+import time
+
+class RateLimiter(object):
+    """
+    A thread safe token bucket rate limiter. :py:meth:`acquire` blocks until
+    a call is allowed by both the **per_second** and the **per_hour** budgets
+    (either can be :py:data:`None`, meaning unlimited). Each budget can be
+    spent in bursts, as long as the average rate is respected. Budgets can
+    be fractional, like one call every two seconds (*0.5* per second).
+
+    When a *402* status code is reported to :py:meth:`feedback`, calls are
+    suspended for **backoff** seconds, doubling on each further *402* up to
+    an hour, and the hourly budget is emptied.
+
+    If **path** is given, the limiter state is kept in that file, locked on
+    each access, so that the processes running on the same host share the
+    same budgets.
+
+    >>> from musixmatch.throttle import RateLimiter
+    >>> limiter = RateLimiter(per_second=10)
+    >>> limiter.acquire()
+    0
+    """
+
+    def __init__(self, per_second=None, per_hour=None, backoff=60, path=None,
+                 clock=time.time, sleep=time.sleep):
+        self.per_second = per_second
+        self.per_hour = per_hour
+        self.backoff = backoff
+        self.path = path
+        self.clock = clock
+        self.sleep = sleep
+        self.__lock = threading.Lock()
+        self.__state = {}
+
+    def __repr__(self):
+        return 'RateLimiter(per_second=%r, per_hour=%r)' % (
+            self.per_second, self.per_hour)
+
+    @contextmanager
+    def _state(self):
+        """
+        A context manager yielding the limiter state, locked against other
+        threads and, if the state is kept in **path**, other processes.
+        """
+        with self.__lock:
+            if self.path is None:
+                yield self.__state
+                return
+            with open(self.path, 'a+') as shared:
+                fcntl.flock(shared, fcntl.LOCK_EX)
+                shared.seek(0)
+                content = shared.read()
+                state = content and json.loads(content) or {}
+                yield state
+                shared.seek(0)
+                shared.truncate()
+                shared.write(json.dumps(state))
+                shared.flush()
+
+    def _take(self, state, now):
+        """
+        Takes a token from each bucket of **state**, if they all have one.
+        Returns how many seconds to wait before trying again, or 0.
+        """
+        wait = state.get('until', 0) - now
+        # Buckets hold at least a whole token, or slow rates would never
+        # allow a call
+        buckets = [ (name, rate, max(1, capacity))
+            for name, rate, capacity in [
+                ('second', self.per_second, self.per_second),
+                ('hour', self.per_hour and self.per_hour / 3600.0,
+                    self.per_hour),
+            ] if rate ]
+        for name, rate, capacity in buckets:
+            tokens, stamp = state.get(name, (capacity, now))
+            tokens = min(capacity, tokens + (now - stamp) * rate)
+            state[name] = (tokens, now)
+            wait = max(wait, (1 - tokens) / rate)
+        if wait > 1e-6:
+            return wait
+        for name, rate, capacity in buckets:
+            state[name] = (state[name][0] - 1, now)
+        return 0
+
+    def acquire(self, deadline=None):
+        """
+        Blocks until a call is allowed, and returns the seconds waited.
+
+        :raises: :py:exc:`musixmatch.api.DeadlineExceeded` if the call would
+                 not be allowed before the :py:class:`musixmatch.api.Deadline`
+                 **deadline**.
+        """
+        waited = 0
+        while True:
+            with self._state() as state:
+                wait = self._take(state, self.clock())
+            if not wait:
+                return waited
+            if deadline is not None and deadline.remaining() < wait:
+                raise api.DeadlineExceeded('Deadline expired')
+            self.sleep(wait)
+            waited += wait
+
+    def feedback(self, status_code):
+        """
+        Reports the **status_code** of a call. A *402* suspends calls,
+        any other status code resets the backoff.
+        """
+        with self._state() as state:
+            if status_code == 402:
+                penalties = state.get('penalties', 0) + 1
+                now = self.clock()
+                state['penalties'] = penalties
+                state['until'] = now + min(3600,
+                    self.backoff * 2 ** (penalties - 1))
+                if self.per_hour:
+                    state['hour'] = (0, now)
+            elif state.get('penalties'):
+                state['penalties'] = 0
@@ -16,8 +16,10 @@ __license__ = musixmatch.__license__
 __author__ = musixmatch.__author__
 
 from musixmatch import api, lyrics, subtitle
-from musixmatch.base import Item, ItemsCollection
+from musixmatch.base import Item, ItemsCollection, Record, Schema
 from musixmatch.ws import track, matcher, album
+from concurrent import futures
+from functools import partial
 
 _marker=object()
 
@@ -49,9 +51,20 @@ class Track(Item):
 
     Keyword access have been overloaded thanks to the :py:meth:`get` method
     which will eventually fetch the matching lyrics or subtitle.
+
+    If **__match_index__** is set, for example to a
+    :py:class:`musixmatch.matching.MatchIndex`, :py:meth:`fromMatcher`
+    looks the results up there first.
     """
     __api_method__ = track.get
-    
+    __special__ = {
+        'lyrics': lyrics.Lyrics,
+        'subtitle': subtitle.Subtitle,
+    }
+    __match_index__ = None
+    __match_keywords__ = frozenset(['q_track', 'q_artist', 'apikey', 'format',
+        'deadline'])
+
     @classmethod
     def fromMatcher(cls, **keywords):
         """
@@ -61,30 +74,46 @@ class Track(Item):
 
         :param q_track: words to be searched among track titles
         :param q_artist: words to be searched among artist names
+
+        If **__match_index__** is set, and no other keyword is given, known
+        results are returned, or raised, without any request, and new ones
+        are added to the index.
         """
-        return cls.fromResponseMessage(matcher.track.get(**keywords))
+        index = cls.__match_index__
+        if index is None or not cls.__match_keywords__.issuperset(keywords):
+            return cls.fromResponseMessage(matcher.track.get(**keywords))
+        artist = keywords.get('q_artist', '')
+        title = keywords.get('q_track', '')
+        dictionary = index.get(artist, title)
+        if dictionary is not None:
+            return cls.fromDictionary(dictionary)
+        message = matcher.track.get(**keywords)
+        if int(message.status_code) == 404:
+            index.add(artist, title)
+        item = cls.fromResponseMessage(message)
+        index.add(artist, title, dict(item))
+        return item
 
-    def get(self, key, default=_marker):
+    def get(self, key, default=_marker, deadline=None):
         """
         If key is *lyrics* or *subtitle* try to query api for proper value,
         and build an :py:class:`musixmatch.lyrics.Lyrics` or
-        :py:class:`musixmatch.subtitle.Subtitle`. Access to the above mentioned
-        keys may fail with :py:exc:`musixmatch.api.Error`. Once fetched, the
-        result is saved.
-        """
-        special = {
-            'lyrics': lyrics.Lyrics,
-            'subtitle': subtitle.Subtitle,
-        }
-        if key in special and not key in self:
-            self[key] = special[key](track_id=self['track_id'])
+        :py:class:`musixmatch.subtitle.Subtitle`, within **deadline** if
+        given. Access to the above mentioned keys may fail with
+        :py:exc:`musixmatch.api.Error`. Once fetched, the result is saved.
+        """
+        if key in self.__special__ and not key in self:
+            self[key] = self.__special__[key](track_id=self['track_id'],
+                deadline=deadline)
         value = dict.get(self, key, default)
         if value == _marker:
             raise KeyError, key
         return value
 
     def __getitem__(self, key):
-        return self.get(key)
+        if key in self.__special__:
+            return self.get(key)
+        return dict.__getitem__(self, key)
 
     def postFeedback(self, feedback):
         """
@@ -113,12 +142,54 @@ class Track(Item):
         else:
             raise TypeError, '%r not in %r' % (feedback, accepted)
 
+class TrackRecord(Record):
+    """
+    This class builds a compact, read only, representation of a
+    :py:class:`Track`. Artist and album names and lyrics languages are
+    interned. Unlike a :py:class:`Track`, it does not fetch lyrics or
+    subtitle.
+    """
+    __slots__ = ()
+    __item__ = Track
+    __schema__ = Schema(('artist_name', 'album_name', 'lyrics_language'))
+
 class TracksCollection(ItemsCollection):
     """
     This class build a :py:class:`list` like object representing a tracks
     collection. It accepts :py:class:`dict` or :py:class:`Track` objects.
     """
     __allowedin__ = Track
+    __record__ = TrackRecord
+
+    def hydrate(self, fields=('lyrics', 'subtitle'), concurrency=None,
+                deadline=None):
+        """
+        Fetches the **fields** (*lyrics* and/or *subtitle*) missing from the
+        tracks in this collection, running at most **concurrency** requests at
+        a time, by default :py:attr:`musixmatch.api.Request.__concurrency__`.
+        Requests run on a pool of their own, not on the shared
+        :py:attr:`musixmatch.api.Request.__executor__`, which may be running
+        this very call. Fetched values are saved in each :py:class:`Track`, just like
+        :py:meth:`Track.get` does. A **deadline** bounds the whole operation,
+        values not fetched in time fail with
+        :py:exc:`musixmatch.api.DeadlineExceeded`.
+
+        Returns a :py:class:`list` of (track, field, error) tuples, one for
+        each value which could not be fetched.
+        """
+        for field in fields:
+            if not field in Track.__special__:
+                raise KeyError, field
+        missing = [ (t, f) for t in self for f in fields if not f in t ]
+        deadline = api.Deadline.of(deadline)
+        executor = futures.ThreadPoolExecutor(
+            max_workers=concurrency or api.Request.__concurrency__)
+        try:
+            results, errors = api.batch([ partial(t.get, f, deadline=deadline)
+                for t, f in missing ], executor)
+        finally:
+            executor.shutdown()
+        return [ missing[i] + (errors[i],) for i in sorted(errors) ]
 
     @classmethod
     def fromAlbum(cls, **keywords):
@@ -169,3 +240,72 @@ class TracksCollection(ItemsCollection):
                              (automatic if q_lyrics is set)
         """
         return cls.fromResponseMessage(track.chart.get(**keywords))
+
+    @classmethod
+    def iterAlbum(cls, **keywords):
+        """
+        This classmethod returns a generator of the :py:class:`Track` objects
+        of all the pages of a **album.tracks.get**
+        :py:class:`musixmatch.api.Method` call. See
+        :py:meth:`musixmatch.base.ItemsCollection.paginate`.
+
+        :param album_id: musiXmatch album ID
+        :param page_size: desired number of items per result page
+        :param prefetch: number of pages fetched ahead
+        :param limit: maximum number of items
+        """
+        return cls.paginate(album.tracks.get, **keywords)
+
+    @classmethod
+    def iterSearch(cls, **keywords):
+        """
+        This classmethod returns a generator of the :py:class:`Track` objects
+        of all the pages of a **track.search**
+        :py:class:`musixmatch.api.Method` call, accepting the same keywords
+        as :py:meth:`fromSearch`. See
+        :py:meth:`musixmatch.base.ItemsCollection.paginate`::
+
+           for track in TracksCollection.iterSearch(q='love', page_size=100,
+                                                    prefetch=2):
+               pass
+
+        :param page_size: desired number of items per result page
+        :param prefetch: number of pages fetched ahead
+        :param limit: maximum number of items
+        """
+        return cls.paginate(track.search, **keywords)
+
+    @classmethod
+    def iterChart(cls, **keywords):
+        """
+        This classmethod returns a generator of the :py:class:`Track` objects
+        of all the pages of a **track.chart.get**
+        :py:class:`musixmatch.api.Method` call. See
+        :py:meth:`musixmatch.base.ItemsCollection.paginate`.
+
+        :param country: the country code of the desired country chart
+        :param f_has_lyrics: exclude tracks without an available lyrics
+        :param page_size: desired number of items per result page
+        :param prefetch: number of pages fetched ahead
+        :param limit: maximum number of items
+        """
+        return cls.paginate(track.chart.get, **keywords)
+
+    @classmethod
+    def fromCharts(cls, countries, **keywords):
+        """
+        This classmethod fetches the **track.chart.get**
+        :py:class:`musixmatch.api.Method` pages of many countries
+        concurrently, returning a (snapshot, failures) tuple: see
+        :py:meth:`musixmatch.base.ItemsCollection.snapshot`::
+
+           snapshot, failures = TracksCollection.fromCharts(['us', 'it'],
+                                                            pages=2)
+
+        :param countries: the country codes of the desired country charts
+        :param pages: number of pages fetched for each country
+        :param page_size: desired number of items per result page
+        :param concurrency: maximum number of requests at a time
+        :param f_has_lyrics: exclude tracks without an available lyrics
+        """
+        return cls.snapshot(track.chart.get, countries, **keywords)
@@ -0,0 +1,217 @@
+"""
+This module provides the HTTP transport used by :py:class:`musixmatch.api.Request`.
+Instead of opening a new TCP connection for every API call, like
+:py:func:`urllib.urlopen` does, a :py:class:`ConnectionPool` keeps HTTP/1.1
+connections alive and reuses them:
+
+>>> from musixmatch.transport import ConnectionPool
+>>> pool = ConnectionPool(maxsize=2, idle_timeout=30)
+>>> pool.maxsize
+2
+
+The pool honours the **http_proxy** environment variable, just like
+:py:mod:`urllib` does, so the caching proxy setup suggested in the README keeps
+working.
+"""
+import musixmatch
+__license__ = musixmatch.__license__
+__author__ = musixmatch.__author__
+
+from urllib import getproxies, proxy_bypass, unquote
+from urlparse import urlsplit
+from base64 import b64encode
+import httplib
+import socket
+import threading
+import time
+import os
+
+class ConnectionPool(object):
+    """
+    A thread safe pool of keep-alive HTTP connections. Connections are grouped
+    by host (or by proxy, if any), and at most **maxsize** connections per
+    host are opened at the same time: further checkouts wait for a connection
+    to be released. Connections which stay idle longer than **idle_timeout**
+    seconds are closed and evicted on the next checkout.
+
+    If **maxsize** is undefined, environment variable **musixmatch_poolsize**
+    will be used, defaulting to 4. If **proxies** is undefined, the
+    :py:func:`urllib.getproxies` mapping will be used.
+
+    Opening a connection times out after **connect_timeout** seconds, and
+    waiting for response data after **read_timeout** seconds, raising
+    :py:exc:`socket.timeout`. Either can be :py:data:`None`, meaning no
+    timeout.
+
+    The pool keeps count of the connections it opened and of the checkouts
+    served by an already open connection, in **opened** and **reused**.
+    """
+
+    def __init__(self, maxsize=None, idle_timeout=60, proxies=None,
+                 connect_timeout=10, read_timeout=60):
+        self.maxsize = maxsize or \
+            int(os.environ.get('musixmatch_poolsize', 4))
+        self.idle_timeout = idle_timeout
+        self.proxies = getproxies() if proxies is None else proxies
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.opened = 0
+        self.reused = 0
+        self.__condition = threading.Condition()
+        self.__idle = {}
+        self.__busy = {}
+
+    def __repr__(self):
+        return 'ConnectionPool(maxsize=%r, idle_timeout=%r)' % (
+            self.maxsize, self.idle_timeout)
+
+    def _route(self, url):
+        """
+        Returns a tuple of (pool key, connection class, host, request target,
+        headers) to be used to fetch **url**.
+        """
+        scheme, netloc, path, query, fragment = urlsplit(url)
+        target = query and '%s?%s' % (path or '/', query) or path or '/'
+        headers = { 'Host': netloc }
+        host = netloc
+        proxy = self.proxies.get(scheme)
+        if proxy and not proxy_bypass(netloc.split(':')[0]):
+            proxy = urlsplit(proxy)
+            host = proxy.netloc.rsplit('@', 1)[-1]
+            target = url
+            if '@' in proxy.netloc:
+                credentials = unquote(proxy.netloc.rsplit('@', 1)[0])
+                headers['Proxy-Authorization'] = 'Basic %s' % \
+                    b64encode(credentials)
+            scheme = proxy.scheme or 'http'
+        connection_class = {
+            'http': httplib.HTTPConnection,
+            'https': httplib.HTTPSConnection,
+        }.get(scheme, None)
+        if not connection_class:
+            raise ValueError("Unsupported scheme `%s'" % scheme)
+        return (scheme, host), connection_class, host, target, headers
+
+    def _acquire(self, key, connection_class, host, timeout=None):
+        """
+        Checks out a connection for **key**, waiting at most **timeout**
+        seconds if the per host limit was reached. Returns a tuple of
+        (connection, reused).
+        """
+        expires = timeout is not None and time.time() + timeout
+        with self.__condition:
+            while True:
+                idle = self.__idle.setdefault(key, [])
+                now = time.time()
+                while idle and self.idle_timeout is not None and \
+                        now - idle[0][0] > self.idle_timeout:
+                    idle.pop(0)[1].close()
+                if idle:
+                    self.__busy[key] = self.__busy.get(key, 0) + 1
+                    self.reused += 1
+                    return idle.pop()[1], True
+                if self.__busy.get(key, 0) < self.maxsize:
+                    self.__busy[key] = self.__busy.get(key, 0) + 1
+                    self.opened += 1
+                    break
+                if expires is False:
+                    self.__condition.wait()
+                elif expires > time.time():
+                    self.__condition.wait(expires - time.time())
+                else:
+                    raise socket.timeout('No connection available')
+        return connection_class(host), False
+
+    def _release(self, key, connection, reusable):
+        """
+        Checks in a connection. If not **reusable**, it gets closed.
+        """
+        with self.__condition:
+            self.__busy[key] -= 1
+            if reusable:
+                self.__idle.setdefault(key, []).append(
+                    (time.time(), connection))
+            else:
+                connection.close()
+            self.__condition.notify()
+
+    def idle(self):
+        """Returns the number of idle connections kept alive."""
+        with self.__condition:
+            return sum(len(i) for i in self.__idle.values())
+
+    def clear(self):
+        """Closes all the idle connections."""
+        with self.__condition:
+            for idle in self.__idle.values():
+                while idle:
+                    idle.pop()[1].close()
+
+    def urlopen(self, url, timeout=None):
+        """
+        Sends a GET request for **url** and returns a :py:class:`PooledResponse`.
+        A request failing on a reused connection, which the server may have
+        closed meanwhile, is sent again on a brand new one, unless it timed
+        out.
+
+        A **timeout**, in seconds, lowers both the connect and the read
+        timeouts of this request, and bounds the wait for a free connection.
+        It bounds the whole call, the request sent again included.
+        """
+        key, connection_class, host, target, headers = self._route(url)
+        least = lambda *values: min([ v for v in values if v is not None ]
+            or [None])
+        expires = timeout is not None and time.time() + timeout
+        while True:
+            if expires:
+                timeout = max(0, expires - time.time())
+            connection, reused = self._acquire(key, connection_class, host,
+                timeout)
+            try:
+                if connection.sock is None:
+                    connection.timeout = least(self.connect_timeout, timeout)
+                    connection.connect()
+                    connection.sock.setsockopt(
+                        socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                connection.sock.settimeout(least(self.read_timeout, timeout))
+                connection.request('GET', target, headers=headers)
+                response = connection.getresponse()
+            except (httplib.HTTPException, socket.error), e:
+                self._release(key, connection, False)
+                if reused and not isinstance(e, socket.timeout):
+                    continue
+                raise
+            return PooledResponse(self, key, connection, response)
+
+class PooledResponse(object):
+    """
+    A file like object wrapping an :py:class:`httplib.HTTPResponse`. Closing
+    a :py:class:`PooledResponse` gives the connection back to its
+    :py:class:`ConnectionPool` if the response body was entirely read and the
+    server agreed to keep the connection alive, otherwise the connection
+    gets closed.
+    """
+
+    def __init__(self, pool, key, connection, response):
+        self.__pool = pool
+        self.__key = key
+        self.__connection = connection
+        self.__response = response
+        self.status = response.status
+        self.reason = response.reason
+
+    def read(self, *amount):
+        return self.__response.read(*amount)
+
+    def getheader(self, name, default=None):
+        return self.__response.getheader(name, default)
+
+    def close(self):
+        if self.__connection is not None:
+            reusable = self.__response.isclosed() and \
+                not self.__response.will_close
+            self.__response.close()
+            self.__pool._release(self.__key, self.__connection, reusable)
+            self.__connection = None
+
+pool = ConnectionPool()
@@ -25,6 +25,7 @@ egg = {
     'download_url': '%s/dists' % url,
     'classifiers': pkg.__classifiers__,
     'packages': [name],
+    'install_requires': ['futures'],
     'include_package_data': True,
     'exclude_package_data': {name: ["*.rst", "docs", "tests"]},
     'test_suite': 'tests.suite'}
@@ -8,6 +8,15 @@ import lyrics
 import subtitle
 import track
 import album
+import transport
+import aws
+import cache
+import throttle
+import retry
+import breaker
+import jsonlib
+import matching
+import fulltext
 
 suite = TestSuite()
 suite.addTest(defaultTestLoader.loadTestsFromModule(api))
@@ -17,6 +26,15 @@ suite.addTest(defaultTestLoader.loadTestsFromModule(lyrics))
 suite.addTest(defaultTestLoader.loadTestsFromModule(subtitle))
 suite.addTest(defaultTestLoader.loadTestsFromModule(track))
 suite.addTest(defaultTestLoader.loadTestsFromModule(album))
+suite.addTest(defaultTestLoader.loadTestsFromModule(transport))
+suite.addTest(defaultTestLoader.loadTestsFromModule(aws))
+suite.addTest(defaultTestLoader.loadTestsFromModule(cache))
+suite.addTest(defaultTestLoader.loadTestsFromModule(throttle))
+suite.addTest(defaultTestLoader.loadTestsFromModule(retry))
+suite.addTest(defaultTestLoader.loadTestsFromModule(breaker))
+suite.addTest(defaultTestLoader.loadTestsFromModule(jsonlib))
+suite.addTest(defaultTestLoader.loadTestsFromModule(matching))
+suite.addTest(defaultTestLoader.loadTestsFromModule(fulltext))
 # if os.environ.get('musixmatch_apikey', None):
 #     suite.addTest(defaultTestLoader.loadTestsFromModule(apikey))
 
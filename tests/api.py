@@ -1,5 +1,8 @@
 import unittest
 from musixmatch import *
+from tests.server import serving, reply
+import threading
+import time
 try:
     from cStringIO import StringIO
 except ImportError:
@@ -51,6 +54,43 @@ class TestXMLResponseMessage(unittest.TestCase):
         message = api.XMLResponseMessage(StringIO(self.message))
         self.assertEqual(isinstance(message.status_code, api.ResponseStatusCode), True)
 
+    def test__str__(self):
+        message = api.XMLResponseMessage(StringIO(self.message))
+        self.assertEqual(str(message).startswith('<message>'), True)
+
+    def test__getitem__(self):
+        message = api.XMLResponseMessage(StringIO(self.message))
+        self.assertEqual(message['header'], { 'status_code': '200' })
+        self.assertRaises(KeyError, message.__getitem__, 'missing')
+
+class TestXMLStream(unittest.TestCase):
+
+    message = """<message>
+    <header><status_code>200</status_code></header>
+    <body><track_list>
+        <track><track_id>1</track_id><genre_list>
+            <genre><genre_id>2</genre_id></genre>
+        </genre_list></track>
+        <track><track_id>3</track_id></track>
+    </track_list></body>
+</message>"""
+
+    def test_iterate(self):
+        stream = api.XMLStream(StringIO(self.message))
+        items = list(stream.iterate('body', 'track_list'))
+        self.assertEqual(items, [
+            { 'track': { 'track_id': '1',
+                'genre_list': [{ 'genre': { 'genre_id': '2' } }] } },
+            { 'track': { 'track_id': '3' } }])
+        self.assertEqual(stream.status_code, 200)
+        # Streamed elements are not kept
+        self.assertEqual(stream.message['body'], { 'track_list': [] })
+
+    def test_invalid(self):
+        stream = api.XMLStream(StringIO('<message><header>'))
+        self.assertRaises(api.ResponseMessageError, list,
+            stream.iterate('body', 'track_list'))
+
 class TestJsonResponseMessage(unittest.TestCase):
     message = """{"message":{
     "header":{
@@ -62,6 +102,73 @@ class TestJsonResponseMessage(unittest.TestCase):
         message = api.JsonResponseMessage(StringIO(self.message))
         self.assertEqual(isinstance(message.status_code, api.ResponseStatusCode), True)
 
+class TestLazyJsonResponseMessage(unittest.TestCase):
+
+    def test_status_code(self):
+        # The body is not decoded
+        message = api.LazyJsonResponseMessage(StringIO('{"message": '
+            '{"header": {"status_code": 404}, "body": {invalid}}}'))
+        self.assertEqual(message.status_code, 404)
+        self.assertRaises(api.ResponseMessageError, message.__getitem__,
+            'body')
+
+    def test_decode(self):
+        raw = '{"message": {"body": {"track": {"track_id": 292}}, ' \
+            '"header": {"status_code": 200}}}'
+        message = api.LazyJsonResponseMessage(StringIO(raw))
+        self.assertEqual(message.raw, raw)
+        self.assertEqual(message.status_code, 200)
+        self.assertEqual(message['body']['track']['track_id'], 292)
+        self.assertEqual(sorted(message.keys()), ['body', 'header'])
+        self.assertEqual(str(message), str(api.JsonResponseMessage(
+            StringIO(raw))))
+
+    def test_request(self):
+        formats = api.Request.__formats__
+        try:
+            with serving() as server:
+                api.Request.__formats__ = dict(formats,
+                    json=api.LazyJsonResponseMessage)
+                message = api.Method('track.search')(apikey='apikey', q='')
+        finally:
+            api.Request.__formats__ = formats
+        self.assertEqual(type(message), api.LazyJsonResponseMessage)
+        self.assertEqual(len(message['body']['track_list']), 3)
+
+class TestJsonStream(unittest.TestCase):
+
+    message = '{"message": {"header": {"status_code": 200}, ' \
+        '"body": {"count": 12345, "track_list": [{"track": {"id": 1}}, ' \
+        '{"track": {"id": 2, "name": "\\u00e8"}}, 3456]}}}'
+
+    def test_iterate(self):
+        stream = api.JsonStream(StringIO(self.message), chunk_size=1)
+        items = list(stream.iterate('body', 'track_list'))
+        self.assertEqual(items, [{ 'track': { 'id': 1 } },
+            { 'track': { 'id': 2, 'name': u'\xe8' } }, 3456])
+        self.assertEqual(stream.message['body']['count'], 12345)
+        self.assertEqual(stream.status_code, 200)
+
+    def test_incremental(self):
+        response = StringIO(self.message)
+        stream = api.JsonStream(response, chunk_size=16)
+        stream.iterate('body', 'track_list').next()
+        # The first item is yielded before the end of the message
+        self.assertEqual(response.tell() < len(self.message), True)
+
+    def test_missing(self):
+        message = '{"message": {"header": {"status_code": 404}, "body": []}}'
+        stream = api.JsonStream(StringIO(message))
+        self.assertEqual(list(stream.iterate('body', 'track_list')), [])
+        self.assertEqual(stream.status_code, 404)
+
+    def test_invalid(self):
+        stream = api.JsonStream(StringIO('{"message": {"header": [1, 2'))
+        self.assertRaises(api.ResponseMessageError, list,
+            stream.iterate('body', 'track_list'))
+        self.assertRaises(api.ResponseMessageError, getattr, stream,
+            'status_code')
+
 class TestQueryString(unittest.TestCase):
     def test__str__(self):
         keywords = { 'country': 'it', 'page': 1, 'page_size': 3 }
@@ -86,6 +193,165 @@ class TestMethod(unittest.TestCase):
         method = api.Method('test')
         self.assertEqual(hasattr(method, 'subtest'), True)
         self.assertEqual(hasattr(method, '__nothing__'), False)
+        self.assertEqual(type(method.subtest), api.Method)
+
+    def test_submit(self):
+        with serving() as server:
+            future = api.Method('track.search').submit(
+                apikey='apikey', q='test')
+            message = future.result()
+        self.assertEqual(bool(message.status_code), True)
+        self.assertEqual(server.requests[0].count('q=test'), 1)
+
+class TestDeadline(unittest.TestCase):
+
+    def test_remaining(self):
+        now = [0]
+        deadline = api.Deadline(10, clock=lambda: now[0])
+        self.assertEqual(deadline.timeout(), 10)
+        self.assertEqual(deadline.timeout(3), 3)
+        now[0] = 11
+        self.assertEqual(deadline.remaining(), 0)
+        self.assertEqual(deadline.timeout(3), 0)
+        self.assertEqual(deadline.expired, True)
+        self.assertRaises(api.DeadlineExceeded, deadline.check)
+        self.assertEqual(api.Deadline.of(deadline) is deadline, True)
+        self.assertEqual(api.Deadline.of(None), None)
+
+    def test_request(self):
+        def respond(path):
+            time.sleep(0.5)
+            return reply()
+        with serving(respond) as server:
+            start = time.time()
+            self.assertRaises(api.DeadlineExceeded, api.Method('track.get'),
+                apikey='apikey', track_id=1, deadline=0.1)
+            self.assertEqual(time.time() - start < 0.4, True)
+            self.assertRaises(api.DeadlineExceeded, api.Method('track.get'),
+                apikey='apikey', track_id=1, deadline=0)
+        self.assertEqual(len(server.requests), 1)
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_do(self):
+        flight = api.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        def slow():
+            started.set()
+            release.wait()
+            return object()
+        results = []
+        def call():
+            results.append(flight.do('key', slow))
+        threads = [ threading.Thread(target=call) for i in range(5) ]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        while flight.coalesced < 4:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual((flight.calls, flight.coalesced), (1, 4))
+        self.assertEqual(len(set(map(id, results))), 1)
+        # Finished calls are not shared
+        flight.do('key', object)
+        self.assertEqual(flight.calls, 2)
+
+    def test_exception(self):
+        def fail():
+            raise api.Error('failed')
+        flight = api.SingleFlight()
+        self.assertRaises(api.Error, flight.do, 'key', fail)
+
+    def test_deadline(self):
+        flight = api.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        def expiring():
+            started.set()
+            release.wait()
+            raise api.DeadlineExceeded('Deadline expired')
+        errors = []
+        def call():
+            try:
+                flight.do('key', expiring)
+            except api.DeadlineExceeded, e:
+                errors.append(e)
+        thread = threading.Thread(target=call)
+        thread.start()
+        started.wait()
+        results = []
+        waiter = threading.Thread(target=lambda:
+            results.append(flight.do('key', lambda: 42)))
+        waiter.start()
+        while flight.coalesced < 1:
+            time.sleep(0.01)
+        release.set()
+        thread.join()
+        waiter.join()
+        # The first caller deadline is not shared
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(results, [42])
+        self.assertEqual(flight.calls, 2)
+        # Waiting callers are bound by their own deadline
+        started.clear()
+        release.clear()
+        thread = threading.Thread(target=call)
+        thread.start()
+        started.wait()
+        self.assertRaises(api.DeadlineExceeded, flight.do, 'key', object,
+            deadline=api.Deadline(0.05))
+        release.set()
+        thread.join()
+
+    def test_interrupted(self):
+        flight = api.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        def interrupted():
+            started.set()
+            release.wait()
+            raise KeyboardInterrupt()
+        def call():
+            try:
+                flight.do('key', interrupted)
+            except KeyboardInterrupt:
+                pass
+        thread = threading.Thread(target=call)
+        thread.start()
+        started.wait()
+        results = []
+        waiter = threading.Thread(target=lambda:
+            results.append(flight.do('key', lambda: 42)))
+        waiter.daemon = True
+        waiter.start()
+        while flight.coalesced < 1:
+            time.sleep(0.01)
+        release.set()
+        thread.join()
+        waiter.join(5)
+        # Waiting callers run the call again
+        self.assertEqual(results, [42])
+
+class TestBatch(unittest.TestCase):
+
+    def test_batch(self):
+        def fail():
+            raise api.Error('failed')
+        with serving() as server:
+            requests = [ api.Request('track.get',
+                { 'track_id': i, 'format': 'json' }) for i in range(5) ]
+            requests.insert(2, fail)
+            results, errors = api.batch(requests)
+        self.assertEqual(len(results), 6)
+        self.assertEqual(results[2], None)
+        self.assertEqual(errors.keys(), [2])
+        self.assertEqual(str(errors[2]), 'failed')
+        for i in (0, 1, 3, 4, 5):
+            self.assertEqual(type(results[i]), api.JsonResponseMessage)
 
 if __name__ == '__main__':
     unittest.main()
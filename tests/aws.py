@@ -0,0 +1,46 @@
+import unittest
+from musixmatch import *
+from tests.server import serving
+
+class TestAsyncMethod(unittest.TestCase):
+
+    def setUp(self):
+        self.serving = serving()
+        self.server = self.serving.__enter__()
+
+    def tearDown(self):
+        self.serving.__exit__(None, None, None)
+
+    def test__getattribute__(self):
+        method = aws.AsyncMethod('test')
+        self.assertEqual(type(method.subtest), aws.AsyncMethod)
+        self.assertEqual(method.subtest, 'test.subtest')
+
+    def test__call__(self):
+        calls = [ aws.track.search(apikey='apikey', q=str(i))
+            for i in range(10) ]
+        for future in calls:
+            message = future.result()
+            self.assertEqual(type(message), api.JsonResponseMessage)
+            self.assertEqual(bool(message.status_code), True)
+        self.assertEqual(len(self.server.requests), 10)
+
+    def test_submit(self):
+        future = aws.track.search.submit(apikey='apikey', q='test')
+        self.assertEqual(type(future.result()), api.JsonResponseMessage)
+
+    def test_AsyncBuilder(self):
+        future = aws.TracksCollection.fromChart(apikey='apikey')
+        collection = future.result()
+        self.assertEqual(type(collection), track.TracksCollection)
+        self.assertEqual(len(collection), 3)
+        self.assertRaises(AttributeError, getattr, aws.TracksCollection,
+            'label')
+
+    def test_AsyncBuilder_fromCharts(self):
+        calls = [ aws.TracksCollection.fromCharts(['us', 'it'],
+            apikey='apikey') for i in range(2 * api.Request.__concurrency__) ]
+        for future in calls:
+            snapshot, failures = future.result(timeout=10)
+            self.assertEqual(sorted(snapshot), ['it', 'us'])
+            self.assertEqual(failures, [])
@@ -1,5 +1,10 @@
 import unittest
+import json
 from musixmatch import *
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from StringIO import StringIO
 
 class TestBase(unittest.TestCase):
 
@@ -39,10 +44,35 @@ class TestItem(TestBase):
         item = self.Class.fromDictionary(self.item)
         self.assertEqual(hash(item), self.item_hash)
 
+    def test_adopt(self):
+        dictionary = jsonlib.objects(json.dumps(self.item))
+        item = self.Class.adopt(dictionary)
+        # Adopted, not copied
+        self.assertEqual(item is dictionary, True)
+        self.assertEqual(type(item), self.Class)
+        copied = self.Class.adopt(self.item)
+        self.assertEqual(copied is self.item, False)
+        self.assertEqual(copied, item)
+
+    def test__identities__(self):
+        self.Class.__identities__ = base.IdentityMap()
+        try:
+            item = self.Class.fromDictionary(self.item)
+            newer = dict(self.item, newer_key='newer')
+            # Same identity, same object, updated
+            self.assertEqual(self.Class.fromDictionary(newer) is item, True)
+            self.assertEqual(self.Class(newer) is item, True)
+            self.assertEqual(item['newer_key'], 'newer')
+            del item
+            self.assertEqual(len(self.Class.__identities__), 0)
+        finally:
+            self.Class.__identities__ = None
+
 class TestCollection(unittest.TestCase):
 
     Class = base.ItemsCollection
     AllowedContent = base.ItemsCollection.allowedin()
+    CollectionClass = base.ItemsCollection
     item_list = 'item_list'
     item_id = 'item_id'
     item = 'item'
@@ -92,6 +122,47 @@ class TestCollection(unittest.TestCase):
         # Previously inserted item has shifted position
         self.assertEqual(collection[1], item)
 
+    def test__identities__(self):
+        allowed = self.CollectionClass.allowedin()
+        allowed.__identities__ = base.IdentityMap()
+        try:
+            saved = self.message['body'][self.item_list][0][self.item]
+            first, second = self.CollectionClass(), self.CollectionClass()
+            first.append(saved)
+            second.append(allowed.fromDictionary(saved))
+            # Collections share the same item
+            self.assertEqual(first[0] is second[0], True)
+        finally:
+            allowed.__identities__ = None
+
+    def test_fromResponseMessage(self):
+        raw = json.dumps({ 'message': self.message })
+        collection = self.CollectionClass.fromResponseMessage(
+            api.LazyJsonResponseMessage(StringIO(raw)))
+        expected = self.CollectionClass.fromResponseMessage(
+            api.JsonResponseMessage(StringIO(raw)))
+        self.assertEqual(collection, expected)
+        self.assertEqual(type(collection[0]), self.CollectionClass.allowedin())
+
+    def test_compact(self):
+        collection = self.CollectionClass.fromResponseMessage(
+            api.JsonResponseMessage(StringIO(json.dumps({
+                'message': self.message }))))
+        records = collection.compact()
+        self.assertEqual(len(records), len(collection))
+        for record, item in zip(records, collection):
+            self.assertEqual(type(record), self.CollectionClass.__record__)
+            # Same read API, no per instance dictionary
+            self.assertEqual(record, item)
+            self.assertEqual(hash(record), hash(item))
+            self.assertEqual(record[self.item_id], item[self.item_id])
+            self.assertEqual(sorted(record.keys()), sorted(item.keys()))
+            self.assertEqual(hasattr(record, '__dict__'), False)
+            self.assertEqual(record.expand(), item)
+            self.assertEqual(type(record.expand()), type(item))
+        self.assertRaises(KeyError, records[0].__getitem__, 'missing_key')
+        self.assertEqual(records[0].get('missing_key'), None)
+
     def test_append(self):
         collection = self.Class()
         saved = self.message['body'][self.item_list][1][self.item]
@@ -137,6 +208,29 @@ class TestCollection(unittest.TestCase):
         for i in range(3):
             self.assertEqual(type(collection[i]), self.AllowedContent)
 
+    def test_index(self):
+        items = [ i[self.item] for i in self.message['body'][self.item_list] ]
+        collection = self.CollectionClass(*items)
+        # Same identity, other content
+        other = dict(items[1], other_key='other')
+        self.assertEqual(other in collection, True)
+        self.assertEqual(collection.count(other), 1)
+        self.assertEqual(collection.index(other), 1)
+        self.assertRaises(ValueError, collection.index, other, 2)
+        collection.append(other)
+        self.assertEqual(len(collection), 3)
+        collection.insert(0, dict(items[0], **{ self.item_id: '1' }))
+        self.assertEqual(collection.index(items[2]), 3)
+        self.assertEqual(collection[1:].index(items[2]), 2)
+        self.assertEqual(collection.copy().index(items[0]), 1)
+        collection.remove(items[0])
+        self.assertEqual(items[0] in collection, False)
+        self.assertEqual(collection.index(items[1]), 1)
+        self.assertEqual(collection.pop()[self.item_id], items[2][self.item_id])
+        del collection[0]
+        self.assertEqual(collection.index(items[1]), 0)
+        self.assertEqual(len(collection), 1)
+
     # def test__setitem__(self):
     #     collection = self.Class(self.AllowedContent(
     #         self.message['body'][self.item_list][1][self.item]))
@@ -164,8 +258,32 @@ class TestCollection(unittest.TestCase):
             self.assertEqual(type(collection[i]), self.AllowedContent)
         page = collection.page(1,2)
         self.assertEqual(len(page), 1)
-        self.assertEqual(type(page), self.Class)
+        self.assertEqual(type(page), base.CollectionView)
         self.assertEqual(type(page[0]), self.AllowedContent)
+        self.assertEqual(type(page.materialize()), self.Class)
+        self.assertEqual(page.materialize(), page)
+
+    def test_view(self):
+        items = [ i[self.item] for i in self.message['body'][self.item_list] ]
+        collection = self.Class(*items)
+        view = collection[1:]
+        # Items are referenced, not copied
+        self.assertEqual(view[0] is collection[1], True)
+        self.assertEqual(view[-1] is collection[2], True)
+        self.assertRaises(IndexError, view.__getitem__, 2)
+        self.assertEqual(list(collection[::-1]), list(reversed(collection)))
+        self.assertEqual(list(collection[::2][1:]), [ collection[2] ])
+        self.assertEqual(list(collection[-2:][:1]), [ collection[1] ])
+        self.assertEqual(len(collection[5:]), 0)
+        self.assertEqual(collection[0] in view, False)
+        self.assertEqual(collection[2] in view, True)
+        self.assertRaises(ValueError, view.index, collection[0])
+        self.assertEqual(collection[::2].index(collection[2]), 1)
+        self.assertRaises(TypeError, view.__getitem__, 'key')
+        materialized = view.materialize()
+        self.assertEqual(type(materialized), self.Class)
+        self.assertEqual(materialized, view)
+        self.assertEqual(materialized.index(collection[2]), 1)
 
     def test_pages(self):
         items = [ i[self.item] for i in self.message['body'][self.item_list] ]
@@ -184,7 +302,7 @@ class TestCollection(unittest.TestCase):
         self.assertEqual(len(paged), 2)
         for i,l in zip(range(2), (2,1)):
             self.assertEqual(len(paged[i]), l)
-            self.assertEqual(type(paged[i]), self.Class)
+            self.assertEqual(type(paged[i]), base.CollectionView)
         for p,i in [(0,0),(0,1),(1,0)]:
             self.assertEqual(id(paged[p][i]), id(collection[(2*p)+i]))
 
@@ -196,7 +314,7 @@ class TestCollection(unittest.TestCase):
             self.assertEqual(type(collection[i]), self.AllowedContent)
         pager = []
         for page in collection.pager(2):
-            self.assertEqual(type(page), self.Class)
+            self.assertEqual(type(page), base.CollectionView)
             self.assertEqual(type(page[0]), self.AllowedContent)
             pager.append(page)
         self.assertEqual(len(pager), 2)
@@ -0,0 +1,137 @@
+import unittest
+import time
+from musixmatch import *
+from tests.server import serving, reply, response
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0
+        self.breaker = breaker.CircuitBreaker(threshold=0.5, volume=4,
+            window=10, cooldown=5, clock=lambda: self.now)
+        self.request = api.Request('track.get', track_id=1)
+
+    def call(self, *outcomes):
+        for outcome in outcomes:
+            ticket = self.breaker.allow(self.request)
+            if isinstance(outcome, Exception):
+                self.breaker.record(ticket, error=outcome)
+            else:
+                self.breaker.record(ticket, response(outcome))
+
+    def test_failed(self):
+        self.assertEqual(self.breaker.failed(response(200)), False)
+        self.assertEqual(self.breaker.failed(response(404)), False)
+        self.assertEqual(self.breaker.failed(response(401)), True)
+        self.assertEqual(self.breaker.failed(response(503)), True)
+        self.assertEqual(self.breaker.failed(error=IOError()), True)
+        self.assertEqual(self.breaker.failed(
+            error=api.DeadlineExceeded()), None)
+
+    def test_trip(self):
+        self.call(200, 200, 503)
+        self.assertEqual(self.breaker.state(), 'closed')
+        self.call(IOError())
+        self.assertEqual(self.breaker.state(), 'open')
+        self.assertRaises(api.CircuitOpen, self.breaker.allow, self.request)
+        self.assertEqual(self.breaker.rejected, 1)
+
+    def test_window(self):
+        self.call(503, 503, 503)
+        self.now = 11
+        # Old failures are forgotten
+        self.call(200)
+        self.assertEqual(self.breaker.state(), 'closed')
+
+    def test_half_open(self):
+        self.call(401, 401, 401, 401)
+        self.now = 5
+        self.assertEqual(self.breaker.states(), { ws.location: 'half-open' })
+        ticket = self.breaker.allow(self.request)
+        # A single trial at a time
+        self.assertRaises(api.CircuitOpen, self.breaker.allow, self.request)
+        self.breaker.record(ticket, response(503))
+        self.assertEqual(self.breaker.state(), 'open')
+        self.now = 10
+        self.call(200)
+        self.assertEqual(self.breaker.state(), 'closed')
+
+    def test_late_outcomes(self):
+        self.breaker.trials = 2
+        late = self.breaker.allow(self.request)
+        self.call(401, 401, 401, 401)
+        self.now = 5
+        first = self.breaker.allow(self.request)
+        second = self.breaker.allow(self.request)
+        # Calls let through before it opened don't close the circuit
+        self.breaker.record(late, response(200))
+        self.assertEqual(self.breaker.state(), 'half-open')
+        self.breaker.record(first, response(503))
+        self.assertEqual(self.breaker.state(), 'open')
+        self.now = 10
+        ticket = self.breaker.allow(self.request)
+        # Nor do trials of a previous opening
+        self.breaker.record(second, response(200))
+        self.assertEqual(self.breaker.state(), 'half-open')
+        self.breaker.record(ticket, error=api.DeadlineExceeded())
+        self.assertEqual(self.breaker.state(), 'half-open')
+        self.call(200)
+        self.assertEqual(self.breaker.state(), 'closed')
+
+    def test_per_method(self):
+        per_method = breaker.CircuitBreaker(per_method=True)
+        self.assertEqual(per_method.key(self.request),
+            ws.location + '/track.get')
+
+    def test_request(self):
+        def respond(path):
+            return reply(401)
+        try:
+            with serving(respond) as server:
+                api.Request.__breaker__ = self.breaker
+                for i in range(4):
+                    api.Method('track.get')(apikey='apikey', track_id=i)
+                self.assertRaises(api.CircuitOpen, api.Method('track.get'),
+                    apikey='apikey', track_id=5)
+        finally:
+            api.Request.__breaker__ = None
+        self.assertEqual(len(server.requests), 4)
+
+    def test_deadline(self):
+        def respond(path):
+            time.sleep(0.3)
+            return reply()
+        try:
+            with serving(respond) as server:
+                api.Request.__breaker__ = self.breaker
+                for i in range(4):
+                    self.assertRaises(api.DeadlineExceeded,
+                        api.Method('track.get'), apikey='apikey', track_id=i,
+                        deadline=0.1)
+                # Client side timeouts are not failures of the service
+                self.assertEqual(self.breaker.state(), 'closed')
+        finally:
+            api.Request.__breaker__ = None
+
+    def test_stream(self):
+        def respond(path):
+            status_code = 'q=open' in path and 503 or 200
+            return reply(status_code,
+                { 'track_list': [ { 'track': {} } ] * 2 })
+        def stream(q):
+            return api.Request('track.search', apikey='apikey',
+                format='json', q=q).stream('body', 'track_list')
+        try:
+            with serving(respond) as server:
+                api.Request.__breaker__ = self.breaker
+                for i in range(4):
+                    items = stream('closed')
+                    items.next()
+                    items.close()
+                # Streams closed before the end are not failures
+                self.assertEqual(self.breaker.state(), 'closed')
+                for i in range(4):
+                    self.assertRaises(api.Error, list, stream('open'))
+                self.assertEqual(self.breaker.state(), 'open')
+        finally:
+            api.Request.__breaker__ = None
@@ -0,0 +1,133 @@
+import unittest
+from musixmatch import *
+from tests.server import serving, reply, response
+import tempfile
+import sqlite3
+import os
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0
+        self.cache = cache.Cache(maxsize=2, ttl=10,
+            ttls={ 'track.chart.get': 1 }, clock=lambda: self.now)
+
+    def test_key(self):
+        r1 = api.Request('track.get', track_id=1, apikey='first')
+        r2 = api.Request('track.get', track_id=1, apikey='second')
+        self.assertEqual(r1.key, r2.key)
+        message = response()
+        self.cache.set(r1, message)
+        self.assertEqual(self.cache.get(r2) is message, True)
+
+    def test_ttl(self):
+        chart = api.Request('track.chart.get', country='it')
+        lyrics = api.Request('track.lyrics.get', track_id=1)
+        self.cache.set(chart, response())
+        self.cache.set(lyrics, response())
+        self.now = 2
+        self.assertEqual(self.cache.get(chart), None)
+        self.assertEqual(self.cache.get(lyrics) is None, False)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_eviction(self):
+        requests = [ api.Request('track.get', track_id=i) for i in range(3) ]
+        self.cache.set(requests[0], response())
+        self.cache.set(requests[1], response())
+        self.cache.get(requests[0])
+        self.cache.set(requests[2], response())
+        # Least recently used is evicted
+        self.assertEqual(self.cache.get(requests[1]), None)
+        self.assertEqual(self.cache.get(requests[0]) is None, False)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_failure(self):
+        request = api.Request('track.get', track_id=1)
+        self.cache.set(request, response(402))
+        self.assertEqual(self.cache.get(request), None)
+
+    def test_response(self):
+        try:
+            with serving() as server:
+                api.Request.__cache__ = self.cache
+                for apikey in ('first', 'second'):
+                    message = api.Method('track.search')(
+                        apikey=apikey, q='test')
+        finally:
+            api.Request.__cache__ = None
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(self.cache.hits, 1)
+
+class TestDiskCache(unittest.TestCase):
+
+    message = reply()
+
+    def setUp(self):
+        self.now = 0
+        self.path = tempfile.mktemp()
+        self.cache = cache.DiskCache(self.path, maxsize=len(self.message) * 2,
+            ttls={ 'track.chart.get': 1 }, clock=lambda: self.now)
+
+    def tearDown(self):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+    def test_get(self):
+        request = api.Request('track.get', track_id=1, apikey='first')
+        self.cache.set(request, self.message)
+        # Another process sharing the same database
+        shared = cache.DiskCache(self.path, clock=lambda: self.now)
+        request = api.Request('track.get', track_id=1, apikey='second')
+        self.assertEqual(shared.get(request), self.message)
+        self.assertEqual(shared.hits, 1)
+
+    def test_locked(self):
+        request = api.Request('track.get', track_id=1)
+        self.cache.set(request, self.message)
+        cached = cache.DiskCache(self.path, timeout=0.1,
+            clock=lambda: self.now)
+        writer = sqlite3.connect(self.path, isolation_level=None)
+        writer.execute('BEGIN IMMEDIATE')
+        try:
+            # Lookups don't wait for writers
+            self.assertEqual(cached.get(request), self.message)
+        finally:
+            writer.execute('ROLLBACK')
+            writer.close()
+
+    def test_ttl(self):
+        request = api.Request('track.chart.get', country='it')
+        self.cache.set(request, self.message)
+        self.now = 2
+        self.assertEqual(self.cache.get(request), None)
+        self.cache.compact()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_eviction(self):
+        requests = [ api.Request('track.get', track_id=i) for i in range(3) ]
+        for request in requests[:2]:
+            self.now += 1
+            self.cache.set(request, self.message)
+        self.now += 1
+        self.cache.get(requests[0])
+        self.cache.set(requests[2], self.message)
+        # Least recently used is evicted
+        self.assertEqual(self.cache.get(requests[1]), None)
+        self.assertEqual(self.cache.get(requests[0]), self.message)
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_response(self):
+        try:
+            with serving() as server:
+                api.Request.__disk_cache__ = self.cache
+                self.cache.maxsize = 1024 * 1024
+                for i in range(2):
+                    message = api.Method('track.search')(
+                        apikey='apikey', q='test')
+                    self.assertEqual(bool(message.status_code), True)
+        finally:
+            api.Request.__disk_cache__ = None
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(self.cache.hits, 1)
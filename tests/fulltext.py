@@ -0,0 +1,77 @@
+import unittest
+import tempfile
+import os
+from musixmatch import *
+
+class TestFullTextIndex(unittest.TestCase):
+
+    lyrics = {
+        1: 'I want to break free, I want to break free',
+        2: 'Free as a bird, free as the wind',
+        3: 'Break on through to the other side',
+        4: u'Caf\xe9 au lait, want some more',
+    }
+
+    def setUp(self):
+        self.path = tempfile.mktemp('.index')
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def index(self, ids, index=None):
+        index = index or fulltext.FullTextIndex(self.path)
+        for i in ids:
+            self.assertEqual(index.add(track.Track({ 'track_id': i,
+                'track_name': 'track_%i' % i }),
+                { 'lyrics_body': self.lyrics[i] }), True)
+        return index
+
+    def ids(self, collection):
+        self.assertEqual(type(collection), track.TracksCollection)
+        return [ t['track_id'] for t in collection ]
+
+    def check(self, index):
+        self.assertEqual(len(index), 4)
+        self.assertEqual(self.ids(index.search('break')), [1, 3])
+        self.assertEqual(self.ids(index.search('free')), [2, 1])
+        self.assertEqual(self.ids(index.search('free want')), [1])
+        self.assertEqual(self.ids(index.search('"break free"')), [1])
+        self.assertEqual(self.ids(index.search('"free break"')), [])
+        self.assertEqual(self.ids(index.search('CAFE')), [4])
+        self.assertEqual(self.ids(index.search('missing')), [])
+        self.assertEqual(self.ids(index.search('')), [])
+        self.assertEqual(self.ids(index.search('want', limit=1)), [1])
+        self.assertEqual(index.frequency(u'free'), 2)
+
+    def test_tokenize(self):
+        self.assertEqual(fulltext.tokenize(u'Caf\xe9 au LAIT!'),
+            [u'cafe', u'au', u'lait'])
+
+    def test_encoding(self):
+        numbers = [0, 1, 127, 128, 300, 2 ** 40]
+        encoded = bytearray()
+        fulltext._encode(numbers, encoded)
+        self.assertEqual(len(encoded), 1 + 1 + 1 + 2 + 2 + 6)
+        self.assertEqual(list(fulltext._decode(encoded)), numbers)
+
+    def test_search(self):
+        index = self.index([1, 2, 3, 4])
+        self.check(index)
+        self.assertEqual(index.add(track.Track({ 'track_id': 5 })), False)
+        self.assertEqual(index.add(track.Track({ 'track_id': 1 }),
+            { 'lyrics_body': 'free' }), False)
+        self.assertEqual(index.frequency(u'free'), 2)
+
+    def test_save(self):
+        index = self.index([1, 2])
+        index.save()
+        index.close()
+        # Incremental adds to a mapped index
+        index = self.index([3, 4], fulltext.FullTextIndex(self.path))
+        self.assertEqual(index.add(track.Track({ 'track_id': 2 }),
+            { 'lyrics_body': 'free' }), False)
+        self.check(index)
+        index.save()
+        index.close()
+        self.check(fulltext.FullTextIndex(self.path))
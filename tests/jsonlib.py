@@ -0,0 +1,53 @@
+import unittest
+import os
+from musixmatch import *
+
+class TestJsonlib(unittest.TestCase):
+
+    message = '{"message": {"header": {"status_code": 200, ' \
+        '"execute_time": 0.0123}, "body": {"track_list": [{"track": ' \
+        '{"track_id": 292, "track_name": "caf\\u00e8", "track_rating": 1e2, ' \
+        '"has_lyrics": true, "album_coverart_100x100": null}}]}}}'
+
+    def setUp(self):
+        self.backend = jsonlib.backend
+
+    def tearDown(self):
+        jsonlib.backend = self.backend
+
+    def test_available(self):
+        available = jsonlib.available()
+        self.assertEqual('json' in available, True)
+        self.assertEqual(available, [ name
+            for name in jsonlib.__preference__ if name in available ])
+
+    def test_identical(self):
+        expected = jsonlib.load('json').loads(self.message)
+        for name in jsonlib.available():
+            parsed = jsonlib.load(name).loads(self.message)
+            self.assertEqual(parsed, expected)
+            track_name = parsed['message']['body']['track_list'][0][
+                'track']['track_name']
+            self.assertEqual(type(track_name), unicode)
+
+    def test_use(self):
+        environ = os.environ.pop('musixmatch_json', None)
+        try:
+            self.assertEqual(jsonlib.use().name, jsonlib.available()[0])
+            os.environ['musixmatch_json'] = 'json'
+            self.assertEqual(jsonlib.use().name, 'json')
+        finally:
+            os.environ.pop('musixmatch_json')
+            if environ is not None:
+                os.environ['musixmatch_json'] = environ
+        self.assertRaises(ImportError, jsonlib.use, 'missing')
+
+    def test_register(self):
+        def factory():
+            raise ImportError('unavailable')
+        jsonlib.register('unavailable', factory, 0)
+        try:
+            self.assertEqual('unavailable' in jsonlib.available(), False)
+        finally:
+            del jsonlib.__factories__['unavailable']
+            jsonlib.__preference__.remove('unavailable')
@@ -0,0 +1,155 @@
+import unittest
+import tempfile
+import json
+import os
+import re
+import urllib
+from musixmatch import *
+from tests.server import serving, reply
+
+class TestMatching(unittest.TestCase):
+
+    rows = [
+        { 'artist': 'Queen', 'title': "Don't stop me now" },
+        { 'artist': 'QUEEN', 'title': "don't stop me now!" },
+        { 'artist': 'Nobody', 'title': 'Nothing' },
+        { 'artist': 'Broken', 'title': 'Server' },
+        { 'artist': 'Muse', 'title': 'Uprising' },
+    ]
+
+    def setUp(self):
+        self.paths = [ tempfile.mktemp(suffix) for suffix in ('.csv',
+            '.jsonl', '.jsonl') ]
+        self.source, self.jsonl, self.output = self.paths
+        with open(self.source, 'wb') as source:
+            source.write('title,artist\n')
+            for row in self.rows:
+                source.write('"%s",%s\n' % (row['title'], row['artist']))
+        with open(self.jsonl, 'wb') as source:
+            for row in self.rows:
+                source.write(json.dumps(row) + '\n')
+
+    def tearDown(self):
+        for path in self.paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def respond(self, path):
+        artist = urllib.unquote_plus(re.search(r'q_artist=([^&]*)',
+            path).group(1))
+        status_code = { 'Nobody': 404, 'Broken': 503 }.get(artist, 200)
+        body = status_code == 200 and { 'track': {
+            'track_id': len(artist), 'artist_name': artist } } or {}
+        return reply(status_code, body)
+
+    def test_normalize(self):
+        self.assertEqual(matching.normalize(' A  b,c '), u'a b c')
+        self.assertEqual(matching.key('Queen', "Don't stop me now"),
+            matching.key('QUEEN', "don't stop me now!"))
+        for title in ('Song (feat. Somebody)', 'Song [ft Somebody]',
+                      'Song ft. Somebody', 'Song featuring Somebody'):
+            self.assertEqual(matching.normalize(title), u'song')
+        # Titles may contain ft on their own
+        self.assertEqual(matching.normalize('Six ft Deep'), u'six ft deep')
+        self.assertNotEqual(matching.key('Artist', 'Six ft Deep'),
+            matching.key('Artist', 'Six Deep'))
+
+    def test_read(self):
+        self.assertEqual(list(matching.read(self.source)), self.rows)
+        self.assertEqual(list(matching.read(self.jsonl)), self.rows)
+        self.assertRaises(ValueError, list,
+            matching.read(self.jsonl, format='xml'))
+        with open(self.source, 'wb') as source:
+            source.write('title,artist\nUprising,Muse,extra,fields\nAlone\n')
+        # Ragged rows are read all the same
+        self.assertEqual(list(matching.read(self.source)), [
+            { 'artist': 'Muse', 'title': 'Uprising' },
+            { 'artist': None, 'title': 'Alone' }])
+
+    def test_run(self):
+        with serving(self.respond) as server:
+            bulk = matching.BulkMatcher(concurrency=2)
+            self.assertEqual(bulk.run(self.source, self.output), 4)
+            first = len(server.requests)
+            # Simulates a crash while writing the last result
+            with open(self.output, 'ab') as output:
+                output.write('{"key": ')
+            resumed = matching.BulkMatcher(concurrency=2)
+            self.assertEqual(resumed.run(self.jsonl, self.output), 1)
+            second = len(server.requests) - first
+        self.assertEqual(first, 4)
+        self.assertEqual((bulk.matched, bulk.missed, bulk.failed,
+            bulk.skipped), (2, 1, 1, 1))
+        # Only the failed row is matched again
+        self.assertEqual(second, 1)
+        self.assertEqual((resumed.matched, resumed.missed, resumed.failed,
+            resumed.skipped), (0, 0, 1, 4))
+        with open(self.output) as output:
+            results = [ json.loads(line) for line in output ]
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[0]['track']['artist_name'], 'Queen')
+        self.assertEqual(results[0]['row'], self.rows[0])
+        self.assertEqual(results[1]['status'], 404)
+        self.assertEqual(results[2]['status'], 503)
+        self.assertEqual('track' in results[2], False)
+        self.assertEqual(matching.done(self.output), set(
+            result['key'] for result in results if result['status'] != 503))
+
+class TestMatchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mktemp('.index')
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_normalize(self):
+        self.assertEqual(matching.key(u'Beyonc\xe9', 'Halo (feat. Somebody)'),
+            matching.key('beyonce', 'HALO'))
+        self.assertEqual(matching.normalize('Artist ft. Other'), u'artist')
+        self.assertEqual(matching.normalize('Left Outside Alone'),
+            u'left outside alone')
+
+    def test_persistence(self):
+        index = matching.MatchIndex(self.path)
+        index.add('Queen', "Don't stop me now", { 'track_id': 1 })
+        index.add('Nobody', 'Nothing')
+        index.close()
+        # Simulates a crash while adding an entry
+        with open(self.path, 'ab') as output:
+            output.write('\x01\x02\x03')
+        index = matching.MatchIndex(self.path)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.get('QUEEN', "Don't Stop Me Now!"),
+            { 'track_id': 1 })
+        self.assertRaises(api.Error, index.get, 'nobody', 'nothing')
+        self.assertEqual(index.get('Muse', 'Uprising'), None)
+        self.assertEqual((index.hits, index.misses), (2, 1))
+        index.add('Muse', 'Uprising', { 'track_id': 2 })
+        index.close()
+        self.assertEqual(len(matching.MatchIndex(self.path)), 3)
+
+    def test_fromMatcher(self):
+        def respond(path):
+            if 'Nobody' in path:
+                return reply(404)
+            return reply(200, { 'track': { 'track_id': 1 } })
+        track.Track.__match_index__ = matching.MatchIndex()
+        try:
+            with serving(respond) as server:
+                for i in range(2):
+                    found = track.Track.fromMatcher(apikey='apikey',
+                        q_artist='Queen', q_track='Bohemian Rhapsody')
+                    self.assertEqual(found, { 'track_id': 1 })
+                    self.assertEqual(type(found), track.Track)
+                    self.assertRaises(api.Error, track.Track.fromMatcher,
+                        apikey='apikey', q_artist='Nobody', q_track='x')
+                track.Track.fromMatcher(apikey='apikey', q_artist='Queen',
+                    q_track='bohemian rhapsody (feat. Somebody)')
+                # Other keywords bypass the index
+                track.Track.fromMatcher(apikey='apikey', q_artist='Queen',
+                    q_track='Bohemian Rhapsody', f_has_lyrics=1)
+        finally:
+            track.Track.__match_index__ = None
+        self.assertEqual(len(server.requests), 3)
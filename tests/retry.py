@@ -0,0 +1,122 @@
+import unittest
+import threading
+import time
+from musixmatch import *
+from tests.server import serving, reply, response
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.slept = []
+        self.policy = retry.RetryPolicy(network=2, server=1, quota=1,
+            backoff=1, random=lambda: 1, sleep=self.slept.append)
+
+    def attempt(self, *outcomes):
+        outcomes = list(outcomes)
+        def attempt():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return response(outcome)
+        return attempt
+
+    def test_classify(self):
+        self.assertEqual(self.policy.classify(error=IOError()), 'network')
+        self.assertEqual(self.policy.classify(
+            error=api.ResponseMessageError()), 'server')
+        self.assertEqual(self.policy.classify(error=KeyError()), None)
+        self.assertEqual(self.policy.classify(response(503)), 'server')
+        self.assertEqual(self.policy.classify(response(402)), 'quota')
+        self.assertEqual(self.policy.classify(response(404)), None)
+
+    def test_run(self):
+        attempt = self.attempt(IOError(), 503, IOError(), 200)
+        result = self.policy.run('track.get', attempt)
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(self.slept, [1, 2, 4])
+        self.assertEqual(self.policy.retried, 3)
+
+    def test_exhausted(self):
+        attempt = self.attempt(402, 402)
+        self.assertEqual(self.policy.run('track.get', attempt).status_code,
+            402)
+        attempt = self.attempt(IOError(), IOError(), IOError('last'))
+        self.assertRaises(IOError, self.policy.run, 'track.get', attempt)
+        attempt = self.attempt(KeyError())
+        self.assertRaises(KeyError, self.policy.run, 'track.get', attempt)
+
+    def test_hedge(self):
+        policy = retry.RetryPolicy(hedge=True, hedge_delay=0.05)
+        release = threading.Event()
+        calls = []
+        def attempt():
+            calls.append(None)
+            if len(calls) == 1:
+                release.wait(5)
+            return response(200)
+        try:
+            self.assertEqual(policy.run('track.get', attempt).status_code,
+                200)
+            self.assertEqual(policy.hedged, 1)
+            self.assertEqual(policy.latency('track.lyrics.feedback.post'),
+                None)
+        finally:
+            release.set()
+
+    def test_hedge_deadline(self):
+        policy = retry.RetryPolicy(hedge=True, hedge_delay=0.05)
+        release = threading.Event()
+        calls = []
+        def attempt():
+            calls.append(None)
+            if len(calls) == 1:
+                release.wait(5)
+                return response(200)
+            raise KeyError()
+        try:
+            start = time.time()
+            # The hedge failed, waiting for the first attempt within deadline
+            self.assertRaises(api.DeadlineExceeded, policy.run, 'track.get',
+                attempt, deadline=api.Deadline(0.2))
+            self.assertEqual(time.time() - start < 1, True)
+        finally:
+            release.set()
+
+    def test_latency(self):
+        policy = retry.RetryPolicy(hedge=True, percentile=50)
+        self.assertEqual(policy.latency('track.get'), None)
+        for i in range(10):
+            policy.run('track.get', lambda: response(200))
+        self.assertEqual(policy.latency('track.get') is None, False)
+        policy = retry.RetryPolicy(hedge=True, percentile=5)
+        for i in range(9):
+            policy.run('track.get', lambda: response(200))
+        policy.run('track.get', lambda: time.sleep(0.05) or response(200))
+        # The fastest, rather than the slowest, of too few latencies
+        self.assertEqual(policy.latency('track.get') < 0.05, True)
+
+    def test_request(self):
+        statuses = [503, 200]
+        def respond(path):
+            return reply(statuses.pop(0))
+        try:
+            with serving(respond) as server:
+                api.Request.__retry__ = self.policy
+                result = api.Method('track.get')(apikey='apikey', track_id=1)
+        finally:
+            api.Request.__retry__ = None
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(len(server.requests), 2)
+
+    def test_unreachable(self):
+        location = ws.location
+        try:
+            ws.location = 'http://127.0.0.1:1/ws/1.1'
+            api.Request.__retry__ = self.policy
+            # Network errors are raised, rather than a NameError
+            self.assertRaises(IOError, api.Method('track.get'),
+                apikey='apikey', track_id=1)
+        finally:
+            ws.location = location
+            api.Request.__retry__ = None
+        self.assertEqual(self.policy.retried, 2)
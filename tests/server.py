@@ -0,0 +1,104 @@
+"""
+A local stub of the musiXmatch web service, serving canned response messages
+over keep-alive HTTP/1.1 connections.
+"""
+from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from SocketServer import ThreadingMixIn
+from contextlib import contextmanager
+from musixmatch import api, ws
+import threading
+import json
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from StringIO import StringIO
+
+message = { 'message': {
+    'header': { 'status_code': 200, 'execute_time': 0.001 },
+    'body': {
+        'track_list': [
+            { 'track': { 'track_id': 292, 'track_name': 'track_292' } },
+            { 'track': { 'track_id': 8976, 'track_name': 'track_8976' } },
+            { 'track': { 'track_id': 9673, 'track_name': 'track_9673' } },
+        ]
+    }
+}}
+
+def reply(status_code=200, body=None):
+    """
+    Returns the Json encoded response message of **status_code**, with
+    **body**, for a :py:class:`Server` to answer with.
+    """
+    return json.dumps({ 'message': {
+        'header': { 'status_code': status_code },
+        'body': {} if body is None else body } })
+
+def response(status_code=200, body=None):
+    """
+    Returns the :py:class:`musixmatch.api.JsonResponseMessage` of
+    :py:func:`reply`.
+    """
+    return api.JsonResponseMessage(StringIO(reply(status_code, body)))
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(self.path)
+        body = self.server.respond(self.path)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, respond=None):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), Handler)
+        self.respond = respond or (lambda path: json.dumps(message))
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []
+        self.thread = threading.Thread(target=self.serve_forever, args=(0.01,))
+        self.thread.daemon = True
+
+    def handle_error(self, request, client_address):
+        pass
+
+    @property
+    def location(self):
+        return 'http://%s:%i/ws/1.1' % self.server_address
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+@contextmanager
+def serving(respond=None):
+    """
+    Runs a :py:class:`Server` answering with **respond**, pointing the web
+    service location to it meanwhile.
+    """
+    location = ws.location
+    with Server(respond) as server:
+        ws.location = server.location
+        try:
+            yield server
+        finally:
+            ws.location = location
@@ -0,0 +1,78 @@
+import unittest
+import tempfile
+import os
+from musixmatch import *
+from tests.server import serving
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def limiter(self, **keywords):
+        return throttle.RateLimiter(clock=lambda: self.now, sleep=self.sleep,
+            **keywords)
+
+    def test_per_second(self):
+        limiter = self.limiter(per_second=2)
+        for i in range(6):
+            limiter.acquire()
+        # A burst of 2, then 2 calls per second
+        self.assertAlmostEqual(self.now, 2.0)
+
+    def test_per_hour(self):
+        limiter = self.limiter(per_hour=3600)
+        for i in range(3602):
+            limiter.acquire()
+        self.assertAlmostEqual(self.now, 2.0)
+
+    def test_fractional(self):
+        limiter = self.limiter(per_second=0.5)
+        for i in range(3):
+            limiter.acquire()
+        # A single call, then one every two seconds
+        self.assertAlmostEqual(self.now, 4.0)
+        limiter = self.limiter(per_hour=0.5)
+        self.assertEqual(limiter.acquire(), 0)
+
+    def test_deadline(self):
+        limiter = self.limiter(per_second=1)
+        limiter.acquire()
+        deadline = api.Deadline(0.5, clock=lambda: self.now)
+        self.assertRaises(api.DeadlineExceeded, limiter.acquire, deadline)
+        self.assertEqual(limiter.acquire(api.Deadline(2, clock=lambda: self.now)), 1)
+
+    def test_feedback(self):
+        limiter = self.limiter(per_second=10, backoff=30)
+        limiter.feedback(402)
+        self.assertAlmostEqual(limiter.acquire(), 30.0)
+        limiter.feedback(402)
+        self.assertAlmostEqual(limiter.acquire(), 60.0)
+        limiter.feedback(200)
+        limiter.feedback(402)
+        self.assertAlmostEqual(limiter.acquire(), 30.0)
+
+    def test_path(self):
+        path = tempfile.mktemp()
+        try:
+            first = self.limiter(per_second=1, path=path)
+            second = self.limiter(per_second=1, path=path)
+            first.acquire()
+            # The second process shares the same budget
+            self.assertAlmostEqual(second.acquire(), 1.0)
+        finally:
+            os.remove(path)
+
+    def test_request(self):
+        limiter = self.limiter(per_second=1)
+        try:
+            with serving() as server:
+                api.Request.__throttle__ = limiter
+                for i in range(3):
+                    api.Method('track.get')(apikey='apikey', track_id=i)
+        finally:
+            api.Request.__throttle__ = None
+        self.assertAlmostEqual(self.now, 2.0)
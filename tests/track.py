@@ -1,5 +1,14 @@
 from musixmatch import *
 from tests import base
+from tests.server import serving, reply
+from musixmatch.base import Schema
+from concurrent import futures
+import json
+import re
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from StringIO import StringIO
 
 class TestTrack(base.TestItem):
     Class = track.Track
@@ -46,3 +55,165 @@ class TestTracksCollection(base.TestCollection):
         }
     }
 
+
+    def test_hydrate(self):
+        def respond(path):
+            if 'track_id=8976' in path and 'subtitle' in path:
+                return reply(404)
+            label = 'subtitle' in path and 'subtitle' or 'lyrics'
+            return reply(200, { label: { '%s_id' % label: 1 } })
+        collection = self.CollectionClass.fromResponseMessage(
+            api.JsonResponseMessage(StringIO(json.dumps(
+                { 'message': self.message }))))
+        with serving(respond) as server:
+            failures = collection.hydrate(concurrency=2)
+        self.assertEqual(len(server.requests), 6)
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0][:2], (collection[1], 'subtitle'))
+        self.assertEqual(isinstance(failures[0][2], api.Error), True)
+        for t in collection:
+            self.assertEqual(type(dict.get(t, 'lyrics')), lyrics.Lyrics)
+        self.assertEqual('subtitle' in collection[1], False)
+        self.assertEqual(type(dict.get(collection[2], 'subtitle')),
+            subtitle.Subtitle)
+        self.assertRaises(KeyError, collection.hydrate, ('album',))
+
+    def test_hydrate_on_executor(self):
+        def respond(path):
+            return reply(200, { 'lyrics': { 'lyrics_id': 1 } })
+        collection = self.CollectionClass.fromResponseMessage(
+            api.JsonResponseMessage(StringIO(json.dumps(
+                { 'message': self.message }))))
+        executor = api.Request.__executor__
+        api.Request.__executor__ = futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            with serving(respond) as server:
+                future = api.Request.__executor__.submit(collection.hydrate,
+                    ('lyrics',))
+                self.assertEqual(future.result(timeout=10), [])
+            self.assertEqual(len(server.requests), 3)
+        finally:
+            api.Request.__executor__.shutdown()
+            api.Request.__executor__ = executor
+
+    def test_record(self):
+        first = track.TrackRecord(track_id=1, artist_name=u''.join(u'artist'))
+        second = track.TrackRecord(track_id=2, artist_name=u''.join(u'artist'))
+        # Repeated values are shared
+        self.assertEqual(first['artist_name'] is second['artist_name'], True)
+        self.assertEqual(first['artist_name'], u'artist')
+        self.assertEqual('track_name' in first, False)
+        # High cardinality values are not interned
+        self.assertEqual('track_share_url' in
+            track.TrackRecord.__schema__.interned, False)
+
+    def test_schema_maxsize(self):
+        schema = Schema(('artist_name',), maxsize=2)
+        for name in (u'first', u'second', u'third'):
+            schema.encode({ 'artist_name': name })
+        self.assertEqual(schema.strings(), 2)
+        third = u''.join(u'third')
+        self.assertEqual(schema.encode({ 'artist_name': third })[0] is third,
+            True)
+
+    def test_iterSearch(self):
+        def respond(path):
+            page = int(re.search(r'[?&]page=(\d+)', path).group(1))
+            size = int(re.search(r'page_size=(\d+)', path).group(1))
+            tracks = [ { 'track': { 'track_id': i } }
+                for i in range(7)[(page - 1) * size:page * size] ]
+            return reply(200, { 'track_list': tracks })
+        with serving(respond) as server:
+            tracks = list(self.CollectionClass.iterSearch(apikey='apikey',
+                q='test', page_size=3, prefetch=0))
+        sequential = len(server.requests)
+        with serving(respond) as server:
+            prefetched = list(self.CollectionClass.iterSearch(
+                apikey='apikey', q='test', page_size=3, prefetch=2))
+        with serving(respond) as server:
+            limited = list(self.CollectionClass.iterChart(apikey='apikey',
+                page_size=3, limit=4))
+        # Cancelled prefetches may still be running, and reach any server
+        limited_requests = [ r for r in server.requests
+            if 'track.chart.get' in r ]
+        self.assertEqual([ t['track_id'] for t in tracks ], range(7))
+        self.assertEqual(type(tracks[0]), track.Track)
+        # Stops after the short page
+        self.assertEqual(sequential, 3)
+        self.assertEqual(prefetched, tracks)
+        self.assertEqual([ t['track_id'] for t in limited ], range(4))
+        self.assertEqual(len(limited_requests), 2)
+
+    def test_iterSearch_on_executor(self):
+        def respond(path):
+            page = int(re.search(r'[?&]page=(\d+)', path).group(1))
+            tracks = [ { 'track': { 'track_id': i } }
+                for i in range(5)[(page - 1) * 2:page * 2] ]
+            return reply(200, { 'track_list': tracks })
+        executor = api.Request.__executor__
+        api.Request.__executor__ = futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            with serving(respond) as server:
+                future = api.Request.__executor__.submit(list,
+                    self.CollectionClass.iterSearch(apikey='apikey', q='test',
+                        page_size=2, prefetch=2))
+                tracks = future.result(timeout=10)
+        finally:
+            api.Request.__executor__.shutdown()
+            api.Request.__executor__ = executor
+        self.assertEqual([ t['track_id'] for t in tracks ], range(5))
+        with serving(respond) as server:
+            # Nothing to fetch
+            self.assertEqual(list(self.CollectionClass.iterChart(
+                apikey='apikey', limit=0)), [])
+        self.assertEqual([ r for r in server.requests
+            if 'track.chart.get' in r ], [])
+
+    def test_fromCharts(self):
+        charts = { 'us': [[1, 2, 3], [4, 5]], 'it': [[3, 6], None] }
+        def respond(path):
+            country = re.search(r'country=(\w+)', path).group(1)
+            page = int(re.search(r'[?&]page=(\d+)', path).group(1))
+            tracks = charts[country][page - 1]
+            if tracks is None:
+                return reply(404)
+            return reply(200, { 'track_list': [ { 'track': { 'track_id': i } }
+                for i in tracks ] })
+        with serving(respond) as server:
+            snapshot, failures = self.CollectionClass.fromCharts(
+                ['us', 'it'], pages=2, concurrency=4, apikey='apikey')
+        self.assertEqual(len(server.requests), 4)
+        self.assertEqual(sorted(snapshot), ['it', 'us'])
+        self.assertEqual(type(snapshot['us']), self.CollectionClass)
+        self.assertEqual([ t['track_id'] for t in snapshot['us'] ],
+            [1, 2, 3, 4, 5])
+        self.assertEqual([ t['track_id'] for t in snapshot['it'] ], [3, 6])
+        # Shared across countries
+        self.assertEqual(snapshot['us'][2] is snapshot['it'][0], True)
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0][:2], ('it', 2))
+        self.assertEqual(isinstance(failures[0][2], api.Error), True)
+
+    def test_stream(self):
+        with serving() as server:
+            tracks = self.CollectionClass.stream('track.search',
+                apikey='apikey', q='test')
+            first = tracks.next()
+            self.assertEqual(type(first), track.Track)
+            self.assertEqual(first['track_id'], 292)
+            self.assertEqual(len(list(tracks)), 2)
+
+    def test_stream_xml(self):
+        def respond(path):
+            tracks = ''.join([ '<track><track_id>%s</track_id></track>' % i
+                for i in re.findall(r'\d+', path.split('q=')[1]) ])
+            return '<message><header><status_code>200</status_code></header>' \
+                '<body><track_list>%s</track_list></body></message>' % tracks
+        with serving(respond) as server:
+            tracks = list(self.CollectionClass.stream('track.search',
+                apikey='apikey', format='xml', q='1 2'))
+            message = api.Method('track.search')(apikey='apikey',
+                format='xml', q='3 4')
+        self.assertEqual(tracks, [{ 'track_id': '1' }, { 'track_id': '2' }])
+        collection = self.CollectionClass.fromResponseMessage(message)
+        self.assertEqual([ t['track_id'] for t in collection ], ['3', '4'])